@@ -11,6 +11,7 @@ Two-step pipeline:
 
 Core modules:
 - clawdbot_parser: JSONL -> delimited markdown
+- search_index: SQLite FTS5 index over sessions and canonical files
 - models: Data classes for all types
 - parsing: CONFIG block extraction and parsing
 - canonicalize: Raw -> canonical transformation
@@ -23,7 +24,7 @@ __version__ = "2.0.0"
 
 # === V2 Pipeline (recommended) ===
 from .canonicalize import canonicalize, canonicalize_from_content, load_corrections
-from .variants import generate_variants, generate_variants_from_content, VariantOptions, VariantResult
+from .variants import generate_variants, generate_variants_from_content, VariantOptions, VariantResult, DocumentCache, AnchorFailure, TermMatcher
 
 # V2 Data structures
 from .models import (
@@ -50,11 +51,19 @@ from .parsing import (
 # Clawdbot parser
 from .clawdbot_parser import (
     parse_clawdbot_session,
+    iter_clawdbot_messages,
     convert_session_file,
+    stream_session_file,
+    follow_session_file,
     format_as_delimited_markdown,
+    write_delimited_markdown,
     ClawdbotMessage,
+    SessionInfo,
 )
 
+# Full-text search index
+from .search_index import SearchIndex, SearchHit, fts_query
+
 # === V1 Pipeline (legacy compatibility) ===
 from .models import (
     AnchorSpec,
@@ -66,6 +75,8 @@ from .models import (
 )
 from .parsing import parse_config_block
 from .content import (
+    AnchorIndex,
+    SpanEdits,
     remove_by_anchors,
     apply_replacement,
     extract_summary_section,
@@ -82,9 +93,18 @@ __all__ = [
     "load_corrections",
     # Clawdbot parser
     "parse_clawdbot_session",
+    "iter_clawdbot_messages",
     "convert_session_file",
+    "stream_session_file",
+    "follow_session_file",
     "format_as_delimited_markdown",
+    "write_delimited_markdown",
     "ClawdbotMessage",
+    "SessionInfo",
+    # Full-text search index
+    "SearchIndex",
+    "SearchHit",
+    "fts_query",
     # V2 Data structures
     "CanonicalConfig",
     "SectionSpec",
@@ -96,6 +116,11 @@ __all__ = [
     "SensitivitySection",
     "VariantOptions",
     "VariantResult",
+    "DocumentCache",
+    "AnchorFailure",
+    "TermMatcher",
+    "AnchorIndex",
+    "SpanEdits",
     # Parsing utilities
     "extract_config_block",
     "extract_all_config_blocks",
@@ -39,13 +39,15 @@ from .parsing import (
     CONFIG_START_MARKER, CONFIG_END_MARKER
 )
 from .content import extract_full_transcript, strip_frontmatter
+from .corrections import get_correction_engine, load_correction_pairs
 
 
 def load_corrections(corrections_path: Path) -> List[TranscriptionFix]:
     """
     Load transcription corrections from a YAML file.
 
-    Expected format:
+    Accepts the flat "wrong: correct" map used by
+    components/distill/config/corrections.yaml, or the list format:
     corrections:
       - original: "misheard text"
         corrected: "correct text"
@@ -58,33 +60,10 @@ def load_corrections(corrections_path: Path) -> List[TranscriptionFix]:
     Returns:
         List of TranscriptionFix objects
     """
-    if not corrections_path.exists():
-        return []
-
-    if not YAML_AVAILABLE:
-        logging.warning("PyYAML not available, cannot load corrections file")
-        return []
-
-    try:
-        with open(corrections_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
-    except Exception as e:
-        logging.warning(f"Failed to load corrections file: {e}")
-        return []
-
-    corrections = []
-    for item in data.get('corrections', []):
-        if isinstance(item, dict):
-            # Support both 'original'/'corrected' and 'pattern'/'replacement'
-            original = item.get('original') or item.get('pattern', '')
-            corrected = item.get('corrected') or item.get('replacement', '')
-            if original and corrected:
-                corrections.append(TranscriptionFix(
-                    original=original,
-                    corrected=corrected
-                ))
-
-    return corrections
+    return [
+        TranscriptionFix(original=original, corrected=corrected)
+        for original, corrected in load_correction_pairs(corrections_path)
+    ]
 
 
 def apply_corrections(
@@ -95,6 +74,9 @@ def apply_corrections(
     """
     Apply transcription corrections to content.
 
+    All corrections are applied in a single pass by the shared
+    CorrectionEngine (see corrections.py for matching rules).
+
     Args:
         content: The content to process
         corrections: List of corrections to apply
@@ -106,18 +88,17 @@ def apply_corrections(
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    result = content
-    applied = []
+    engine = get_correction_engine(
+        tuple((fix.original, fix.corrected) for fix in corrections)
+    )
+    result, hits = engine.apply(content)
 
+    applied = []
     for fix in corrections:
-        # Case-insensitive search
-        pattern = re.compile(re.escape(fix.original), re.IGNORECASE)
-        matches = pattern.findall(result)
-
-        if matches:
-            result = pattern.sub(fix.corrected, result)
+        count = hits.pop(engine.index_of(fix.original), 0)
+        if count:
             applied.append(fix)
-            logger.debug(f"Applied correction: '{fix.original}' -> '{fix.corrected}' ({len(matches)} occurrences)")
+            logger.debug(f"Applied correction: '{fix.original}' -> '{fix.corrected}' ({count} occurrences)")
 
     return result, applied
 
@@ -30,14 +30,37 @@ user message content
 
 === MESSAGE 2 | ASSISTANT ===
 assistant response
+
+Conversion streams: iter_clawdbot_messages() yields one message per JSONL
+line and write_delimited_markdown() writes each as it arrives, so memory
+stays bounded by the largest single message rather than the session.
+
+follow_session_file() converts incrementally: it records the byte offset and
+message index reached in a sidecar state file and, on later runs, parses
+only the complete lines appended since then, appending to the same output.
+
+Lines are only decoded when needed: the top-level "type" is read from the
+start of each line first, so large "custom" event lines are skipped without
+JSON decoding. orjson is used for decoding when installed.
 """
 
+import io
+import os
+import re
 import json
+import hashlib
+import itertools
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import BinaryIO, Iterable, Iterator, List, Optional, TextIO, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 @dataclass
 class ClawdbotMessage:
@@ -49,6 +72,13 @@ class ClawdbotMessage:
     message_id: Optional[str] = None
 
 
+@dataclass
+class SessionInfo:
+    """Session metadata, filled in as the session line is read."""
+    session_id: Optional[str] = None
+    session_start: Optional[datetime] = None
+
+
 # System messages to filter out (prefixes)
 SYSTEM_MESSAGE_PREFIXES = [
     "A new session was started",
@@ -107,39 +137,129 @@ def extract_text_content(content_blocks: list) -> str:
     return "\n".join(texts)
 
 
-def parse_jsonl_line(line: str) -> Optional[dict]:
-    """Parse a single JSONL line, returning None if invalid."""
+# Line types the converter reads; other lines are skipped undecoded
+SESSION_LINE_TYPES = frozenset({"session", "message"})
+
+# '{"type": "<value>"' at the start of a line, as Clawdbot writes it
+_LINE_TYPE_PREFIX = re.compile(r'\s*\{\s*"type"\s*:\s*"([A-Za-z0-9_.:-]*)"')
+
+
+def peek_line_type(line: str) -> Optional[str]:
+    """
+    Return a JSONL line's top-level "type" without decoding the line.
+
+    Only the start of the line is examined. Returns None when the line
+    doesn't open with a "type" key; decode it to find out.
+    """
+    match = _LINE_TYPE_PREFIX.match(line)
+    return match.group(1) if match else None
+
+
+def loads_json(text: str):
+    """Decode JSON with orjson when installed, else the stdlib."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass  # NaN, 64-bit overflow, lone surrogates: let the stdlib decide
+    return json.loads(text)
+
+
+def parse_jsonl_line(line: str, types: Optional[Iterable[str]] = None) -> Optional[dict]:
+    """
+    Parse a single JSONL line, returning None if invalid.
+
+    Args:
+        line: One line of a JSONL file
+        types: If given, lines whose type is visibly something else return
+            None without being decoded
+    """
+    if types is not None:
+        line_type = peek_line_type(line)
+        if line_type is not None and line_type not in types:
+            return None
     line = line.strip()
     if not line:
         return None
     try:
-        return json.loads(line)
-    except json.JSONDecodeError:
+        return loads_json(line)
+    except ValueError:
         return None
 
 
-def parse_clawdbot_session(
+def _parse_timestamp(ts: Optional[str]) -> Optional[datetime]:
+    if not ts:
+        return None
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _read_session_line(obj: dict, session: Optional[SessionInfo]):
+    if session is not None:
+        session.session_id = obj.get("id")
+        session.session_start = _parse_timestamp(obj.get("timestamp")) or session.session_start
+
+
+def _message_from_object(
+    obj: dict,
+    index: int,
+    include_timestamps: bool
+) -> Optional[ClawdbotMessage]:
+    """Build the message for one "message" line, or None if it is filtered out."""
+    msg_data = obj.get("message", {})
+
+    # Skip delivery-mirror duplicates (clawdbot internal)
+    if msg_data.get("model") == "delivery-mirror":
+        return None
+
+    role = msg_data.get("role", "").lower()
+    if role not in ("user", "assistant"):
+        return None
+
+    content_blocks = msg_data.get("content", [])
+    if not content_blocks:
+        return None
+
+    content = extract_text_content(content_blocks)
+    if not content:
+        return None
+
+    # Skip system messages
+    if is_system_message(content):
+        return None
+
+    return ClawdbotMessage(
+        index=index,
+        role=role,
+        content=content,
+        timestamp=_parse_timestamp(obj.get("timestamp")) if include_timestamps else None,
+        message_id=obj.get("id")
+    )
+
+
+def iter_clawdbot_messages(
     jsonl_path: Path,
-    include_timestamps: bool = False
-) -> Tuple[List[ClawdbotMessage], Optional[str], Optional[datetime]]:
+    include_timestamps: bool = False,
+    session: Optional[SessionInfo] = None
+) -> Iterator[ClawdbotMessage]:
     """
-    Parse a Clawdbot JSONL session file.
+    Yield messages from a Clawdbot JSONL session file, one line at a time.
 
     Args:
         jsonl_path: Path to the .jsonl session file
-        include_timestamps: Whether to include timestamps in output
+        include_timestamps: Parse each message's timestamp (skipped otherwise)
+        session: Optional SessionInfo to fill in from the session line
 
-    Returns:
-        Tuple of (messages, session_id, session_start_time)
+    Yields:
+        ClawdbotMessage objects in file order, numbered from 1
     """
-    messages: List[ClawdbotMessage] = []
-    session_id: Optional[str] = None
-    session_start: Optional[datetime] = None
     message_index = 0
 
     with open(jsonl_path, 'r', encoding='utf-8') as f:
         for line in f:
-            obj = parse_jsonl_line(line)
+            obj = parse_jsonl_line(line, SESSION_LINE_TYPES)
             if obj is None:
                 continue
 
@@ -147,64 +267,70 @@ def parse_clawdbot_session(
 
             # Extract session metadata
             if obj_type == "session":
-                session_id = obj.get("id")
-                ts = obj.get("timestamp")
-                if ts:
-                    try:
-                        session_start = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                    except ValueError:
-                        pass
+                _read_session_line(obj, session)
                 continue
 
             # Skip non-message types
             if obj_type != "message":
                 continue
 
-            msg_data = obj.get("message", {})
+            msg = _message_from_object(obj, message_index + 1, include_timestamps)
+            if msg is not None:
+                message_index += 1
+                yield msg
 
-            # Skip delivery-mirror duplicates (clawdbot internal)
-            if msg_data.get("model") == "delivery-mirror":
-                continue
 
-            role = msg_data.get("role", "").lower()
-            if role not in ("user", "assistant"):
-                continue
+def parse_clawdbot_session(
+    jsonl_path: Path,
+    include_timestamps: bool = True
+) -> Tuple[List[ClawdbotMessage], Optional[str], Optional[datetime]]:
+    """
+    Parse a Clawdbot JSONL session file into a list.
 
-            content_blocks = msg_data.get("content", [])
-            if not content_blocks:
-                continue
+    Holds the whole session in memory; use iter_clawdbot_messages() or
+    stream_session_file() for large sessions.
 
-            content = extract_text_content(content_blocks)
-            if not content:
-                continue
+    Args:
+        jsonl_path: Path to the .jsonl session file
+        include_timestamps: Parse per-message timestamps
 
-            # Skip system messages
-            if is_system_message(content):
-                continue
+    Returns:
+        Tuple of (messages, session_id, session_start_time)
+    """
+    session = SessionInfo()
+    messages = list(iter_clawdbot_messages(jsonl_path, include_timestamps, session))
+    return messages, session.session_id, session.session_start
 
-            # Parse timestamp
-            timestamp = None
-            ts = obj.get("timestamp")
-            if ts:
-                try:
-                    timestamp = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                except ValueError:
-                    pass
 
-            message_index += 1
-            messages.append(ClawdbotMessage(
-                index=message_index,
-                role=role,
-                content=content,
-                timestamp=timestamp,
-                message_id=obj.get("id")
-            ))
+def write_delimited_markdown(
+    messages: Iterable[ClawdbotMessage],
+    out: TextIO,
+    continuing: bool = False
+) -> int:
+    """
+    Write messages to out in delimited markdown format as they arrive.
 
-    return messages, session_id, session_start
+    Args:
+        messages: Messages to write
+        out: Text stream to write to
+        continuing: out already holds earlier messages (separate the first one)
+
+    Returns:
+        Number of messages written
+    """
+    count = 0
+    for msg in messages:
+        if count or continuing:
+            out.write("\n")  # Blank line between messages
+        out.write(f"=== MESSAGE {msg.index} | {msg.role.upper()} ===\n")
+        out.write(msg.content)
+        out.write("\n")
+        count += 1
+    return count
 
 
 def format_as_delimited_markdown(
-    messages: List[ClawdbotMessage],
+    messages: Iterable[ClawdbotMessage],
     include_timestamps: bool = False
 ) -> str:
     """
@@ -217,17 +343,221 @@ def format_as_delimited_markdown(
     === MESSAGE 2 | ASSISTANT ===
     response content
     """
-    lines = []
+    out = io.StringIO()
+    write_delimited_markdown(messages, out)
+    return out.getvalue()
 
-    for msg in messages:
-        role_upper = msg.role.upper()
-        delimiter = f"=== MESSAGE {msg.index} | {role_upper} ==="
 
-        lines.append(delimiter)
-        lines.append(msg.content)
-        lines.append("")  # Blank line between messages
+def stream_session_file(
+    input_path: Path,
+    output_path: Path
+) -> Tuple[int, Optional[str], Optional[datetime]]:
+    """
+    Convert a Clawdbot JSONL session to a delimited markdown file, streaming.
+
+    Output goes to a temporary file next to output_path and is renamed into
+    place when complete. Nothing is written if the session has no messages.
+
+    Returns:
+        Tuple of (message_count, session_id, session_start_time)
+    """
+    session = SessionInfo()
+    messages = iter_clawdbot_messages(input_path, session=session)
+
+    first = next(messages, None)
+    if first is None:
+        return 0, session.session_id, session.session_start
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            count = write_delimited_markdown(itertools.chain([first], messages), f)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return count, session.session_id, session.session_start
+
+
+# Bump when the follow state file layout changes
+FOLLOW_STATE_VERSION = 1
+
+# Leading input bytes hashed to detect a replaced (not appended) session file
+_FOLLOW_HEAD_BYTES = 4096
+
+
+def follow_state_path(output_path: Path) -> Path:
+    """Return the sidecar state file used by follow_session_file() for output_path."""
+    return output_path.with_name(f".{output_path.name}.follow.json")
+
+
+def hash_session_head(input_path: Path, length: int) -> str:
+    """Hash the first length bytes, to tell an appended-to file from a replaced one."""
+    with open(input_path, 'rb') as f:
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+
+@dataclass
+class SessionCursor:
+    """How far a session file has been read: bytes consumed and messages yielded."""
+    offset: int = 0
+    message_index: int = 0
+
+
+def iter_appended_messages(
+    f: BinaryIO,
+    cursor: SessionCursor,
+    session: Optional[SessionInfo] = None,
+    include_timestamps: bool = False
+) -> Iterator[ClawdbotMessage]:
+    """
+    Yield messages from the complete lines after cursor.offset, advancing cursor.
+
+    A trailing line without a newline is still being written; it is left
+    unread for the next call.
+
+    Args:
+        f: Session file opened in binary mode
+        cursor: Position to resume from; updated as lines are consumed
+        session: Optional SessionInfo to fill in from the session line
+        include_timestamps: Parse each message's timestamp
+    """
+    f.seek(cursor.offset)
+    for raw in f:
+        if not raw.endswith(b"\n"):
+            break  # Partial line, still being written
+        cursor.offset += len(raw)
+
+        obj = parse_jsonl_line(raw.decode('utf-8', errors='replace'), SESSION_LINE_TYPES)
+        if obj is None:
+            continue
+
+        obj_type = obj.get("type")
+        if obj_type == "session":
+            _read_session_line(obj, session)
+            continue
+        if obj_type != "message":
+            continue
+
+        msg = _message_from_object(obj, cursor.message_index + 1, include_timestamps)
+        if msg is not None:
+            cursor.message_index += 1
+            yield msg
+
+
+def _load_follow_state(
+    state_path: Path,
+    input_path: Path,
+    output_path: Path
+) -> Optional[dict]:
+    """Load follow state, or None if it is missing or no longer matches the files."""
+    try:
+        state = json.loads(state_path.read_text(encoding='utf-8'))
+        if state.get("version") != FOLLOW_STATE_VERSION:
+            return None
+        offset = int(state["input_offset"])
+        output_size = int(state["output_size"])
+        int(state["message_index"])
+
+        # Input shrank or was replaced: start over
+        if input_path.stat().st_size < offset:
+            return None
+        if hash_session_head(input_path, int(state["head_length"])) != state["head_sha256"]:
+            return None
+
+        # Output lost data we already counted: start over
+        actual_size = output_path.stat().st_size if output_path.exists() else 0
+        if actual_size < output_size:
+            return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return state
+
+
+def _write_follow_state(state_path: Path, state: dict):
+    tmp_path = state_path.with_name(state_path.name + '.tmp')
+    tmp_path.write_text(json.dumps(state, indent=1) + '\n', encoding='utf-8')
+    os.replace(tmp_path, state_path)
 
-    return "\n".join(lines)
+
+def follow_session_file(
+    input_path: Path,
+    output_path: Path,
+    state_path: Optional[Path] = None
+) -> Tuple[int, Optional[str], Optional[datetime]]:
+    """
+    Convert a Clawdbot JSONL session incrementally, appending to output_path.
+
+    The first run converts the whole file. Each later run seeks to the byte
+    offset recorded in the state file and parses only the lines appended
+    since, numbering messages on from the recorded index, so following an
+    active session costs O(new bytes). A trailing line without a newline is
+    still being written and is left for the next run.
+
+    The conversion starts over when the input shrank or its first bytes
+    changed (a different session at the same path), or when the output is
+    shorter than recorded. Output beyond the recorded size (an interrupted
+    append) is truncated before appending again.
+
+    Args:
+        input_path: Path to the .jsonl session file
+        output_path: Delimited markdown file to create or extend
+        state_path: Sidecar state file (default: follow_state_path(output_path))
+
+    Returns:
+        Tuple of (new_message_count, session_id, session_start_time)
+    """
+    state_path = state_path or follow_state_path(output_path)
+    state = _load_follow_state(state_path, input_path, output_path)
+
+    if state is None:
+        # Drop stale state first so an interrupted rewrite is never resumed
+        state_path.unlink(missing_ok=True)
+        state = {
+            "input_offset": 0,
+            "message_index": 0,
+            "output_size": 0,
+            "session_id": None,
+            "session_start": None,
+        }
+        if output_path.exists():
+            output_path.unlink()
+
+    session = SessionInfo(
+        session_id=state["session_id"],
+        session_start=_parse_timestamp(state["session_start"]),
+    )
+    cursor = SessionCursor(state["input_offset"], state["message_index"])
+
+    new_count = 0
+    output_size = state["output_size"]
+    with open(input_path, 'rb') as f:
+        messages = iter_appended_messages(f, cursor, session)
+        first = next(messages, None)
+        if first is not None:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(output_path, 'a', encoding='utf-8') as out:
+                out.truncate(output_size)
+                new_count = write_delimited_markdown(
+                    itertools.chain([first], messages), out, continuing=output_size > 0
+                )
+            output_size = output_path.stat().st_size
+
+    head_length = min(cursor.offset, _FOLLOW_HEAD_BYTES)
+    _write_follow_state(state_path, {
+        "version": FOLLOW_STATE_VERSION,
+        "input_offset": cursor.offset,
+        "message_index": cursor.message_index,
+        "output_size": output_size,
+        "head_length": head_length,
+        "head_sha256": hash_session_head(input_path, head_length),
+        "session_id": session.session_id,
+        "session_start": session.session_start.isoformat() if session.session_start else None,
+    })
+
+    return new_count, session.session_id, session.session_start
 
 
 def convert_session_file(
@@ -238,6 +568,9 @@ def convert_session_file(
     """
     Convert a Clawdbot JSONL session to delimited markdown.
 
+    Returns the markdown as a string; use stream_session_file() to write
+    large sessions without holding them in memory.
+
     Args:
         input_path: Path to input .jsonl file
         output_path: Optional path to write output (if None, just returns content)
@@ -246,22 +579,17 @@ def convert_session_file(
     Returns:
         Tuple of (markdown_content, session_id, session_start_time)
     """
-    messages, session_id, session_start = parse_clawdbot_session(
-        input_path,
-        include_timestamps
+    session = SessionInfo()
+    content = format_as_delimited_markdown(
+        iter_clawdbot_messages(input_path, include_timestamps, session)
     )
 
-    if not messages:
-        return "", session_id, session_start
-
-    content = format_as_delimited_markdown(messages, include_timestamps)
-
-    if output_path:
+    if content and output_path:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(content)
 
-    return content, session_id, session_start
+    return content, session.session_id, session.session_start
 
 
 def generate_output_filename(
@@ -294,11 +622,11 @@ if __name__ == "__main__":
     input_file = Path(sys.argv[1])
     output_file = Path(sys.argv[2]) if len(sys.argv) > 2 else None
 
-    content, session_id, session_start = convert_session_file(input_file, output_file)
-
     if output_file:
+        _, session_id, session_start = stream_session_file(input_file, output_file)
         print(f"Converted {input_file} -> {output_file}")
         print(f"Session ID: {session_id}")
         print(f"Session start: {session_start}")
     else:
-        print(content)
+        write_delimited_markdown(iter_clawdbot_messages(input_file), sys.stdout)
+        print()
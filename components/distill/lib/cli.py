@@ -3,13 +3,16 @@
 Distill CLI - Process conversation sessions into knowledge.
 
 Usage:
-    python -m components.distill.lib.cli parse-jsonl <files>... [-o OUTPUT]
+    python -m components.distill.lib.cli parse-jsonl <files|dirs>... [-o OUTPUT] [--jobs N] [--follow]
     python -m components.distill.lib.cli canonicalize <files>... [-o OUTPUT]
     python -m components.distill.lib.cli variants <directory>
-    python -m components.distill.lib.cli export [--profile PROFILE]
+    python -m components.distill.lib.cli export [--profile PROFILE] [--jobs N] [--full]
+    python -m components.distill.lib.cli inventory [AGENTS...]
     python -m components.distill.lib.cli split <files>... [-o OUTPUT] [--max-chars N]
     python -m components.distill.lib.cli auto-config <files>... [--apply]
     python -m components.distill.lib.cli parse <file>
+    python -m components.distill.lib.cli index [PATHS...]
+    python -m components.distill.lib.cli search <words>... [--role ROLE] [--since DATE]
     python -m components.distill.lib.cli --help
 
 Commands:
@@ -17,15 +20,21 @@ Commands:
     canonicalize  Convert delimited markdown (with CONFIG) to canonical format
     variants      Generate variants (transcript, summary) from canonical files
     export        Generate filtered exports per config.yaml profiles
+    inventory     Write agent inventory files from the export manifests
     split         Split large files along message boundaries
     auto-config   Generate minimal CONFIG block for files without one
     parse         Debug: show parsed CONFIG block from a file
+    index         Build or update the full-text search index
+    search        Search indexed messages (ranked)
 """
 
 import argparse
+import os
 import sys
 import logging
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 try:
     import yaml
@@ -34,52 +43,142 @@ except ImportError:
     YAML_AVAILABLE = False
 
 
+def _collect_jsonl_inputs(paths: List[str], files_from: Optional[str] = None) -> List[Path]:
+    """
+    Expand parse-jsonl inputs into a list of files.
+
+    Directories contribute their *.jsonl files (sorted). files_from names a
+    file with one path per line ('-' for stdin). Missing and non-JSONL
+    files are reported and skipped; duplicates are dropped.
+    """
+    entries = list(paths)
+    if files_from:
+        stream = sys.stdin if files_from == '-' else open(files_from, encoding='utf-8')
+        with stream:
+            entries.extend(line.strip() for line in stream if line.strip())
+
+    files = []
+    seen = set()
+    for entry in entries:
+        path = Path(entry)
+        if path.is_dir():
+            candidates = sorted(path.glob('*.jsonl'))
+        elif not path.exists():
+            print(f"Warning: {entry} not found, skipping")
+            continue
+        elif path.suffix != '.jsonl':
+            print(f"Warning: {entry} is not a JSONL file, skipping")
+            continue
+        else:
+            candidates = [path]
+
+        for candidate in candidates:
+            if candidate not in seen:
+                seen.add(candidate)
+                files.append(candidate)
+    return files
+
+
+def _convert_jsonl_file(path: Path, output_dir: Path, follow: bool) -> tuple:
+    """
+    Convert one JSONL session into output_dir.
+
+    Module-level so it can run in a ProcessPoolExecutor worker. Returns
+    (out_path, new_messages, session_id, session_start, error); errors come
+    back as (message, traceback) from _describe_error instead of being raised.
+    """
+    from .clawdbot_parser import follow_session_file, stream_session_file
+
+    # Use session filename (with .md extension)
+    out_path = output_dir / (path.stem + '.md')
+    try:
+        if follow:
+            count, session_id, session_start = follow_session_file(path, out_path)
+        else:
+            count, session_id, session_start = stream_session_file(path, out_path)
+        return out_path, count, session_id, session_start, None
+    except Exception as e:
+        return out_path, 0, None, None, _describe_error(e)
+
+
 def cmd_parse_jsonl(args):
     """Convert JSONL session files to delimited markdown."""
-    from .clawdbot_parser import (
-        convert_session_file,
-        generate_output_filename
-    )
+    import time
+    from .clawdbot_parser import iter_clawdbot_messages, write_delimited_markdown
 
     output_dir = Path(args.output) if args.output else None
+    if args.follow and not output_dir:
+        print("Error: --follow requires --output")
+        sys.exit(1)
 
-    for file_path in args.files:
-        path = Path(file_path)
-        if not path.exists():
-            print(f"Warning: {file_path} not found, skipping")
-            continue
-
-        if not path.suffix == '.jsonl':
-            print(f"Warning: {file_path} is not a JSONL file, skipping")
-            continue
+    files = _collect_jsonl_inputs(args.files, args.files_from)
 
-        print(f"Converting: {path.name}")
-        try:
-            # Determine output path
-            if output_dir:
-                output_dir.mkdir(parents=True, exist_ok=True)
-                # Use session filename (with .md extension)
-                out_name = path.stem + '.md'
-                out_path = output_dir / out_name
-            else:
-                out_path = None
+    if not output_dir:
+        # Stream to stdout if no output dir
+        for path in files:
+            print(f"Converting: {path.name}")
+            try:
+                write_delimited_markdown(iter_clawdbot_messages(path), sys.stdout)
+                print()
+            except Exception as e:
+                print(f"  Error: {e}")
+                if args.verbose:
+                    import traceback
+                    traceback.print_exc()
+        return
 
-            content, session_id, session_start = convert_session_file(path, out_path)
+    if not files:
+        print("No JSONL files to convert")
+        return
 
-            if out_path:
-                print(f"  -> {out_path}")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    jobs = min(jobs, len(files))
+    total = len(files)
+    total_bytes = 0
+    failed = 0
+    started = time.perf_counter()
+
+    def report(results):
+        nonlocal total_bytes, failed
+        # Results arrive in input order, so progress reads the same at any --jobs
+        for i, (path, result) in enumerate(zip(files, results), 1):
+            out_path, count, session_id, session_start, error = result
+            print(f"[{i}/{total}] Converting: {path.name}")
+            if error:
+                failed += 1
+                print(f"  Error: {error[0]}")
                 if args.verbose:
-                    print(f"     Session ID: {session_id}")
-                    print(f"     Session start: {session_start}")
+                    print(error[1])
+                continue
+            total_bytes += path.stat().st_size
+            if args.follow:
+                print(f"  -> {out_path} (+{count} messages)")
             else:
-                # Print to stdout if no output dir
-                print(content)
-
-        except Exception as e:
-            print(f"  Error: {e}")
+                print(f"  -> {out_path}")
             if args.verbose:
-                import traceback
-                traceback.print_exc()
+                print(f"     Session ID: {session_id}")
+                print(f"     Session start: {session_start}")
+
+    output_dirs = [output_dir] * total
+    follow_flags = [args.follow] * total
+    if jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            report(pool.map(_convert_jsonl_file, files, output_dirs, follow_flags))
+    else:
+        report(map(_convert_jsonl_file, files, output_dirs, follow_flags))
+
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    converted = total - failed
+    megabytes = total_bytes / (1024 * 1024)
+    print(
+        f"\nConverted {converted}/{total} files ({megabytes:.1f} MB) in {elapsed:.2f}s "
+        f"with {jobs} job{'s' if jobs != 1 else ''}: "
+        f"{converted / elapsed:.1f} files/s, {megabytes / elapsed:.1f} MB/s"
+    )
+    if failed:
+        sys.exit(1)
 
 
 def cmd_canonicalize(args):
@@ -260,8 +359,14 @@ def cmd_parse(args):
 
 
 def cmd_export(args):
-    """Generate filtered exports per exports.yaml profiles."""
-    from .variants import generate_variants, VariantOptions, parse_canonical_file
+    """
+    Generate filtered exports per exports.yaml profiles.
+
+    Each source file is visited once and fanned out to every standalone
+    profile and content_pipeline agent it routes to. Variants are rendered
+    once per distinct redaction set and written to all matching targets.
+    """
+    from .variants import DocumentCache
 
     if not YAML_AVAILABLE:
         print("Error: PyYAML is required for export command")
@@ -367,300 +472,110 @@ def cmd_export(args):
     ref_count = len(canonical_files) - len(prompt_files)
     print(f"Found {len(canonical_files)} files ({ref_count} in reference/, {len(prompt_files)} prompts)")
 
-    logger = logging.getLogger(__name__)
     if args.verbose:
         logging.basicConfig(level=logging.DEBUG)
 
-    # Process each export profile
-    for profile_name, profile_config in exports.items():
-        print(f"\n=== Profile: {profile_name} ===")
-        print(f"  {profile_config.get('description', 'No description')}")
+    # Read and parse each file once, shared by all profiles and agents
+    cache = DocumentCache()
 
-        output_dir = Path(profile_config.get('output_dir', f'exports/{profile_name}'))
-        output_dir.mkdir(parents=True, exist_ok=True)
-
-        # Check if we should flatten all output to a single directory
-        flatten_export = profile_config.get('flatten_export', False)
-
-        # Get filtering rules
-        include_rules = profile_config.get('include', {})
-        exclude_rules = profile_config.get('exclude', {})
-        redaction_categories = profile_config.get('redaction', defaults.get('redaction', []))
-
-        if isinstance(redaction_categories, str):
-            redaction_categories = [redaction_categories]
+    targets = _build_export_targets(
+        exports, agent_profiles if run_agent_profiles else {}, defaults
+    )
+    for target in targets:
+        _load_export_manifest(target, user_to_agents, full=args.full)
+    unrouted_files = set()  # Files with no agents or users (won't reach any agent)
 
-        # Process each canonical file
-        processed = 0
-        unchanged = 0
-        skipped = 0
-        written_paths = set()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
-        for canonical_path in canonical_files:
-            try:
-                content = canonical_path.read_text(encoding='utf-8')
-                is_prompt = 'components' in str(canonical_path)
-
-                if is_prompt:
-                    # Prompts: simple frontmatter + content, no backmatter
-                    config = _parse_prompt_frontmatter(content)
-                    if config is None:
-                        if args.verbose:
-                            print(f"  Skip (no frontmatter): {canonical_path.name}")
-                        skipped += 1
-                        continue
-
-                    # Apply include/exclude filters (pass profile name for targeting)
-                    if not _matches_prompt_filters(config, include_rules, exclude_rules, profile_name):
-                        if args.verbose:
-                            print(f"  Skip (filtered): {canonical_path.name}")
-                        skipped += 1
-                        continue
-
-                    # Use output_name from frontmatter if specified, otherwise use stem
-                    output_name = config.get('output_name', canonical_path.stem)
-                    # Prompts go to prompts/ subdirectory (unless flattened)
-                    if flatten_export:
-                        prompts_dir = output_dir
-                    else:
-                        prompts_dir = output_dir / "prompts"
-                    prompts_dir.mkdir(parents=True, exist_ok=True)
-                    out_path = prompts_dir / f"Prompt - {output_name}.md"
-                    written_paths.add(out_path)
-                    if _write_if_changed(out_path, content):
-                        processed += 1
-                        if args.verbose:
-                            print(f"  -> {out_path}")
-                    else:
-                        unchanged += 1
-                        if args.verbose:
-                            print(f"  (unchanged) {out_path.name}")
-
-                else:
-                    # Canonical files: full parsing with backmatter
-                    config, main_content, backmatter = parse_canonical_file(content)
-
-                    # Apply include/exclude filters
-                    if not _matches_filters(config, include_rules, exclude_rules):
-                        if args.verbose:
-                            print(f"  Skip (filtered): {canonical_path.name}")
-                        skipped += 1
-                        continue
-
-                    # Determine output subdirectory and prefix based on content type
-                    subdir, prefix = _get_content_subdirectory_and_prefix(canonical_path, config)
-                    if flatten_export:
-                        content_output_dir = output_dir
-                    else:
-                        content_output_dir = output_dir / subdir
-                    content_output_dir.mkdir(parents=True, exist_ok=True)
-
-                    # Generate variants with redaction
-                    options = VariantOptions(
-                        generate_transcript=True,
-                        generate_lite=False,
-                        generate_summary=True,
-                        redact_categories=redaction_categories,
-                        output_dir=content_output_dir
-                    )
-
-                    result = generate_variants(canonical_path, options, logger)
-
-                    # Write transcript (main output) with prefix
-                    if result.transcript:
-                        out_name = f"{prefix}{canonical_path.stem}.md" if prefix else f"{canonical_path.stem}.md"
-                        out_path = content_output_dir / out_name
-                        written_paths.add(out_path)
-                        if _write_if_changed(out_path, result.transcript):
-                            processed += 1
-                            if args.verbose:
-                                print(f"  -> {out_path}")
-                        else:
-                            unchanged += 1
-                            if args.verbose:
-                                print(f"  (unchanged) {out_path.name}")
-
-                    # Write summary if generated
-                    if result.summary:
-                        if flatten_export:
-                            summary_dir = output_dir
-                        else:
-                            summary_dir = output_dir / "summaries"
-                        summary_dir.mkdir(parents=True, exist_ok=True)
-                        summary_name = f"Summary - {canonical_path.stem}.md"
-                        summary_path = summary_dir / summary_name
-                        written_paths.add(summary_path)
-                        if _write_if_changed(summary_path, result.summary):
-                            if args.verbose:
-                                print(f"  -> {summary_path}")
-                        else:
-                            if args.verbose:
-                                print(f"  (unchanged) {summary_path.name}")
+    # Visit each file once and fan out to every profile/agent it routes to
+    _run_export(
+        canonical_files, targets, cache, user_to_agents,
+        unrouted_files, jobs, args.verbose
+    )
 
-            except Exception as e:
-                print(f"  Error processing {canonical_path.name}: {e}")
-                if args.verbose:
-                    import traceback
-                    traceback.print_exc()
-                skipped += 1
+    for target in targets:
+        label = 'Agent' if target.is_agent else 'Profile'
+        print(f"\n=== {label}: {target.name} ===")
+        print(f"  {target.description}")
+        for message in target.messages:
+            print(message)
 
         # Remove stale files not produced by this export run
-        stale_count = _reconcile_stale_files(output_dir, written_paths, args.verbose)
-        print(f"  Written: {processed}, Unchanged: {unchanged}, Skipped: {skipped}")
+        if target.previous is not None:
+            stale_count = _reconcile_from_manifest(
+                target.output_dir, target.previous, target.written_paths, args.verbose
+            )
+        else:
+            stale_count = _reconcile_stale_files(target.output_dir, target.written_paths, args.verbose)
+        _save_export_manifest(target)
+        print(f"  Written: {target.processed}, Unchanged: {target.unchanged}, Skipped: {target.skipped}")
         if stale_count:
             print(f"  Removed: {stale_count} stale files")
-        print(f"  Output: {output_dir}/")
+        if target.is_agent:
+            for line in _write_inventories(target, target.sources):
+                print(line)
+        print(f"  Output: {target.output_dir}/")
+
+    # Warn about files with no routing info
+    if unrouted_files:
+        print(f"\nWarning: {len(unrouted_files)} file(s) have no 'users' or 'agents' in frontmatter (defaulting to bruba-main):")
+        if len(unrouted_files) <= 10:
+            for name in sorted(unrouted_files):
+                print(f"  - {name}")
+        else:
+            for name in sorted(unrouted_files)[:5]:
+                print(f"  - {name}")
+            print(f"  ... and {len(unrouted_files) - 5} more")
+        print("  Add 'users:' to frontmatter to control routing.")
 
-    # Process agent export profiles (content_pipeline agents)
-    if run_agent_profiles and agent_profiles:
-        from .parsing import parse_inline_list as _parse_inline_list
-        unrouted_files = set()  # Files with no agents or users (won't reach any agent)
+    print("\nExport complete.")
 
-        for agent_name, agent_config in agent_profiles.items():
-            print(f"\n=== Agent: {agent_name} ===")
-            print(f"  {agent_config.get('description', 'No description')}")
 
-            agent_output_dir = Path(agent_config.get('output_dir', f'agents/{agent_name}/exports'))
-            agent_output_dir.mkdir(parents=True, exist_ok=True)
+def cmd_inventory(args):
+    """
+    Write inventory files for content_pipeline agents from their export manifests.
 
-            agent_include = agent_config.get('include', {})
-            agent_exclude = agent_config.get('exclude', {})
-            agent_redaction = agent_config.get('redaction', defaults.get('redaction', []))
-            if isinstance(agent_redaction, str):
-                agent_redaction = [agent_redaction]
+    Nothing is re-exported; descriptions and dates come from the entries the
+    last export recorded, so only files without one are opened.
+    """
+    import json
 
-            processed = 0
-            unchanged = 0
-            skipped = 0
-            written_paths = set()
+    if not YAML_AVAILABLE:
+        print("Error: PyYAML is required for inventory command")
+        print("Install with: pip install pyyaml")
+        sys.exit(1)
 
-            for canonical_path in canonical_files:
-                try:
-                    content = canonical_path.read_text(encoding='utf-8')
-                    is_prompt = 'components' in str(canonical_path)
-
-                    if is_prompt:
-                        # Prompts: use same logic as standalone profiles
-                        pconfig = _parse_prompt_frontmatter(content)
-                        if pconfig is None:
-                            skipped += 1
-                            continue
-                        if not _matches_prompt_filters(pconfig, agent_include, agent_exclude, agent_name):
-                            skipped += 1
-                            continue
-
-                        output_name = pconfig.get('output_name', canonical_path.stem)
-                        prompts_dir = agent_output_dir / "prompts"
-                        prompts_dir.mkdir(parents=True, exist_ok=True)
-                        out_path = prompts_dir / f"Prompt - {output_name}.md"
-                        written_paths.add(out_path)
-                        if _write_if_changed(out_path, content):
-                            processed += 1
-                            if args.verbose:
-                                print(f"  -> {out_path}")
-                        else:
-                            unchanged += 1
-                    else:
-                        # Canonical files: check agents routing
-                        config, main_content, backmatter = parse_canonical_file(content)
-
-                        # Get agents list from frontmatter
-                        # Priority: explicit agents > derived from users > bruba-main (warn)
-                        file_agents = getattr(config, 'agents', [])
-                        if not file_agents:
-                            # Auto-derive from users field via user→agent mapping
-                            file_users = getattr(config, 'users', [])
-                            if file_users and user_to_agents:
-                                derived = []
-                                for u in file_users:
-                                    derived.extend(user_to_agents.get(u.lower(), []))
-                                if derived:
-                                    file_agents = derived
-                            if not file_agents:
-                                # No users or agents — default to bruba-main, track for warning
-                                file_agents = ['bruba-main']
-                                unrouted_files.add(canonical_path.name)
-
-                        # Skip if this agent isn't in the file's agents list
-                        if agent_name not in file_agents:
-                            if args.verbose:
-                                print(f"  Skip (not routed to {agent_name}): {canonical_path.name}")
-                            skipped += 1
-                            continue
-
-                        # Apply include/exclude filters
-                        if not _matches_filters(config, agent_include, agent_exclude):
-                            if args.verbose:
-                                print(f"  Skip (filtered): {canonical_path.name}")
-                            skipped += 1
-                            continue
-
-                        # Determine output subdirectory and prefix
-                        subdir, prefix = _get_content_subdirectory_and_prefix(canonical_path, config)
-                        content_output_dir = agent_output_dir / subdir
-                        content_output_dir.mkdir(parents=True, exist_ok=True)
-
-                        # Generate variants with redaction
-                        options = VariantOptions(
-                            generate_transcript=True,
-                            generate_lite=False,
-                            generate_summary=True,
-                            redact_categories=agent_redaction,
-                            output_dir=content_output_dir
-                        )
-
-                        result = generate_variants(canonical_path, options, logger)
-
-                        if result.transcript:
-                            out_name = f"{prefix}{canonical_path.stem}.md" if prefix else f"{canonical_path.stem}.md"
-                            out_path = content_output_dir / out_name
-                            written_paths.add(out_path)
-                            if _write_if_changed(out_path, result.transcript):
-                                processed += 1
-                                if args.verbose:
-                                    print(f"  -> {out_path}")
-                            else:
-                                unchanged += 1
-                                if args.verbose:
-                                    print(f"  (unchanged) {out_path.name}")
-
-                        if result.summary:
-                            summary_dir = agent_output_dir / "summaries"
-                            summary_dir.mkdir(parents=True, exist_ok=True)
-                            summary_name = f"Summary - {canonical_path.stem}.md"
-                            summary_path = summary_dir / summary_name
-                            written_paths.add(summary_path)
-                            if _write_if_changed(summary_path, result.summary):
-                                if args.verbose:
-                                    print(f"  -> {summary_path}")
-
-                except Exception as e:
-                    print(f"  Error processing {canonical_path.name}: {e}")
-                    if args.verbose:
-                        import traceback
-                        traceback.print_exc()
-                    skipped += 1
-
-            # Remove stale files not produced by this export run
-            stale_count = _reconcile_stale_files(agent_output_dir, written_paths, args.verbose)
-            print(f"  Written: {processed}, Unchanged: {unchanged}, Skipped: {skipped}")
-            if stale_count:
-                print(f"  Removed: {stale_count} stale files")
-            print(f"  Output: {agent_output_dir}/")
-
-        # Warn about files with no routing info
-        if unrouted_files:
-            print(f"\nWarning: {len(unrouted_files)} file(s) have no 'users' or 'agents' in frontmatter (defaulting to bruba-main):")
-            if len(unrouted_files) <= 10:
-                for name in sorted(unrouted_files):
-                    print(f"  - {name}")
-            else:
-                for name in sorted(unrouted_files)[:5]:
-                    print(f"  - {name}")
-                print(f"  ... and {len(unrouted_files) - 5} more")
-            print("  Add 'users:' to frontmatter to control routing.")
+    config_path = Path(args.config) if args.config else Path('config.yaml')
+    if not config_path.exists():
+        print(f"Error: {config_path} not found")
+        sys.exit(1)
 
-    print("\nExport complete.")
+    with open(config_path, 'r') as f:
+        agents_config = (yaml.safe_load(f) or {}).get('agents') or {}
+
+    agent_names = args.agents or [
+        name for name, agent_cfg in agents_config.items()
+        if (agent_cfg or {}).get('content_pipeline', False)
+    ]
+    for agent_name in agent_names:
+        agent_cfg = agents_config.get(agent_name) or {}
+        target = ExportTarget(
+            name=agent_name,
+            output_dir=Path(f'agents/{agent_name}/exports'),
+            include=agent_cfg.get('include') or {},
+            is_agent=True,
+        )
+        if not target.output_dir.is_dir():
+            continue
+        sources = {}
+        manifest_path = target.output_dir / EXPORT_MANIFEST_NAME
+        if manifest_path.exists():
+            try:
+                sources = json.loads(manifest_path.read_text(encoding='utf-8')).get('sources', {})
+            except (ValueError, OSError, AttributeError):
+                sources = {}
+        for line in _write_inventories(target, sources):
+            print(line)
 
 
 def cmd_auto_config(args):
@@ -776,6 +691,586 @@ def cmd_split(args):
     print(f"\nSummary: {split_files}/{total_files} files split into {chunks_created} chunks")
 
 
+def cmd_index(args):
+    """Build or update the full-text search index."""
+    import time
+    from .search_index import SearchIndex, default_index_roots
+
+    roots = [Path(p) for p in args.paths] if args.paths else default_index_roots()
+    if not roots:
+        print("Nothing to index (no agents/*/sessions, agents/*/intake or reference/)")
+        return
+
+    started = time.perf_counter()
+    with SearchIndex(Path(args.db)) as index:
+        stats = index.update(roots)
+        files, messages = index.counts()
+    elapsed = time.perf_counter() - started
+
+    if args.verbose:
+        for root in roots:
+            print(f"  {root}")
+    print(
+        f"Indexed {stats.files_seen} files in {elapsed:.2f}s: "
+        f"{stats.files_reindexed} (re)indexed, {stats.files_appended} appended, "
+        f"{stats.files_unchanged} unchanged, {stats.files_removed} removed, "
+        f"+{stats.messages_added} messages"
+    )
+    print(f"Index: {args.db} ({files} files, {messages} messages)")
+
+
+def cmd_search(args):
+    """Search the full-text index."""
+    import sqlite3
+    import time
+    from .search_index import SearchIndex, fts_query
+
+    db_path = Path(args.db)
+    if not db_path.exists():
+        print(f"Error: No index at {db_path} (run: distill index)")
+        sys.exit(1)
+
+    query_text = ' '.join(args.query)
+    query = query_text if args.raw else fts_query(query_text)
+    started = time.perf_counter()
+    with SearchIndex(db_path) as index:
+        try:
+            hits = index.search(query, limit=args.limit, role=args.role, since=args.since)
+        except sqlite3.OperationalError as e:
+            print(f"Error: Invalid query: {e}")
+            sys.exit(1)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    cwd = Path.cwd()
+    for rank, hit in enumerate(hits, 1):
+        when = hit.timestamp[:16].replace('T', ' ') if hit.timestamp else 'undated'
+        path = Path(hit.path)
+        try:
+            path = path.relative_to(cwd)
+        except ValueError:
+            pass  # Outside the current directory: show it absolute
+        print(f"{rank:3}. {when}  {path} #{hit.message_index} {hit.role.upper()}")
+        print(f"     {' '.join(hit.snippet.split())}")
+    print(f"\n{len(hits)} hits in {elapsed_ms:.1f} ms")
+
+
+@dataclass
+class ExportTarget:
+    """
+    One export destination: a standalone profile or a content_pipeline agent.
+
+    Collects per-target counts, written paths and buffered output lines
+    while cmd_export fans each file out to all targets in a single pass.
+    Also carries the target's export manifest: `previous` holds the
+    per-source entries from the last run, `sources` the entries for this one.
+    """
+    name: str
+    output_dir: Path
+    include: Dict[str, Any] = field(default_factory=dict)
+    exclude: Dict[str, Any] = field(default_factory=dict)
+    redaction: Tuple[str, ...] = ()
+    description: str = 'No description'
+    flatten: bool = False
+    is_agent: bool = False
+    processed: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    written_paths: Set[Path] = field(default_factory=set)
+    messages: List[str] = field(default_factory=list)
+    rules_hash: str = ''
+    previous: Optional[Dict[str, dict]] = None  # None = no manifest, use rglob
+    reusable: bool = False  # previous entries built with same version and rules
+    sources: Dict[str, dict] = field(default_factory=dict)
+    _entry: Optional[dict] = None
+
+    def start_source(self, key: str, digest: str):
+        """Begin the manifest entry for one source file."""
+        self._entry = {'hash': digest, 'outputs': [], 'counted': 0}
+        self.sources[key] = self._entry
+
+    def skip(self, message: str = None, verbose: bool = False):
+        self.skipped += 1
+        if self._entry is not None:
+            self._entry['skip'] = message or ''
+        if message and verbose:
+            self.messages.append(message)
+
+    def error(self, canonical_path: Path, error: Tuple[str, str], verbose: bool = False):
+        """Record a failure given as (message, traceback) from _describe_error."""
+        message, tb = error
+        self.messages.append(f"  Error processing {canonical_path.name}: {message}")
+        if verbose:
+            self.messages.append(tb)
+        self.skipped += 1
+        # Leave failed sources out of the manifest so the next run retries them
+        self.sources.pop(_source_key(canonical_path), None)
+        self._entry = None
+
+    def write(self, out_path: Path, content: str, verbose: bool = False, count: bool = True):
+        """Write one output file, recording it and updating the counts."""
+        self.written_paths.add(out_path)
+        if self._entry is not None:
+            self._entry['outputs'].append(out_path.relative_to(self.output_dir).as_posix())
+            self._entry['counted'] += int(count)
+        if _write_if_changed(out_path, content):
+            if count:
+                self.processed += 1
+            if verbose:
+                self.messages.append(f"  -> {out_path}")
+        else:
+            if count:
+                self.unchanged += 1
+            if verbose:
+                self.messages.append(f"  (unchanged) {out_path.name}")
+
+    def index(self, out_path: Path, description: str = '', date: str = ''):
+        """Record the inventory entry (description, date) for an output file."""
+        if self._entry is None:
+            return
+        self._entry['inventory'] = {
+            'file': out_path.relative_to(self.output_dir).as_posix(),
+            'description': description,
+            'date': date or _mtime_date(out_path),
+        }
+
+    def can_reuse(self, key: str, digest: str) -> bool:
+        """True if the last run exported this exact input under the same rules."""
+        if not self.reusable:
+            return False
+        entry = self.previous.get(key)
+        if entry is None or entry.get('hash') != digest:
+            return False
+        return all((self.output_dir / rel).exists() for rel in entry.get('outputs', []))
+
+    def reuse(self, key: str, verbose: bool = False):
+        """Carry a source's previous manifest entry over without re-rendering."""
+        entry = self.previous[key]
+        self.sources[key] = entry
+        self._entry = None
+        if 'skip' in entry:
+            self.skip(entry['skip'], verbose)
+            return
+        for rel in entry.get('outputs', []):
+            out_path = self.output_dir / rel
+            self.written_paths.add(out_path)
+            if verbose:
+                self.messages.append(f"  (unchanged) {out_path.name}")
+        self.unchanged += entry.get('counted', 0)
+
+
+def _build_export_targets(exports: dict, agent_profiles: dict, defaults: dict) -> List[ExportTarget]:
+    """Build ExportTargets for standalone profiles, then agent profiles."""
+    targets = []
+    for name, profile_config, is_agent in (
+        [(n, c, False) for n, c in exports.items()] +
+        [(n, c, True) for n, c in agent_profiles.items()]
+    ):
+        default_dir = f'agents/{name}/exports' if is_agent else f'exports/{name}'
+        redaction = profile_config.get('redaction', defaults.get('redaction', []))
+        if isinstance(redaction, str):
+            redaction = [redaction]
+        target = ExportTarget(
+            name=name,
+            output_dir=Path(profile_config.get('output_dir', default_dir)),
+            include=profile_config.get('include', {}),
+            exclude=profile_config.get('exclude', {}),
+            redaction=tuple(redaction or ()),
+            description=profile_config.get('description', 'No description'),
+            flatten=profile_config.get('flatten_export', False),
+            is_agent=is_agent,
+        )
+        target.output_dir.mkdir(parents=True, exist_ok=True)
+        targets.append(target)
+    return targets
+
+
+EXPORT_MANIFEST_NAME = '.distill-manifest.json'
+
+
+def _source_key(canonical_path: Path) -> str:
+    """Manifest key for a source file."""
+    return canonical_path.as_posix()
+
+
+def _export_rules_hash(target: ExportTarget, user_to_agents: dict) -> str:
+    """Hash everything in config.yaml that decides what a target's outputs look like."""
+    import hashlib
+    import json
+    rules = {
+        'name': target.name,
+        'output_dir': target.output_dir.as_posix(),
+        'include': target.include,
+        'exclude': target.exclude,
+        'redaction': list(target.redaction),
+        'flatten': target.flatten,
+        'is_agent': target.is_agent,
+    }
+    if target.is_agent:
+        rules['user_to_agents'] = user_to_agents
+    encoded = json.dumps(rules, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _load_export_manifest(target: ExportTarget, user_to_agents: dict, full: bool = False):
+    """
+    Load the target's manifest from its output dir.
+
+    Entries are reusable only if the manifest was written by the same
+    library version with the same profile rules. With full=True the
+    manifest is ignored entirely (re-render everything, rescan for stale
+    files).
+    """
+    import json
+    from . import __version__
+
+    target.rules_hash = _export_rules_hash(target, user_to_agents)
+    manifest_path = target.output_dir / EXPORT_MANIFEST_NAME
+    if full or not manifest_path.exists():
+        return
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        target.previous = dict(manifest.get('sources', {}))
+    except (ValueError, OSError, AttributeError):
+        return
+    target.reusable = (
+        manifest.get('version') == __version__ and
+        manifest.get('rules_hash') == target.rules_hash
+    )
+
+
+def _save_export_manifest(target: ExportTarget):
+    """Write the target's manifest (only touches the file if it changed)."""
+    import json
+    from . import __version__
+
+    manifest = {
+        'version': __version__,
+        'rules_hash': target.rules_hash,
+        'sources': target.sources,
+    }
+    _write_if_changed(
+        target.output_dir / EXPORT_MANIFEST_NAME,
+        json.dumps(manifest, indent=1, sort_keys=True) + '\n'
+    )
+
+
+def _resolve_file_agents(config, user_to_agents: dict) -> list:
+    """
+    Get the agents a canonical file routes to.
+
+    Priority: explicit agents > derived from users > [] (caller defaults).
+    """
+    file_agents = getattr(config, 'agents', [])
+    if not file_agents:
+        # Auto-derive from users field via user→agent mapping
+        file_users = getattr(config, 'users', [])
+        if file_users and user_to_agents:
+            derived = []
+            for u in file_users:
+                derived.extend(user_to_agents.get(u.lower(), []))
+            file_agents = derived
+    return file_agents
+
+
+def _route_canonical_file(
+    canonical_path: Path,
+    config,
+    targets: List[ExportTarget],
+    user_to_agents: dict,
+    unrouted_files: set
+) -> Tuple[Dict[Tuple[str, ...], List[ExportTarget]], List[Tuple[ExportTarget, str]]]:
+    """
+    Work out which targets a canonical file goes to.
+
+    Returns (groups, skips): matching targets grouped by redaction
+    categories, so each distinct redaction set is rendered once and written
+    to every target in its group, plus (target, reason) for the rest.
+    """
+    groups = {}
+    skips = []
+    file_agents = None
+    for target in targets:
+        if target.is_agent:
+            if file_agents is None:
+                file_agents = _resolve_file_agents(config, user_to_agents)
+                if not file_agents:
+                    # No users or agents — default to bruba-main, track for warning
+                    file_agents = ['bruba-main']
+                    unrouted_files.add(canonical_path.name)
+            if target.name not in file_agents:
+                skips.append((target, f"  Skip (not routed to {target.name}): {canonical_path.name}"))
+                continue
+
+        if not _matches_filters(config, target.include, target.exclude):
+            skips.append((target, f"  Skip (filtered): {canonical_path.name}"))
+            continue
+
+        groups.setdefault(target.redaction, []).append(target)
+    return groups, skips
+
+
+@dataclass
+class ExportPlan:
+    """Routing decisions for one source file, made before any rendering."""
+    path: Path
+    is_prompt: bool = False
+    digest: str = ''
+    targets: List[ExportTarget] = field(default_factory=list)  # need (re)rendering
+    reused: List[ExportTarget] = field(default_factory=list)  # unchanged per manifest
+    parsed: Optional[tuple] = None
+    groups: Dict[Tuple[str, ...], List[ExportTarget]] = field(default_factory=dict)
+    skips: List[Tuple[ExportTarget, str]] = field(default_factory=list)
+    unrouted: bool = False
+    error: Optional[Tuple[str, str]] = None  # (message, traceback)
+
+
+def _describe_error(exc: Exception) -> Tuple[str, str]:
+    """Capture (message, traceback) for the exception being handled."""
+    import traceback
+    return str(exc), traceback.format_exc().rstrip('\n')
+
+
+def _plan_export_file(
+    canonical_path: Path,
+    targets: List[ExportTarget],
+    cache,
+    user_to_agents: dict,
+    unrouted_files: set
+) -> ExportPlan:
+    """
+    Parse and route one source file; prompts are handled at apply time.
+
+    Targets whose manifest shows this exact input was already exported
+    under the same rules are reused; if that covers every target the file
+    isn't parsed at all.
+    """
+    plan = ExportPlan(
+        path=canonical_path,
+        is_prompt='components' in str(canonical_path),
+        targets=list(targets),
+    )
+    key = _source_key(canonical_path)
+    try:
+        plan.digest = cache.digest(canonical_path)
+        plan.reused = [t for t in targets if t.can_reuse(key, plan.digest)]
+        plan.targets = [t for t in targets if t not in plan.reused]
+        if any(t.is_agent and t.previous[key].get('unrouted') for t in plan.reused):
+            plan.unrouted = True
+            unrouted_files.add(canonical_path.name)
+        if plan.is_prompt or not plan.targets:
+            return plan
+
+        # Canonical files: full parsing with backmatter
+        plan.parsed = cache.parse(canonical_path)
+        unrouted = set()
+        plan.groups, plan.skips = _route_canonical_file(
+            canonical_path, plan.parsed[0], plan.targets, user_to_agents, unrouted
+        )
+        if unrouted:
+            plan.unrouted = True
+            unrouted_files.update(unrouted)
+    except Exception as e:
+        plan.error = _describe_error(e)
+    return plan
+
+
+def _render_variants(parsed: tuple, redaction: Tuple[str, ...], logger=None) -> Tuple[str, str]:
+    """Render (transcript, summary) for one parsed file and redaction set."""
+    from .variants import generate_variants, VariantOptions
+
+    options = VariantOptions(
+        generate_transcript=True,
+        generate_lite=False,
+        generate_summary=True,
+        redact_categories=list(redaction),
+    )
+    result = generate_variants(None, options, logger, parsed=parsed)
+    return result.transcript, result.summary
+
+
+def _render_variant_sets(parsed: tuple, redactions: List[Tuple[str, ...]]) -> list:
+    """
+    Render every redaction set for one parsed file.
+
+    Module-level so it can run in a ProcessPoolExecutor worker. Returns
+    (transcript, summary, error) per redaction set; errors come back as
+    (message, traceback) instead of being raised, so one failing set
+    doesn't lose the others.
+    """
+    logger = logging.getLogger(__name__)
+    results = []
+    for redaction in redactions:
+        try:
+            transcript, summary = _render_variants(parsed, redaction, logger)
+            results.append((transcript, summary, None))
+        except Exception as e:
+            results.append((None, None, _describe_error(e)))
+    return results
+
+
+def _write_canonical_outputs(
+    canonical_path: Path,
+    config,
+    target: ExportTarget,
+    transcript: str,
+    summary: str,
+    verbose: bool = False
+):
+    """Write a rendered transcript and summary into one target's output dir."""
+    subdir, prefix = _get_content_subdirectory_and_prefix(canonical_path, config)
+    if target.flatten:
+        content_output_dir = target.output_dir
+    else:
+        content_output_dir = target.output_dir / subdir
+    content_output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Write transcript (main output) with prefix
+    if transcript:
+        out_name = f"{prefix}{canonical_path.stem}.md" if prefix else f"{canonical_path.stem}.md"
+        target.write(content_output_dir / out_name, transcript, verbose)
+        target.index(
+            content_output_dir / out_name,
+            getattr(config, 'description', '') or getattr(config, 'title', ''),
+            str(getattr(config, 'date', '') or ''),
+        )
+
+    # Write summary if generated (not counted in Written/Unchanged)
+    if summary:
+        if target.flatten:
+            summary_dir = target.output_dir
+        else:
+            summary_dir = target.output_dir / "summaries"
+        summary_dir.mkdir(parents=True, exist_ok=True)
+        summary_path = summary_dir / f"Summary - {canonical_path.stem}.md"
+        target.write(summary_path, summary, verbose, count=False)
+
+
+def _export_prompt_file(
+    canonical_path: Path,
+    targets: List[ExportTarget],
+    cache,
+    verbose: bool = False
+):
+    """Copy a component prompt into every target whose filters it matches."""
+    # Prompts: simple frontmatter + content, no backmatter
+    content = cache.read(canonical_path)
+    config = cache.parse(canonical_path, _parse_prompt_frontmatter)
+
+    for target in targets:
+        try:
+            if config is None:
+                target.skip(f"  Skip (no frontmatter): {canonical_path.name}", verbose)
+                continue
+
+            # Apply include/exclude filters (pass profile name for targeting)
+            if not _matches_prompt_filters(config, target.include, target.exclude, target.name):
+                target.skip(f"  Skip (filtered): {canonical_path.name}", verbose)
+                continue
+
+            # Use output_name from frontmatter if specified, otherwise use stem
+            output_name = config.get('output_name', canonical_path.stem)
+            # Prompts go to prompts/ subdirectory (unless flattened)
+            if target.flatten:
+                prompts_dir = target.output_dir
+            else:
+                prompts_dir = target.output_dir / "prompts"
+            prompts_dir.mkdir(parents=True, exist_ok=True)
+            out_path = prompts_dir / f"Prompt - {output_name}.md"
+            target.write(out_path, content, verbose)
+            target.index(
+                out_path,
+                str(config.get('description') or config.get('title') or ''),
+                str(config.get('date') or ''),
+            )
+        except Exception as e:
+            target.error(canonical_path, _describe_error(e), verbose)
+
+
+def _apply_export_plan(
+    plan: ExportPlan,
+    rendered: Optional[list],
+    cache,
+    verbose: bool = False
+):
+    """Record skips and write rendered outputs for one planned file."""
+    key = _source_key(plan.path)
+    for target in plan.reused:
+        target.reuse(key, verbose)
+    for target in plan.targets:
+        target.start_source(key, plan.digest)
+        if plan.unrouted and target.is_agent:
+            target.sources[key]['unrouted'] = True
+
+    if plan.is_prompt and plan.targets and not plan.error:
+        try:
+            _export_prompt_file(plan.path, plan.targets, cache, verbose)
+        except Exception as e:
+            plan.error = _describe_error(e)
+
+    if plan.error:
+        # Read/parse errors hit every target
+        for target in plan.targets:
+            target.error(plan.path, plan.error, verbose)
+        return
+
+    for target, message in plan.skips:
+        target.skip(message, verbose)
+
+    config = plan.parsed[0] if plan.parsed else None
+    for group, (transcript, summary, error) in zip(plan.groups.values(), rendered or []):
+        for target in group:
+            if error:
+                target.error(plan.path, error, verbose)
+                continue
+            try:
+                _write_canonical_outputs(
+                    plan.path, config, target, transcript, summary, verbose
+                )
+            except Exception as e:
+                target.error(plan.path, _describe_error(e), verbose)
+
+
+def _run_export(
+    canonical_files: List[Path],
+    targets: List[ExportTarget],
+    cache,
+    user_to_agents: dict,
+    unrouted_files: set,
+    jobs: int = 1,
+    verbose: bool = False
+):
+    """
+    Export all files to all targets.
+
+    Parsing and routing happen in this process. Variant rendering (the
+    CPU-heavy redaction and anchor search) runs in a process pool when
+    jobs > 1. Results are consumed in file order and all writes happen
+    here, so output and counts are identical to a serial run.
+    """
+    plans = [
+        _plan_export_file(path, targets, cache, user_to_agents, unrouted_files)
+        for path in canonical_files
+    ]
+    work = [plan for plan in plans if plan.groups]
+    parsed_docs = [plan.parsed for plan in work]
+    redaction_sets = [list(plan.groups) for plan in work]
+
+    def apply_all(rendered_iter):
+        for plan in plans:
+            rendered = next(rendered_iter) if plan.groups else None
+            _apply_export_plan(plan, rendered, cache, verbose)
+
+    if jobs > 1 and len(work) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        chunksize = max(1, len(work) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            apply_all(iter(pool.map(
+                _render_variant_sets, parsed_docs, redaction_sets, chunksize=chunksize
+            )))
+    else:
+        apply_all(map(_render_variant_sets, parsed_docs, redaction_sets))
+
+
 def _write_if_changed(path: Path, content: str) -> bool:
     """
     Write content to path only if it differs from existing content.
@@ -820,6 +1315,168 @@ def _reconcile_stale_files(output_dir: Path, written_paths: set, verbose: bool =
     return deleted
 
 
+def _reconcile_from_manifest(
+    output_dir: Path,
+    previous_sources: Dict[str, dict],
+    written_paths: set,
+    verbose: bool = False
+) -> int:
+    """
+    Remove outputs recorded in the previous manifest but not written this run.
+
+    Avoids walking the whole output dir; only parents of deleted files are
+    checked for emptiness.
+    """
+    deleted = 0
+    for entry in previous_sources.values():
+        for rel in entry.get('outputs', []):
+            out_path = output_dir / rel
+            if out_path in written_paths or not out_path.exists():
+                continue
+            out_path.unlink()
+            deleted += 1
+            if verbose:
+                print(f"  Removed stale: {out_path}")
+            # Clean now-empty parent dirs up to output_dir
+            parent = out_path.parent
+            while parent != output_dir and output_dir in parent.parents:
+                try:
+                    parent.rmdir()
+                except OSError:
+                    break
+                parent = parent.parent
+    return deleted
+
+
+# Inventory files: (file name, [(section heading, subdir, prefix)])
+DOCUMENT_INVENTORY = ('Document Inventory.md', [
+    ('Docs', 'docs', 'Doc - '),
+    ('Prompts', 'prompts', 'Prompt - '),
+    ('Reference Docs', 'refdocs', 'Refdoc - '),
+])
+TRANSCRIPT_INVENTORY = ('Transcript Inventory.md', [
+    ('Transcripts', 'transcripts', 'Transcript - '),
+])
+
+
+def _mtime_date(path: Path) -> str:
+    """A file's modification date as YYYY-MM-DD (today if it can't be read)."""
+    import datetime
+    try:
+        return datetime.date.fromtimestamp(path.stat().st_mtime).isoformat()
+    except OSError:
+        return datetime.date.today().isoformat()
+
+
+def _inventory_from_file(path: Path) -> dict:
+    """Inventory entry read from an exported file's frontmatter."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            head = ''.join(line for _, line in zip(range(20), f))
+        frontmatter = _parse_prompt_frontmatter(head + '\n---') or {}
+    except (OSError, UnicodeDecodeError):
+        frontmatter = {}
+    if not isinstance(frontmatter, dict):
+        frontmatter = {}
+    return {
+        'description': str(frontmatter.get('description') or frontmatter.get('title') or ''),
+        'date': _mtime_date(path),
+    }
+
+
+def _collect_inventory(output_dir: Path, sources: Dict[str, dict], sections: list) -> Dict[str, list]:
+    """
+    Inventory rows per section heading, as (file name, description, date).
+
+    Membership comes from a listing of each section's directory; metadata
+    comes from the manifest's inventory entries, recorded when a source was
+    last rendered. Files without an entry (older manifests, manual copies)
+    fall back to their own frontmatter.
+    """
+    indexed = {
+        entry['inventory']['file']: entry['inventory']
+        for entry in sources.values() if 'inventory' in entry
+    }
+    rows = {}
+    for heading, subdir, prefix in sections:
+        section_dir = output_dir / subdir
+        if not section_dir.is_dir():
+            continue
+        for path in sorted(section_dir.glob(f'{prefix}*.md')):
+            entry = indexed.get(f'{subdir}/{path.name}') or _inventory_from_file(path)
+            # Final fallback: file name without its prefix
+            description = entry['description'] or path.stem.split('- ', 1)[-1]
+            rows.setdefault(heading, []).append((path.name, description, entry['date']))
+    return rows
+
+
+def _render_inventory(title: str, sections: list, rows: Dict[str, list], generated: str) -> str:
+    """Render an inventory file with one table per non-empty section."""
+    lines = [f'# {title}', '', f'Generated: {generated}', '']
+    for heading, _, _ in sections:
+        entries = rows.get(heading)
+        if not entries:
+            continue
+        lines.append(f'## {heading} ({len(entries)})')
+        lines.append('')
+        lines.append('| File | Description | Date |')
+        lines.append('|------|-------------|------|')
+        for name, description, date in entries:
+            lines.append(f'| {name} | {description} | {date} |')
+        lines.append('')
+    lines.append('---')
+    lines.append('*Auto-generated by bruba-godo*')
+    return '\n'.join(lines) + '\n'
+
+
+def _write_inventories(target: ExportTarget, sources: Dict[str, dict]) -> List[str]:
+    """
+    Write Document Inventory.md (and Transcript Inventory.md when the agent
+    includes transcripts) into an agent's export dir.
+
+    Returns one summary line per inventory written.
+    """
+    import datetime
+    generated = datetime.date.today().isoformat()
+    inventories = [DOCUMENT_INVENTORY]
+    if 'transcript' in (target.include.get('type') or []):
+        inventories.append(TRANSCRIPT_INVENTORY)
+
+    summaries = []
+    for file_name, sections in inventories:
+        rows = _collect_inventory(target.output_dir, sources, sections)
+        if not rows:
+            continue
+        title = file_name[:-len('.md')]
+        out_path = target.output_dir / file_name
+        content = _render_inventory(title, sections, rows, generated)
+        # Keep the old Generated date when no row changed, so an unchanged
+        # inventory isn't pushed (and reindexed) again each day
+        previous = _inventory_generated_date(out_path)
+        if previous and previous != generated:
+            unchanged = _render_inventory(title, sections, rows, previous)
+            if out_path.read_text(encoding='utf-8') == unchanged:
+                content = unchanged
+        _write_if_changed(out_path, content)
+        counts = ', '.join(
+            f"{len(rows.get(heading, []))} {subdir}" for heading, subdir, _ in sections
+        )
+        summaries.append(f"  {target.name}: {title}: {counts}")
+    return summaries
+
+
+def _inventory_generated_date(path: Path) -> str:
+    """The Generated: date of an existing inventory file ('' if none)."""
+    try:
+        with open(path, encoding='utf-8') as f:
+            for _, line in zip(range(5), f):
+                if line.startswith('Generated: '):
+                    return line[len('Generated: '):].strip()
+    except OSError:
+        pass
+    return ''
+
+
 def _parse_prompt_frontmatter(content: str) -> dict:
     """
     Parse simple YAML frontmatter from a prompt file.
@@ -1020,6 +1677,17 @@ def _matches_filters(config, include_rules: dict, exclude_rules: dict) -> bool:
     return True
 
 
+def _job_count(value: str) -> int:
+    """argparse type for --jobs: a worker count, or 0 for one per CPU."""
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid job count: {value!r}")
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"job count must be 0 (one per CPU) or more, got {jobs}")
+    return jobs
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Distill - Convert conversations to knowledge"
@@ -1039,13 +1707,29 @@ def main():
     )
     parse_jsonl_parser.add_argument(
         'files',
-        nargs='+',
-        help='JSONL files to convert'
+        nargs='*',
+        help='JSONL files or directories of them to convert'
+    )
+    parse_jsonl_parser.add_argument(
+        '--files-from',
+        metavar='PATH',
+        help="Read more input paths from PATH, one per line ('-' for stdin)"
     )
     parse_jsonl_parser.add_argument(
         '--output', '-o',
         help='Output directory (if not specified, prints to stdout)'
     )
+    parse_jsonl_parser.add_argument(
+        '--follow',
+        action='store_true',
+        help='Convert incrementally: append only messages added since the last run (requires -o)'
+    )
+    parse_jsonl_parser.add_argument(
+        '--jobs', '-j',
+        type=_job_count,
+        default=1,
+        help='Worker processes for conversion with -o (default: 1, 0 = one per CPU)'
+    )
     parse_jsonl_parser.set_defaults(func=cmd_parse_jsonl)
 
     # canonicalize command
@@ -1128,8 +1812,35 @@ def main():
         '--config', '-c',
         help='Path to config.yaml (default: config.yaml)'
     )
+    export_parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Ignore the export manifest: re-render every file and rescan output dirs for stale files'
+    )
+    export_parser.add_argument(
+        '--jobs', '-j',
+        type=_job_count,
+        default=1,
+        help='Worker processes for variant generation (default: 1, 0 = one per CPU)'
+    )
     export_parser.set_defaults(func=cmd_export)
 
+    # inventory command
+    inventory_parser = subparsers.add_parser(
+        'inventory',
+        help='Write agent inventory files from the export manifests'
+    )
+    inventory_parser.add_argument(
+        'agents',
+        nargs='*',
+        help='Agents to write inventories for (default: all content_pipeline agents)'
+    )
+    inventory_parser.add_argument(
+        '--config', '-c',
+        help='Path to config.yaml (default: config.yaml)'
+    )
+    inventory_parser.set_defaults(func=cmd_inventory)
+
     # split command
     split_parser = subparsers.add_parser(
         'split',
@@ -1175,6 +1886,61 @@ def main():
     )
     auto_config_parser.set_defaults(func=cmd_auto_config)
 
+    # index command
+    index_parser = subparsers.add_parser(
+        'index',
+        help='Build or update the full-text search index'
+    )
+    index_parser.add_argument(
+        'paths',
+        nargs='*',
+        help='Files or directories to index (default: agents/*/sessions, agents/*/intake, reference/)'
+    )
+    index_parser.add_argument(
+        '--db',
+        default='.distill-index.sqlite',
+        help='Index database (default: .distill-index.sqlite)'
+    )
+    index_parser.set_defaults(func=cmd_index)
+
+    # search command
+    search_parser = subparsers.add_parser(
+        'search',
+        help='Search indexed messages'
+    )
+    search_parser.add_argument(
+        'query',
+        nargs='+',
+        help='Words to find (all must match)'
+    )
+    search_parser.add_argument(
+        '--db',
+        default='.distill-index.sqlite',
+        help='Index database (default: .distill-index.sqlite)'
+    )
+    search_parser.add_argument(
+        '--limit', '-n',
+        type=int,
+        default=20,
+        help='Maximum hits (default: 20)'
+    )
+    search_parser.add_argument(
+        '--role',
+        choices=['user', 'assistant'],
+        help='Only messages from this role'
+    )
+    search_parser.add_argument(
+        '--since',
+        metavar='DATE',
+        help='Only messages on or after this date (YYYY-MM-DD)'
+    )
+    search_parser.add_argument(
+        '--raw',
+        action='store_true',
+        help='Pass the query to SQLite FTS5 as written (OR, NEAR, "phrases", prefix*)'
+    )
+    search_parser.set_defaults(func=cmd_search)
+
     args = parser.parse_args()
 
     if args.command is None:
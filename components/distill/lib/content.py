@@ -9,6 +9,9 @@ This module handles the complex content transformations:
 5. Content truncation at export config
 
 Contents:
+    - AnchorIndex: Normalize a document once for repeated fuzzy anchor lookups
+    - fuzzy_find_anchor(): One-off fuzzy anchor lookup
+    - SpanEdits: Collect replacements and apply them in one pass
     - find_anchor_position(): Find text position with optional context
     - remove_by_anchors(): Remove content between start/end anchors
     - apply_replacement(): Find and replace text
@@ -20,6 +23,7 @@ Contents:
 
 import re
 import logging
+from bisect import bisect_left, bisect_right
 from typing import List, Optional, Tuple
 
 from .models import AnchorSpec, ReplacementSpec, Message, ExportConfig, MidConversationTranscription
@@ -39,42 +43,186 @@ def normalize_for_matching(text: str) -> str:
     return normalized
 
 
-def fuzzy_find_anchor(content: str, anchor: str) -> Optional[int]:
+# Word runs and whitespace runs; punctuation stripped by normalize_for_matching
+# falls between matches and is dropped.
+_NORMALIZE_TOKEN = re.compile(r'([^\s,;:!?\-\—\–\.\'\"]+)|(\s+)')
+
+
+class AnchorIndex:
     """
-    Find anchor position using fuzzy matching.
+    Fuzzy anchor lookups against one document.
+
+    The document is normalized once, the same way as normalize_for_matching
+    (punctuation stripped, whitespace collapsed, lowercased), and a segment
+    map is kept from normalized offsets back to original positions. Every
+    lookup is then one substring search instead of re-normalizing a chunk
+    at each occurrence of the anchor's first word.
 
-    First tries exact match, then falls back to normalized matching.
+    Lookups try, in order: exact match, case-insensitive match, normalized
+    match. The normalized form is built lazily on the first lookup that
+    needs it.
     """
-    pos = content.find(anchor)
-    if pos != -1:
-        return pos
 
-    normalized_anchor = normalize_for_matching(anchor)
-    if not normalized_anchor:
-        return None
+    def __init__(self, content: str):
+        self.content = content
+        self._lowered: Optional[str] = None
+        self._normalized: Optional[str] = None
+        # Parallel lists: each segment starts at norm_starts[i] in the
+        # normalized text and orig_starts[i] in the original, and spans
+        # seg_lengths[i] characters of both (spaces span one)
+        self._norm_starts: List[int] = []
+        self._orig_starts: List[int] = []
+        self._seg_lengths: List[int] = []
+
+    def _build(self):
+        pieces = []
+        pos = 0
+        pending_space = None
+        for match in _NORMALIZE_TOKEN.finditer(self.content):
+            word = match.group(1)
+            if word is None:
+                # Collapse whitespace; leading and trailing space is dropped
+                if pieces and pending_space is None:
+                    pending_space = match.start()
+                continue
+            if pending_space is not None:
+                self._add_segment(pos, pending_space, 1)
+                pieces.append(' ')
+                pos += 1
+                pending_space = None
+            lowered = word.lower()
+            if len(lowered) == len(word):
+                self._add_segment(pos, match.start(), len(word))
+                pieces.append(lowered)
+                pos += len(lowered)
+            else:
+                # Rare: lowercasing changed length, map char by char
+                for i, char in enumerate(word):
+                    lowered_char = char.lower()
+                    self._add_segment(pos, match.start() + i, 1)
+                    pieces.append(lowered_char)
+                    pos += len(lowered_char)
+        self._normalized = ''.join(pieces)
+
+    def _add_segment(self, norm_start: int, orig_start: int, length: int):
+        self._norm_starts.append(norm_start)
+        self._orig_starts.append(orig_start)
+        self._seg_lengths.append(length)
+
+    def _to_original(self, norm_pos: int) -> int:
+        i = bisect_right(self._norm_starts, norm_pos) - 1
+        offset = min(norm_pos - self._norm_starts[i], self._seg_lengths[i] - 1)
+        return self._orig_starts[i] + offset
+
+    def _to_normalized(self, orig_pos: int) -> int:
+        i = bisect_left(self._orig_starts, orig_pos)
+        if i > 0 and orig_pos < self._orig_starts[i - 1] + self._seg_lengths[i - 1]:
+            return self._norm_starts[i - 1] + (orig_pos - self._orig_starts[i - 1])
+        if i < len(self._norm_starts):
+            return self._norm_starts[i]
+        return len(self._normalized)
+
+    def find(self, anchor: str, start: int = 0) -> Optional[int]:
+        """
+        Find anchor at or after start, returning its position in the original text.
+        """
+        pos = self.content.find(anchor, start)
+        if pos != -1:
+            return pos
+
+        # Case-insensitive, only when lowercasing keeps offsets aligned
+        if self._lowered is None:
+            lowered = self.content.lower()
+            self._lowered = lowered if len(lowered) == len(self.content) else ''
+        if self._lowered:
+            pos = self._lowered.find(anchor.lower(), start)
+            if pos != -1:
+                return pos
+
+        normalized_anchor = normalize_for_matching(anchor)
+        if not normalized_anchor:
+            return None
+
+        if self._normalized is None:
+            self._build()
+        pos = self._normalized.find(normalized_anchor, self._to_normalized(start))
+        if pos == -1:
+            return None
+        return self._to_original(pos)
 
-    anchor_words = normalized_anchor.split()
-    if not anchor_words:
-        return None
 
-    first_word_pattern = re.compile(re.escape(anchor_words[0]), re.IGNORECASE)
-    search_start = 0
-    while search_start < len(content):
-        match = first_word_pattern.search(content, search_start)
-        if not match:
-            break
+def fuzzy_find_anchor(content: str, anchor: str) -> Optional[int]:
+    """
+    Find anchor position using fuzzy matching.
 
-        candidate_start = match.start()
-        chunk_end = min(candidate_start + len(anchor) + 50, len(content))
-        chunk = content[candidate_start:chunk_end]
-        normalized_chunk = normalize_for_matching(chunk)
+    First tries exact match, then falls back to case-insensitive and
+    normalized matching. Use AnchorIndex directly for repeated lookups
+    against the same content.
+    """
+    return AnchorIndex(content).find(anchor)
 
-        if normalized_chunk.startswith(normalized_anchor):
-            return candidate_start
 
-        search_start = candidate_start + 1
+class SpanEdits:
+    """
+    Replacements against one original text, applied in a single join.
+
+    Spans are half-open [start, end) offsets into the original content.
+    Spans may touch. A span that encloses earlier ones replaces them (as
+    a later edit over the already-edited text would); add() refuses a
+    span that only partly overlaps an existing one.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self._starts: List[int] = []
+        self._spans: List[Tuple[int, int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def covering(self, pos: int, end: Optional[int] = None) -> Optional[Tuple[int, int]]:
+        """
+        Return the (start, end) of the first span containing pos, or
+        overlapping [pos, end) if end is given.
+        """
+        i = bisect_right(self._starts, pos) - 1
+        if i >= 0 and pos < self._spans[i][1]:
+            return self._spans[i][0], self._spans[i][1]
+        if end is not None and i + 1 < len(self._spans) and self._spans[i + 1][0] < end:
+            return self._spans[i + 1][0], self._spans[i + 1][1]
+        return None
 
-    return None
+    def add(self, start: int, end: int, replacement: str) -> bool:
+        """
+        Add a replacement, absorbing spans it encloses.
+
+        Returns False (and changes nothing) if it partly overlaps an
+        existing span.
+        """
+        i = bisect_left(self._starts, start)
+        if i > 0 and self._spans[i - 1][1] > start:
+            return False
+        j = i
+        while j < len(self._spans) and self._spans[j][1] <= end:
+            j += 1
+        if j < len(self._spans) and self._spans[j][0] < end:
+            return False
+        self._starts[i:j] = [start]
+        self._spans[i:j] = [(start, end, replacement)]
+        return True
+
+    def apply(self) -> str:
+        """Return the content with every replacement applied."""
+        if not self._spans:
+            return self.content
+        pieces = []
+        pos = 0
+        for start, end, replacement in self._spans:
+            pieces.append(self.content[pos:start])
+            pieces.append(replacement)
+            pos = end
+        pieces.append(self.content[pos:])
+        return ''.join(pieces)
 
 
 def find_anchor_position(
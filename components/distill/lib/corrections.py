@@ -0,0 +1,253 @@
+"""
+Transcription corrections engine.
+
+Shared by canonicalize (CONFIG fixes and corrections files) and
+tools/helpers/parse-jsonl.py. Corrections are compiled into a single
+case-insensitive alternation, longest first, and applied in one pass, so
+a fix never re-matches the output of another fix ("claude" -> "Claude"
+is not then hit by "claud").
+
+Two file formats are accepted:
+
+    # Flat map (components/distill/config/corrections.yaml)
+    chat gpt: ChatGPT
+    "[music]": ""          # empty value removes the match
+
+    # List format
+    corrections:
+      - original: "misheard text"
+        corrected: "correct text"
+      - pattern: "chat gpt"
+        replacement: "ChatGPT"
+
+Contents:
+    - CorrectionEngine: Compiled matcher with case-preserving replacement
+    - get_correction_engine(): Cached engine for a tuple of (original, corrected)
+    - load_correction_pairs(): Read a corrections file in either format
+    - load_correction_engine(): Load a corrections file once, with a cache file
+"""
+
+import re
+import json
+import hashlib
+import logging
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import yaml
+    YAML_AVAILABLE = True
+except ImportError:
+    YAML_AVAILABLE = False
+
+
+DEFAULT_CORRECTIONS_PATH = Path(__file__).parent.parent / 'config' / 'corrections.yaml'
+
+# Bump when the cache file layout or parsing rules change
+CORRECTIONS_CACHE_VERSION = 1
+
+_LIST_FORMAT = re.compile(r'^corrections:\s*$', re.MULTILINE)
+_FLAT_ENTRY = re.compile(r'^"?([^"]+)"?\s*:\s*"?([^"]*)"?$')
+
+
+class CorrectionEngine:
+    """
+    Compiled transcription corrections.
+
+    Matching is case-insensitive and bounded at word edges, so "api" does
+    not fire inside "capital". The replacement is used as written, except
+    that an all-lowercase replacement is capitalized when the matched text
+    starts with a capital (sentence-initial words keep their capital).
+    An empty replacement removes the match.
+
+    When two entries differ only in case, the first one wins.
+    """
+
+    def __init__(self, pairs: Sequence[Tuple[str, str]]):
+        self.pairs: List[Tuple[str, str]] = []
+        self._lookup: Dict[str, int] = {}  # lowercased original -> index
+        for original, corrected in pairs:
+            if not original:
+                continue
+            key = original.lower()
+            if key in self._lookup:
+                continue
+            self._lookup[key] = len(self.pairs)
+            self.pairs.append((original, corrected or ''))
+
+        ordered = sorted(self.pairs, key=lambda pair: len(pair[0]), reverse=True)
+        self.pattern = (
+            re.compile('|'.join(_guarded(original) for original, _ in ordered), re.IGNORECASE)
+            if ordered else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def index_of(self, original: str) -> Optional[int]:
+        """Return the index into self.pairs that handles original, if any."""
+        return self._lookup.get(original.lower()) if original else None
+
+    def _index_for(self, matched: str) -> int:
+        index = self._lookup.get(matched.lower())
+        if index is not None:
+            return index
+        # Case folding that doesn't round-trip through lower()
+        for i, (original, _) in enumerate(self.pairs):
+            if re.fullmatch(re.escape(original), matched, re.IGNORECASE):
+                return i
+        raise KeyError(matched)
+
+    def apply(self, text: str) -> Tuple[str, Dict[int, int]]:
+        """
+        Apply all corrections in one pass.
+
+        Returns:
+            Tuple of (corrected_text, hits per index into self.pairs)
+        """
+        hits: Dict[int, int] = {}
+        if self.pattern is None or not text:
+            return text, hits
+
+        def _replace(match):
+            matched = match.group(0)
+            index = self._index_for(matched)
+            hits[index] = hits.get(index, 0) + 1
+            return _match_case(matched, self.pairs[index][1])
+
+        return self.pattern.sub(_replace, text), hits
+
+
+def _guarded(original: str) -> str:
+    """Escape a term, requiring word boundaries where it starts/ends with a word char."""
+    pattern = re.escape(original)
+    if re.match(r'\w', original):
+        pattern = r'(?<!\w)' + pattern
+    if re.search(r'\w$', original):
+        pattern = pattern + r'(?!\w)'
+    return pattern
+
+
+def _match_case(matched: str, corrected: str) -> str:
+    if corrected and corrected.islower() and matched[:1].isupper():
+        return corrected[0].upper() + corrected[1:]
+    return corrected
+
+
+@lru_cache(maxsize=64)
+def get_correction_engine(pairs: Tuple[Tuple[str, str], ...]) -> CorrectionEngine:
+    """Return the compiled engine for a set of corrections, cached per process."""
+    return CorrectionEngine(pairs)
+
+
+def load_correction_pairs(path: Path) -> List[Tuple[str, str]]:
+    """
+    Read (original, corrected) pairs from a corrections file.
+
+    The flat format is parsed without PyYAML so the standalone helper
+    scripts work without it; the list format needs PyYAML.
+
+    Returns:
+        List of pairs in file order; empty if the file is missing or unreadable
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+
+    try:
+        text = path.read_text(encoding='utf-8')
+    except OSError as e:
+        logging.warning(f"Failed to load corrections file: {e}")
+        return []
+
+    return _parse_correction_text(text)
+
+
+def _parse_correction_text(text: str) -> List[Tuple[str, str]]:
+    pairs = []
+
+    if _LIST_FORMAT.search(text):
+        if not YAML_AVAILABLE:
+            logging.warning("PyYAML not available, cannot load corrections file")
+            return []
+        try:
+            data = yaml.safe_load(text) or {}
+        except Exception as e:
+            logging.warning(f"Failed to load corrections file: {e}")
+            return []
+        for item in data.get('corrections', []):
+            if isinstance(item, dict):
+                # Support both 'original'/'corrected' and 'pattern'/'replacement'
+                original = item.get('original') or item.get('pattern', '')
+                corrected = item.get('corrected') or item.get('replacement', '')
+                if original and corrected:
+                    pairs.append((str(original), str(corrected)))
+        return pairs
+
+    for line in text.splitlines():
+        line = line.strip()
+        # Skip comments and empty lines
+        if not line or line.startswith('#'):
+            continue
+        match = _FLAT_ENTRY.match(line)
+        if match:
+            wrong, correct = match.groups()
+            pairs.append((wrong.strip(), correct.strip()))
+    return pairs
+
+
+def _cache_path(path: Path) -> Path:
+    return path.with_name(f'.{path.stem}.cache.json')
+
+
+def load_correction_engine(
+    path: Optional[Path] = None,
+    use_cache: bool = True
+) -> CorrectionEngine:
+    """
+    Load and compile a corrections file.
+
+    The parsed pairs are written to a hidden cache file next to the YAML,
+    keyed by the YAML's sha256, so later runs skip parsing until the file
+    changes. Within a process the compiled engine is shared.
+
+    Args:
+        path: Corrections file (default: components/distill/config/corrections.yaml)
+        use_cache: Read and write the cache file
+
+    Returns:
+        CorrectionEngine (empty if the file is missing)
+    """
+    path = Path(path) if path is not None else DEFAULT_CORRECTIONS_PATH
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return get_correction_engine(())
+
+    digest = hashlib.sha256(raw).hexdigest()
+    cache_path = _cache_path(path)
+
+    pairs = None
+    if use_cache:
+        try:
+            cached = json.loads(cache_path.read_text(encoding='utf-8'))
+            if cached.get('version') == CORRECTIONS_CACHE_VERSION and cached.get('sha256') == digest:
+                pairs = [tuple(pair) for pair in cached['pairs']]
+        except (OSError, ValueError, KeyError, TypeError):
+            pairs = None
+
+    if pairs is None:
+        pairs = _parse_correction_text(raw.decode('utf-8'))
+        if use_cache:
+            payload = {
+                'version': CORRECTIONS_CACHE_VERSION,
+                'sha256': digest,
+                'pairs': [list(pair) for pair in pairs],
+            }
+            try:
+                cache_path.write_text(json.dumps(payload, indent=1) + '\n', encoding='utf-8')
+            except OSError:
+                pass  # Read-only checkout: just skip the cache
+
+    return get_correction_engine(tuple(pairs))
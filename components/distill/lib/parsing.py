@@ -8,6 +8,7 @@ This module handles parsing the two main structured elements in exports:
 Contents:
     - parse_messages(): Split raw export into individual messages
     - clean_message_content(): Remove UI artifacts from message text
+    - remove_ui_artifacts(): Remove UI_ARTIFACTS lines in one scan
     - extract_config_block(): Extract the YAML-ish config block
     - parse_yaml_like_block(): Parse YAML-ish config into dict
     - parse_config_block(): Convert config dict to ExportConfig
@@ -65,6 +66,25 @@ UI_ARTIFACTS = [
     re.compile(r'^---\s*$', re.MULTILINE),
 ]
 
+
+def _combine_line_patterns(patterns: List['re.Pattern']) -> 're.Pattern':
+    """
+    Fuse anchored ^...$ line patterns into one MULTILINE alternation.
+
+    Alternatives keep their list order and per-pattern flags; alternative
+    i is the named group "a<i>" so a match reports which pattern hit.
+    """
+    alternatives = []
+    for i, pattern in enumerate(patterns):
+        body = pattern.pattern[1:]  # drop the leading ^
+        if pattern.flags & re.IGNORECASE:
+            body = f'(?i:{body})'
+        alternatives.append(f'(?P<a{i}>{body})')
+    return re.compile('^(?:' + '|'.join(alternatives) + ')', re.MULTILINE)
+
+
+UI_ARTIFACT_LINE_PATTERN = _combine_line_patterns(UI_ARTIFACTS)
+
 # Pattern for Claude's thinking summaries
 THINKING_SUMMARY_PATTERN = re.compile(
     r'^[A-Z][a-z].*?(?:ing|ed|ion)\s+.*?\.\s*$',
@@ -124,6 +144,26 @@ WHISPER_OSERROR_PATTERN = re.compile(
     r'\s*Skipping\s+/[^\s]+\s+due to OSError:\s*\[Errno \d+\][^\n]*'
 )
 
+# Bruba/Whisper cleanup passes in application order: (markers, pattern,
+# replacement). Each pattern needs one of its literal markers to match, so
+# the pass is skipped when none is present, which is most messages.
+BRUBA_ARTIFACT_PASSES = [
+    # Transform media-only messages (audio with no transcript)
+    (('[media attached:',), BRUBA_MEDIA_ONLY_PATTERN, '[attached audio file with no transcript]'),
+    # Transform audio messages with transcript - output "[Transcript] X"
+    (('[Audio]',), BRUBA_AUDIO_WITH_TRANSCRIPT_PATTERN, '[Transcript] '),
+    # Remove standalone Signal/Telegram metadata prefixes
+    (('[Signal', '[Telegram'), BRUBA_METADATA_PREFIX_PATTERN, ''),
+    # Remove standalone media tags
+    (('<media:audio>',), BRUBA_MEDIA_TAG_PATTERN, ''),
+    # Clean Whisper transcription noise from transcript content
+    (('Detecting language',), WHISPER_LANG_DETECTION_PATTERN, ''),
+    (('-->',), WHISPER_TIMESTAMP_PATTERN, ''),
+    (('due to OSError:',), WHISPER_OSERROR_PATTERN, ''),
+]
+
+EXCESS_BLANK_LINES_PATTERN = re.compile(r'\n{4,}')
+
 
 def parse_messages(content: str) -> List[Message]:
     """
@@ -188,25 +228,44 @@ def clean_bruba_artifacts(content: str) -> str:
         Cleaned content with Bruba artifacts transformed
     """
     result = content
+    for markers, pattern, replacement in BRUBA_ARTIFACT_PASSES:
+        if any(marker in result for marker in markers):
+            result = pattern.sub(replacement, result)
+    return result
 
-    # Transform media-only messages (audio with no transcript)
-    result = BRUBA_MEDIA_ONLY_PATTERN.sub('[attached audio file with no transcript]', result)
-
-    # Transform audio messages with transcript - output "[Transcript] X"
-    result = BRUBA_AUDIO_WITH_TRANSCRIPT_PATTERN.sub('[Transcript] ', result)
-
-    # Remove standalone Signal/Telegram metadata prefixes
-    result = BRUBA_METADATA_PREFIX_PATTERN.sub('', result)
-
-    # Remove standalone media tags
-    result = BRUBA_MEDIA_TAG_PATTERN.sub('', result)
 
-    # Clean Whisper transcription noise from transcript content
-    result = WHISPER_LANG_DETECTION_PATTERN.sub('', result)
-    result = WHISPER_TIMESTAMP_PATTERN.sub('', result)
-    result = WHISPER_OSERROR_PATTERN.sub('', result)
-
-    return result
+def remove_ui_artifacts(content: str) -> str:
+    """
+    Remove UI_ARTIFACTS lines in a single scan.
+
+    Gives the same result as applying each UI_ARTIFACTS pattern in turn
+    with re.sub. Each pattern ends in \\s*$, so a removal also swallows the
+    blank lines after it, up to the next line still present at that
+    point. For a run of adjacent artifact lines, that leaves one line
+    break for each artifact whose pattern comes no earlier in the list
+    than every artifact before it in the run.
+
+    The one case not reproduced: an artifact split across lines by another
+    artifact (e.g. "5", "Claude", "steps" on consecutive lines), which the
+    sequential passes would join up and remove.
+    """
+    pieces = []
+    pos = 0
+    run_max = -1  # latest pattern index in the current run of artifacts
+    for match in UI_ARTIFACT_LINE_PATTERN.finditer(content):
+        index = int(match.lastgroup[1:])
+        gap = content[pos:match.start()]
+        if run_max >= 0 and gap == '\n':
+            # Adjacent to the previous artifact
+            if index >= run_max:
+                pieces.append(gap)
+                run_max = index
+        else:
+            pieces.append(gap)
+            run_max = index
+        pos = match.end()
+    pieces.append(content[pos:])
+    return ''.join(pieces)
 
 
 def clean_message_content(content: str, role: str = "UNKNOWN") -> str:
@@ -220,27 +279,23 @@ def clean_message_content(content: str, role: str = "UNKNOWN") -> str:
     Returns:
         Cleaned content
     """
-    result = content
-
     # Apply Bruba/Signal artifact cleanup first (transforms format)
-    result = clean_bruba_artifacts(result)
+    result = clean_bruba_artifacts(content)
 
-    # Remove UI artifact patterns
-    for pattern in UI_ARTIFACTS:
-        result = pattern.sub('', result)
+    # Remove UI artifact lines (all UI_ARTIFACTS in one scan)
+    result = remove_ui_artifacts(result)
 
     # Remove thinking summaries at the very start of ASSISTANT messages only
     # These are lines like "Thinking about how to help..." or "Evaluated options..."
     if role == "ASSISTANT":
-        lines = result.split('\n')
-        if lines and THINKING_SUMMARY_PATTERN.match(lines[0].strip()):
-            first_line = lines[0].strip()
-            if len(first_line) < 100 and first_line.endswith('.'):
-                lines = lines[1:]
-        result = '\n'.join(lines)
+        newline = result.find('\n')
+        first_line = (result if newline == -1 else result[:newline]).strip()
+        if (THINKING_SUMMARY_PATTERN.match(first_line)
+                and len(first_line) < 100 and first_line.endswith('.')):
+            result = '' if newline == -1 else result[newline + 1:]
 
     # Collapse multiple blank lines into max 2
-    result = re.sub(r'\n{4,}', '\n\n\n', result)
+    result = EXCESS_BLANK_LINES_PATTERN.sub('\n\n\n', result)
 
     # Strip leading/trailing whitespace
     result = result.strip()
@@ -0,0 +1,400 @@
+"""
+Full-text search index over sessions and canonical files.
+
+Every message of every indexed file is a row in a SQLite database with an
+FTS5 index, carrying its source path, session id, message index, role and
+timestamp. `distill index` brings the database up to date and
+`distill search` queries it, ranked by bm25.
+
+Indexed by default (from the bruba-godo root):
+    agents/*/sessions/*.jsonl   Pulled Clawdbot sessions
+    agents/*/intake/*.md        Delimited markdown not converted from an indexed session
+    reference/**/*.md           Canonical files
+
+Updates are incremental. Unchanged files are skipped by size and mtime.
+A session that only grew is read from where the last run stopped, so
+following an active session costs O(new bytes), as in
+follow_session_file(). Any other change reindexes just that file. Files
+that disappeared are dropped. Source paths are stored absolute.
+
+Contents:
+    - SearchHit: One ranked message hit
+    - IndexStats: What an update did
+    - SearchIndex: The database (update(), search())
+    - default_index_roots(): Default directories to index
+    - fts_query(): Turn plain words into a safe FTS5 query
+"""
+
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .clawdbot_parser import (
+    SessionCursor,
+    SessionInfo,
+    hash_session_head,
+    iter_appended_messages,
+)
+
+
+DEFAULT_INDEX_PATH = Path('.distill-index.sqlite')
+
+# Bump when the schema or what gets indexed changes; the database is rebuilt
+SEARCH_INDEX_VERSION = 1
+
+# Leading session bytes hashed to tell growth from replacement
+_HEAD_BYTES = 4096
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    kind TEXT NOT NULL,             -- 'session' (JSONL) or 'markdown'
+    session_id TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    indexed_bytes INTEGER NOT NULL, -- sessions: complete lines consumed
+    message_index INTEGER NOT NULL, -- sessions: last message index seen
+    head_sha256 TEXT
+);
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    source_id INTEGER NOT NULL REFERENCES sources(id),
+    message_index INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    timestamp TEXT,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS messages_source ON messages(source_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    content,
+    content='messages',
+    content_rowid='id',
+    tokenize='porter unicode61'
+);
+"""
+
+
+@dataclass
+class SearchHit:
+    """One message matching a search, best first."""
+    path: str
+    session_id: Optional[str]
+    message_index: int
+    role: str
+    timestamp: Optional[str]
+    snippet: str
+    score: float
+
+
+@dataclass
+class IndexStats:
+    """What SearchIndex.update() did."""
+    files_seen: int = 0
+    files_unchanged: int = 0
+    files_appended: int = 0
+    files_reindexed: int = 0
+    files_removed: int = 0
+    messages_added: int = 0
+
+
+def default_index_roots(base: Path = Path('.')) -> List[Path]:
+    """Session, intake and reference directories under base that exist."""
+    roots = sorted(base.glob('agents/*/sessions')) + sorted(base.glob('agents/*/intake'))
+    if (base / 'reference').is_dir():
+        roots.append(base / 'reference')
+    return roots
+
+
+def fts_query(text: str) -> str:
+    """
+    Quote each word of a plain query so FTS5 syntax characters are literal.
+
+    All words must match ("cleanup-reminders.py" is one quoted term).
+    """
+    return ' '.join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def _iter_source_files(roots: Sequence[Path]) -> Iterator[Path]:
+    """Yield indexable files under roots, sessions first so intake copies can be skipped."""
+    files = []
+    for root in roots:
+        if root.is_file():
+            files.append(root)
+            continue
+        for path in root.rglob('*'):
+            if path.suffix in ('.jsonl', '.md') and not path.name.startswith('.') and path.is_file():
+                files.append(path)
+    files.sort(key=lambda path: (path.suffix != '.jsonl', str(path)))
+    return iter(files)
+
+
+def _markdown_messages(path: Path) -> Tuple[Optional[str], List[Tuple[int, str, Optional[str], str]]]:
+    """
+    Read (session_id, [(message_index, role, timestamp, content), ...]) from markdown.
+
+    Canonical files take their date from frontmatter; delimited intake
+    files have none. Files without message delimiters are one message.
+    """
+    from .parsing import parse_messages
+    from .variants import parse_canonical_file
+
+    text = path.read_text(encoding='utf-8', errors='replace')
+    timestamp = None
+    session_id = path.stem
+    try:
+        config, text, _ = parse_canonical_file(text)
+        timestamp = config.date or None
+        session_id = config.slug or session_id
+    except ValueError:
+        pass  # Not canonical: plain delimited markdown
+
+    messages = [
+        (msg.index, msg.role.lower(), timestamp, msg.content.strip())
+        for msg in parse_messages(text)
+        if msg.content.strip()
+    ]
+    return session_id, messages
+
+
+class SearchIndex:
+    """
+    SQLite/FTS5 message index.
+
+    Usage:
+        with SearchIndex(path) as index:
+            index.update(default_index_roots())
+            hits = index.search(fts_query("cleanup reminders"))
+    """
+
+    def __init__(self, path: Path = DEFAULT_INDEX_PATH):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self._check_version()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _check_version(self):
+        self.conn.executescript(_SCHEMA)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        if row is not None and row[0] == str(SEARCH_INDEX_VERSION):
+            return
+        if row is not None:
+            # Written by another version: start over
+            self.conn.executescript("""
+                DROP TABLE IF EXISTS messages_fts;
+                DROP TABLE IF EXISTS messages;
+                DROP TABLE IF EXISTS sources;
+                DROP TABLE IF EXISTS meta;
+            """)
+            self.conn.executescript(_SCHEMA)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+            (str(SEARCH_INDEX_VERSION),)
+        )
+        self.conn.commit()
+
+    # --- Updating ---
+
+    def update(self, roots: Sequence[Path]) -> IndexStats:
+        """
+        Bring the index up to date with the files under roots.
+
+        Each file is committed on its own, so an interrupted update keeps
+        the work done so far. Indexed files under roots that no longer
+        exist are removed.
+        """
+        stats = IndexStats()
+        seen = set()
+        session_stems = set()
+        # Paths are stored resolved, so relative and absolute roots agree
+        roots = [Path(root).resolve() for root in roots]
+
+        for path in _iter_source_files(roots):
+            if path.suffix == '.md' and path.stem in session_stems:
+                continue  # Converted from a session already indexed
+            if path.suffix == '.jsonl':
+                session_stems.add(path.stem)
+
+            key = str(path)
+            seen.add(key)
+            stats.files_seen += 1
+            try:
+                self._update_file(path, key, stats)
+            except (OSError, UnicodeDecodeError, ValueError):
+                self.conn.rollback()
+                continue
+            self.conn.commit()
+
+        stats.files_removed = self._remove_missing(roots, seen)
+        self.conn.commit()
+        return stats
+
+    def _update_file(self, path: Path, key: str, stats: IndexStats):
+        st = path.stat()
+        row = self.conn.execute(
+            "SELECT id, size, mtime_ns, indexed_bytes, message_index, head_sha256 "
+            "FROM sources WHERE path = ?", (key,)
+        ).fetchone()
+
+        if row is not None and row[1] == st.st_size and row[2] == st.st_mtime_ns:
+            stats.files_unchanged += 1
+            return
+
+        if path.suffix == '.jsonl':
+            source_id, offset, message_index = None, 0, 0
+            if row is not None:
+                source_id, _, _, indexed_bytes, last_index, head = row
+                if (st.st_size >= indexed_bytes and
+                        hash_session_head(path, min(indexed_bytes, _HEAD_BYTES)) == head):
+                    offset, message_index = indexed_bytes, last_index
+                else:
+                    self._delete_messages(source_id)
+            if offset:
+                stats.files_appended += 1
+            else:
+                stats.files_reindexed += 1
+            self._index_session(path, key, st, source_id, offset, message_index, stats)
+        else:
+            if row is not None:
+                self._delete_messages(row[0])
+            stats.files_reindexed += 1
+            self._index_markdown(path, key, st, row[0] if row else None, stats)
+
+    def _index_session(self, path, key, st, source_id, offset, message_index, stats):
+        cursor = SessionCursor(offset, message_index)
+        session = SessionInfo()
+        if source_id is not None:
+            existing = self.conn.execute(
+                "SELECT session_id FROM sources WHERE id = ?", (source_id,)
+            ).fetchone()
+            session.session_id = existing[0] if existing else None
+
+        with open(path, 'rb') as f:
+            rows = [
+                (msg.index, msg.role, msg.timestamp.isoformat() if msg.timestamp else None, msg.content)
+                for msg in iter_appended_messages(f, cursor, session, include_timestamps=True)
+            ]
+
+        source_id = self._save_source(
+            source_id, key, 'session', session.session_id or path.stem, st,
+            cursor.offset, cursor.message_index,
+            hash_session_head(path, min(cursor.offset, _HEAD_BYTES))
+        )
+        stats.messages_added += self._insert_messages(source_id, rows)
+
+    def _index_markdown(self, path, key, st, source_id, stats):
+        session_id, rows = _markdown_messages(path)
+        source_id = self._save_source(
+            source_id, key, 'markdown', session_id, st, st.st_size, len(rows), None
+        )
+        stats.messages_added += self._insert_messages(source_id, rows)
+
+    def _save_source(self, source_id, key, kind, session_id, st, indexed_bytes, message_index, head):
+        values = (kind, session_id, st.st_size, st.st_mtime_ns, indexed_bytes, message_index, head)
+        if source_id is None:
+            return self.conn.execute(
+                "INSERT INTO sources (kind, session_id, size, mtime_ns, indexed_bytes, "
+                "message_index, head_sha256, path) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                values + (key,)
+            ).lastrowid
+        self.conn.execute(
+            "UPDATE sources SET kind = ?, session_id = ?, size = ?, mtime_ns = ?, "
+            "indexed_bytes = ?, message_index = ?, head_sha256 = ? WHERE id = ?",
+            values + (source_id,)
+        )
+        return source_id
+
+    def _insert_messages(self, source_id: int, rows: Iterable[tuple]) -> int:
+        count = 0
+        for message_index, role, timestamp, content in rows:
+            rowid = self.conn.execute(
+                "INSERT INTO messages (source_id, message_index, role, timestamp, content) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (source_id, message_index, role, timestamp, content)
+            ).lastrowid
+            self.conn.execute(
+                "INSERT INTO messages_fts (rowid, content) VALUES (?, ?)", (rowid, content)
+            )
+            count += 1
+        return count
+
+    def _delete_messages(self, source_id: int):
+        # External-content FTS5 needs the old text to remove its postings
+        self.conn.execute(
+            "INSERT INTO messages_fts (messages_fts, rowid, content) "
+            "SELECT 'delete', id, content FROM messages WHERE source_id = ?", (source_id,)
+        )
+        self.conn.execute("DELETE FROM messages WHERE source_id = ?", (source_id,))
+
+    def _remove_missing(self, roots: Sequence[Path], seen: set) -> int:
+        prefixes = tuple(str(root) if root.is_file() else str(root) + os.sep for root in roots)
+        removed = 0
+        for source_id, key in self.conn.execute("SELECT id, path FROM sources").fetchall():
+            if key in seen or not key.startswith(prefixes):
+                continue
+            self._delete_messages(source_id)
+            self.conn.execute("DELETE FROM sources WHERE id = ?", (source_id,))
+            removed += 1
+        return removed
+
+    # --- Querying ---
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        role: Optional[str] = None,
+        since: Optional[str] = None
+    ) -> List[SearchHit]:
+        """
+        Return the best-ranked messages for an FTS5 query.
+
+        Args:
+            query: FTS5 query (see fts_query() for plain words)
+            limit: Maximum hits
+            role: Only messages with this role ('user', 'assistant')
+            since: Only messages with a timestamp at or after this ISO date
+
+        Raises:
+            sqlite3.OperationalError: If the query is not valid FTS5 syntax
+        """
+        sql = (
+            "SELECT s.path, s.session_id, m.message_index, m.role, m.timestamp, "
+            "snippet(messages_fts, 0, '[', ']', '...', 16), bm25(messages_fts) "
+            "FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid "
+            "JOIN sources s ON s.id = m.source_id "
+            "WHERE messages_fts MATCH ?"
+        )
+        params: list = [query]
+        if role:
+            sql += " AND m.role = ?"
+            params.append(role.lower())
+        if since:
+            sql += " AND m.timestamp >= ?"
+            params.append(since)
+        sql += " ORDER BY bm25(messages_fts) LIMIT ?"
+        params.append(limit)
+
+        return [SearchHit(*row) for row in self.conn.execute(sql, params)]
+
+    def counts(self) -> Tuple[int, int]:
+        """Return (files, messages) in the index."""
+        files = self.conn.execute("SELECT COUNT(*) FROM sources").fetchone()[0]
+        messages = self.conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+        return files, messages
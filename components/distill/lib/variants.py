@@ -24,10 +24,12 @@ main content (conversation)
 """
 
 import re
+import hashlib
 import logging
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Callable
 
 try:
     import yaml
@@ -42,6 +44,7 @@ from .models import (
 from .parsing import (
     parse_v2_config_block, extract_backmatter
 )
+from .content import AnchorIndex, SpanEdits, normalize_for_matching
 
 
 @dataclass
@@ -54,6 +57,18 @@ class VariantOptions:
     output_dir: Optional[Path] = None  # For writing extracted code blocks
 
 
+@dataclass
+class AnchorFailure:
+    """
+    A section spec whose anchors could not be resolved to a span.
+
+    reason is one of: missing_anchor, start_not_found, end_not_found,
+    end_before_start.
+    """
+    spec: Any  # SectionSpec or SensitivitySection
+    reason: str
+
+
 @dataclass
 class VariantResult:
     """Result of variant generation."""
@@ -62,6 +77,8 @@ class VariantResult:
     summary: str = ""
     config: Optional[CanonicalConfig] = None
     backmatter: Optional[Backmatter] = None
+    anchor_failures: List[AnchorFailure] = field(default_factory=list)
+    term_hits: Dict[str, int] = field(default_factory=dict)
 
 
 def parse_canonical_file(content: str) -> Tuple[CanonicalConfig, str, Backmatter]:
@@ -124,18 +141,127 @@ def parse_canonical_file(content: str) -> Tuple[CanonicalConfig, str, Backmatter
     return config, main_content, backmatter
 
 
+class DocumentCache:
+    """
+    Per-run cache of file contents and parse results.
+
+    Export visits the same canonical files once per profile and once per
+    agent. The cache reads and parses each file at most once per run,
+    keyed by path plus (mtime, size) so an edit mid-run is picked up.
+
+    Parse failures are cached too and re-raised on every lookup, so each
+    profile still reports the error the same way.
+    """
+
+    def __init__(self):
+        self._texts: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+        self._parsed: Dict[Tuple[Path, Callable], Tuple[Tuple[int, int], Any, Optional[Exception]]] = {}
+        self._digests: Dict[Path, Tuple[Tuple[int, int], str]] = {}
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def read(self, path: Path) -> str:
+        """Return the text of path, reading it only if not cached or changed."""
+        stamp = self._stamp(path)
+        entry = self._texts.get(path)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, path.read_text(encoding='utf-8'))
+            self._texts[path] = entry
+        return entry[1]
+
+    def digest(self, path: Path) -> str:
+        """Return the sha256 hex digest of the text of path."""
+        content = self.read(path)
+        stamp = self._texts[path][0]
+        entry = self._digests.get(path)
+        if entry is None or entry[0] != stamp:
+            entry = (stamp, hashlib.sha256(content.encode('utf-8')).hexdigest())
+            self._digests[path] = entry
+        return entry[1]
+
+    def parse(self, path: Path, parser: Callable[[str], Any] = parse_canonical_file) -> Any:
+        """
+        Return parser(contents of path), parsing only once per file version.
+
+        Defaults to parse_canonical_file, which yields
+        (config, main_content, backmatter).
+        """
+        content = self.read(path)
+        stamp = self._texts[path][0]
+        key = (path, parser)
+        entry = self._parsed.get(key)
+        if entry is None or entry[0] != stamp:
+            try:
+                entry = (stamp, parser(content), None)
+            except Exception as e:
+                entry = (stamp, None, e)
+            self._parsed[key] = entry
+        if entry[2] is not None:
+            raise entry[2]
+        return entry[1]
+
+
+def _resolve_span(
+    index: AnchorIndex,
+    edits: SpanEdits,
+    start_anchor: str,
+    end_anchor: str
+) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+    """
+    Resolve a start/end anchor pair against the original text.
+
+    Matches that touch spans already claimed by earlier edits are skipped,
+    the same way a search over the already-edited text would not see them.
+
+    Returns:
+        (start_pos, end_pos, None) where end_pos is the start of the end
+        anchor, or (None, None, reason) on failure
+    """
+    search_from = 0
+    while True:
+        start_pos = index.find(start_anchor, search_from)
+        if start_pos is None:
+            return None, None, 'start_not_found'
+        claimed = edits.covering(start_pos, start_pos + len(start_anchor))
+        if claimed is None:
+            break
+        search_from = max(start_pos + 1, claimed[1]) if claimed[0] <= start_pos else start_pos + 1
+
+    search_from = start_pos
+    while True:
+        end_pos = index.find(end_anchor, search_from)
+        if end_pos is None:
+            return None, None, 'end_not_found'
+        claimed = edits.covering(end_pos, end_pos + len(end_anchor))
+        if claimed is None:
+            return start_pos, end_pos, None
+        search_from = max(end_pos + 1, claimed[1]) if claimed[0] <= end_pos else end_pos + 1
+
+
 def apply_section_removals(
     content: str,
     sections: List[SectionSpec],
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    failures: Optional[List[AnchorFailure]] = None
 ) -> Tuple[str, int]:
     """
     Apply anchor-based section removals to content.
 
+    All anchors are resolved against the original content and the
+    removals applied in one pass. A section enclosing earlier removals
+    replaces them; one that only partly overlaps an earlier removal is
+    resolved against the text edited so far, so the result matches
+    applying each section in turn.
+
     Args:
         content: The content to process
         sections: List of SectionSpec objects defining what to remove
         logger: Optional logger for reporting
+        failures: Optional list to collect an AnchorFailure for each
+            section that could not be applied
 
     Returns:
         Tuple of (modified_content, sections_removed_count)
@@ -143,113 +269,156 @@ def apply_section_removals(
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    result = content
+    if failures is None:
+        failures = []
+
+    index = AnchorIndex(content)
+    edits = SpanEdits(content)
     removed_count = 0
 
     for spec in sections:
         if not spec.start or not spec.end:
             logger.warning(f"Skipping section with missing start/end anchor")
+            failures.append(AnchorFailure(spec, 'missing_anchor'))
             continue
 
-        # Find start anchor
-        start_pos = _fuzzy_find(result, spec.start)
-        if start_pos is None:
+        span, reason = _removal_span(index, edits, spec)
+        if span is not None and not edits.add(*span):
+            # Partly overlaps an earlier removal: apply the plan so far and
+            # resolve this section against the edited text instead
+            edits = SpanEdits(edits.apply())
+            index = AnchorIndex(edits.content)
+            span, reason = _removal_span(index, edits, spec)
+            if span is not None:
+                edits.add(*span)
+
+        if reason == 'start_not_found':
             logger.warning(f"Start anchor not found: {spec.start[:50]}...")
-            continue
-
-        # Find end anchor (must be after start)
-        end_pos = _fuzzy_find(result[start_pos:], spec.end)
-        if end_pos is None:
+        elif reason == 'end_not_found':
             logger.warning(f"End anchor not found: {spec.end[:50]}...")
+        elif reason == 'end_before_start':
+            logger.warning(f"End anchor appears before start anchor")
+        if reason:
+            failures.append(AnchorFailure(spec, reason))
             continue
 
-        # Convert relative position to absolute
-        end_pos = start_pos + end_pos
+        removed_count += 1
+        logger.debug(f"Removed section: {spec.description or spec.start[:30]}...")
 
-        # Find the actual end (include the anchor text)
-        end_anchor_match = re.search(re.escape(spec.end), result[end_pos:end_pos + len(spec.end) + 100])
-        if end_anchor_match:
-            end_pos = end_pos + end_anchor_match.end()
+    return edits.apply(), removed_count
 
-        if end_pos <= start_pos:
-            logger.warning(f"End anchor appears before start anchor")
-            continue
 
-        # Build replacement text
-        if spec.replacement:
-            replacement = f"\n\n{spec.replacement}\n\n"
-        elif spec.description:
-            replacement = f"\n\n[Removed: {spec.description}]\n\n"
-        else:
-            replacement = "\n\n[Section removed]\n\n"
+def _removal_span(
+    index: AnchorIndex,
+    edits: SpanEdits,
+    spec: SectionSpec
+) -> Tuple[Optional[Tuple[int, int, str]], Optional[str]]:
+    """
+    Resolve a section removal to (start, end, replacement) in edits.content.
 
-        result = result[:start_pos] + replacement + result[end_pos:]
-        removed_count += 1
-        logger.debug(f"Removed section: {spec.description or spec.start[:30]}...")
+    Returns:
+        (span, None), or (None, reason) if the anchors don't resolve
+    """
+    start_pos, end_pos, reason = _resolve_span(index, edits, spec.start, spec.end)
+    if reason:
+        return None, reason
+
+    # Find the actual end (include the anchor text)
+    content = edits.content
+    end_anchor_match = re.search(re.escape(spec.end), content[end_pos:end_pos + len(spec.end) + 100])
+    if end_anchor_match:
+        end_pos = end_pos + end_anchor_match.end()
+
+    if end_pos <= start_pos:
+        return None, 'end_before_start'
+
+    # Build replacement text
+    if spec.replacement:
+        replacement = f"\n\n{spec.replacement}\n\n"
+    elif spec.description:
+        replacement = f"\n\n[Removed: {spec.description}]\n\n"
+    else:
+        replacement = "\n\n[Section removed]\n\n"
 
-    return result, removed_count
+    return (start_pos, end_pos, replacement), None
 
 
 def _fuzzy_find(content: str, anchor: str) -> Optional[int]:
     """
     Find anchor position using fuzzy matching.
 
-    First tries exact match, then normalized matching.
+    First tries exact match, then case-insensitive, then normalized
+    matching. See AnchorIndex for repeated lookups on the same content.
     """
-    # Try exact match first
-    pos = content.find(anchor)
-    if pos != -1:
-        return pos
-
-    # Try case-insensitive
-    pos = content.lower().find(anchor.lower())
-    if pos != -1:
-        return pos
-
-    # Try normalized (remove punctuation, collapse whitespace)
-    normalized_anchor = _normalize_for_matching(anchor)
-    if not normalized_anchor:
-        return None
-
-    # Search through content word by word
-    anchor_words = normalized_anchor.split()
-    if not anchor_words:
-        return None
-
-    first_word = anchor_words[0]
-    search_start = 0
-
-    while search_start < len(content):
-        # Find first word
-        idx = content.lower().find(first_word.lower(), search_start)
-        if idx == -1:
-            break
+    return AnchorIndex(content).find(anchor)
 
-        # Check if the full normalized anchor matches
-        chunk_end = min(idx + len(anchor) + 50, len(content))
-        chunk = content[idx:chunk_end]
-        normalized_chunk = _normalize_for_matching(chunk)
 
-        if normalized_chunk.startswith(normalized_anchor):
-            return idx
+def _normalize_for_matching(text: str) -> str:
+    """Normalize text for fuzzy anchor matching."""
+    return normalize_for_matching(text)
 
-        search_start = idx + 1
 
-    return None
+class TermMatcher:
+    """
+    Case-insensitive matcher for a set of sensitive terms.
 
+    All terms are compiled into one alternation, longest first, so a
+    document is redacted in a single pass and a term that contains
+    another ("Bobby" vs "Bob") wins over the shorter one.
+    """
 
-def _normalize_for_matching(text: str) -> str:
-    """Normalize text for fuzzy anchor matching."""
-    normalized = re.sub(r'[,;:!?\-\—\–\.\'\"]', '', text)
-    normalized = re.sub(r'\s+', ' ', normalized)
-    return normalized.lower().strip()
+    def __init__(self, terms: Tuple[str, ...]):
+        self.terms: Dict[str, str] = {}  # lowercased term -> term as given
+        for term in terms:
+            self.terms.setdefault(term.lower(), term)
+        ordered = sorted(self.terms.values(), key=len, reverse=True)
+        self.pattern = (
+            re.compile('|'.join(re.escape(t) for t in ordered), re.IGNORECASE)
+            if ordered else None
+        )
+
+    def _term_for(self, matched: str) -> str:
+        term = self.terms.get(matched.lower())
+        if term is not None:
+            return term
+        # Case folding that doesn't round-trip through lower()
+        for term in self.terms.values():
+            if re.fullmatch(re.escape(term), matched, re.IGNORECASE):
+                return term
+        return matched
+
+    def redact(self, content: str, replacement: str = '[REDACTED]') -> Tuple[str, Dict[str, int]]:
+        """
+        Replace every term occurrence.
+
+        Returns:
+            Tuple of (redacted_content, hits per term)
+        """
+        hits: Dict[str, int] = {}
+        if self.pattern is None:
+            return content, hits
+
+        def _replace(match):
+            term = self._term_for(match.group(0))
+            hits[term] = hits.get(term, 0) + 1
+            return replacement
+
+        return self.pattern.sub(_replace, content), hits
+
+
+@lru_cache(maxsize=256)
+def get_term_matcher(terms: Tuple[str, ...]) -> TermMatcher:
+    """Return the compiled TermMatcher for a term set, cached across files."""
+    return TermMatcher(terms)
 
 
 def apply_redaction(
     content: str,
     sensitivity: Optional[Sensitivity],
     categories: List[str],
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    failures: Optional[List[AnchorFailure]] = None,
+    term_hits: Optional[Dict[str, int]] = None
 ) -> Tuple[str, int]:
     """
     Apply sensitivity redaction to content.
@@ -263,6 +432,9 @@ def apply_redaction(
         sensitivity: Sensitivity config from canonical file (may be None)
         categories: List of categories to redact (e.g., ['health', 'personal'])
         logger: Optional logger for reporting
+        failures: Optional list to collect an AnchorFailure for each
+            matching section that could not be redacted
+        term_hits: Optional dict to accumulate occurrences redacted per term
 
     Returns:
         Tuple of (redacted_content, redaction_count)
@@ -270,6 +442,9 @@ def apply_redaction(
     if logger is None:
         logger = logging.getLogger(__name__)
 
+    if failures is None:
+        failures = []
+
     if not categories:
         return content, 0
 
@@ -283,20 +458,19 @@ def apply_redaction(
     # 1. Term-based redaction
     if sensitivity.terms:
         terms = sensitivity.terms.get_terms_for_categories(categories)
-        for term in terms:
-            if not term or not term.strip():
-                continue
-            term = term.strip()
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(term), re.IGNORECASE)
-            new_result, count = pattern.subn('[REDACTED]', result)
-            if count > 0:
-                result = new_result
+        terms = tuple(t.strip() for t in terms if t and t.strip())
+        if terms:
+            result, hits = get_term_matcher(terms).redact(result)
+            for term, count in hits.items():
                 redaction_count += count
                 logger.debug(f"Redacted term '{term}' ({count} occurrences)")
+                if term_hits is not None:
+                    term_hits[term] = term_hits.get(term, 0) + count
 
     # 2. Section-based redaction
     if sensitivity.sections:
+        index = AnchorIndex(result)
+        edits = SpanEdits(result)
         for section in sensitivity.sections:
             # Check if any of this section's tags match our categories
             matching_tags = set(section.tags) & set(categories)
@@ -304,32 +478,61 @@ def apply_redaction(
                 continue
 
             # Find section anchors
-            start_pos = _fuzzy_find(result, section.start)
-            if start_pos is None:
+            span, reason = _redaction_span(index, edits, section, matching_tags)
+            if span is not None and not edits.add(*span):
+                # Partly overlaps an earlier section: apply the plan so far
+                # and resolve this section against the edited text instead
+                edits = SpanEdits(edits.apply())
+                index = AnchorIndex(edits.content)
+                span, reason = _redaction_span(index, edits, section, matching_tags)
+                if span is not None:
+                    edits.add(*span)
+
+            if reason == 'start_not_found':
                 logger.debug(f"Could not find section start anchor: {section.start[:40]}...")
+                failures.append(AnchorFailure(section, reason))
                 continue
-
-            end_pos = _fuzzy_find(result[start_pos:], section.end)
-            if end_pos is None:
+            if reason == 'end_not_found':
                 logger.debug(f"Could not find section end anchor: {section.end[:40]}...")
+                failures.append(AnchorFailure(section, reason))
                 continue
 
-            end_pos = start_pos + end_pos + len(section.end)
-
-            # Build replacement text
-            if section.description:
-                replacement = f"\n\n[Redacted: {section.description}]\n\n"
-            else:
-                tags_str = ', '.join(matching_tags)
-                replacement = f"\n\n[Redacted: {tags_str} content]\n\n"
-
-            result = result[:start_pos] + replacement + result[end_pos:]
             redaction_count += 1
             logger.debug(f"Redacted section: {section.description or section.start[:30]}...")
 
+        result = edits.apply()
+
     return result, redaction_count
 
 
+def _redaction_span(
+    index: AnchorIndex,
+    edits: SpanEdits,
+    section: SensitivitySection,
+    matching_tags: set
+) -> Tuple[Optional[Tuple[int, int, str]], Optional[str]]:
+    """
+    Resolve a sensitive section to (start, end, replacement) in edits.content.
+
+    Returns:
+        (span, None), or (None, reason) if the anchors don't resolve
+    """
+    start_pos, end_pos, reason = _resolve_span(index, edits, section.start, section.end)
+    if reason:
+        return None, reason
+
+    end_pos = end_pos + len(section.end)
+
+    # Build replacement text
+    if section.description:
+        replacement = f"\n\n[Redacted: {section.description}]\n\n"
+    else:
+        tags_str = ', '.join(matching_tags)
+        replacement = f"\n\n[Redacted: {tags_str} content]\n\n"
+
+    return (start_pos, end_pos, replacement), None
+
+
 def process_code_blocks(
     content: str,
     blocks: List[CodeBlockSpec],
@@ -433,17 +636,20 @@ def process_code_blocks(
 
 
 def generate_variants(
-    canonical_path: Path,
+    canonical_path: Optional[Path],
     options: Optional[VariantOptions] = None,
-    logger: Optional[logging.Logger] = None
+    logger: Optional[logging.Logger] = None,
+    parsed: Optional[Tuple[CanonicalConfig, str, Backmatter]] = None
 ) -> VariantResult:
     """
     Generate transcript, transcript-lite, and summary variants from a canonical file.
 
     Args:
-        canonical_path: Path to the canonical file
+        canonical_path: Path to the canonical file (ignored if parsed is given)
         options: VariantOptions controlling which variants to generate
         logger: Optional logger for reporting
+        parsed: Already-parsed (config, main_content, backmatter), e.g. from
+            DocumentCache.parse(), to skip reading and parsing the file again
 
     Returns:
         VariantResult with generated content
@@ -458,13 +664,16 @@ def generate_variants(
     if options is None:
         options = VariantOptions()
 
-    if not canonical_path.exists():
-        raise FileNotFoundError(f"Canonical file not found: {canonical_path}")
+    if parsed is None:
+        if not canonical_path.exists():
+            raise FileNotFoundError(f"Canonical file not found: {canonical_path}")
 
-    content = canonical_path.read_text(encoding='utf-8')
+        content = canonical_path.read_text(encoding='utf-8')
 
-    # Parse the canonical file
-    config, main_content, backmatter = parse_canonical_file(content)
+        # Parse the canonical file
+        parsed = parse_canonical_file(content)
+
+    config, main_content, backmatter = parsed
     logger.info(f"Parsed canonical: {config.title or config.slug}")
 
     result = VariantResult(config=config, backmatter=backmatter)
@@ -474,14 +683,16 @@ def generate_variants(
         transcript = main_content
         if config.sections_remove:
             transcript, removed = apply_section_removals(
-                transcript, config.sections_remove, logger
+                transcript, config.sections_remove, logger,
+                failures=result.anchor_failures
             )
             logger.info(f"Applied {removed} section removals for transcript")
 
         # Apply redaction if categories specified
         if options.redact_categories:
             transcript, redacted = apply_redaction(
-                transcript, config.sensitivity, options.redact_categories, logger
+                transcript, config.sensitivity, options.redact_categories, logger,
+                failures=result.anchor_failures, term_hits=result.term_hits
             )
             if redacted > 0:
                 logger.info(f"Redacted {redacted} items in transcript")
@@ -499,7 +710,8 @@ def generate_variants(
         # Then apply sections_lite_remove
         if config.sections_lite_remove:
             lite, removed = apply_section_removals(
-                lite, config.sections_lite_remove, logger
+                lite, config.sections_lite_remove, logger,
+                failures=result.anchor_failures
             )
             logger.info(f"Applied {removed} lite section removals")
 
@@ -650,7 +862,8 @@ def generate_variants_from_content(
         transcript = main_content
         if config.sections_remove:
             transcript, removed = apply_section_removals(
-                transcript, config.sections_remove, logger
+                transcript, config.sections_remove, logger,
+                failures=result.anchor_failures
             )
             logger.info(f"Applied {removed} section removals for transcript")
         result.transcript = _build_transcript_output(config, transcript)
@@ -662,7 +875,8 @@ def generate_variants_from_content(
             lite, _ = apply_section_removals(lite, config.sections_remove, logger)
         if config.sections_lite_remove:
             lite, removed = apply_section_removals(
-                lite, config.sections_lite_remove, logger
+                lite, config.sections_lite_remove, logger,
+                failures=result.anchor_failures
             )
             logger.info(f"Applied {removed} lite section removals")
         if config.code_blocks:
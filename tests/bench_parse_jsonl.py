@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Benchmark JSONL session decoding on a synthetic session.
+
+Generates a Clawdbot-style session (default ~100 MB) in a temp directory
+and times iter_clawdbot_messages() with and without the "type" pre-filter,
+with the stdlib decoder and with orjson (if installed). Every mode must
+produce the same messages.
+
+Not collected by pytest or run_tests.py (no test_ prefix).
+
+Usage:
+    python tests/bench_parse_jsonl.py               # ~100 MB session
+    python tests/bench_parse_jsonl.py --size-mb 20
+    python tests/bench_parse_jsonl.py --keep out.jsonl
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TOOL_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(TOOL_ROOT))
+
+from components.distill.lib import clawdbot_parser
+
+
+def write_synthetic_session(path: Path, size_mb: float, seed: int = 0) -> int:
+    """
+    Write a synthetic session of about size_mb megabytes.
+
+    The mix follows real sessions: conversation messages, large tool
+    results, and bulky "custom" events (state snapshots) that the
+    converter throws away. Returns the number of lines written.
+    """
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    written = 0
+    lines = 0
+
+    with open(path, 'w', encoding='utf-8') as f:
+        def emit(obj):
+            nonlocal written, lines
+            line = json.dumps(obj) + "\n"
+            f.write(line)
+            written += len(line)
+            lines += 1
+
+        emit({"type": "session", "id": "bench0000001", "timestamp": "2026-01-26T06:03:04.901Z",
+              "cwd": "/home/bot", "env": {f"VAR_{i}": "x" * 40 for i in range(200)}})
+
+        i = 0
+        while written < target:
+            i += 1
+            timestamp = f"2026-01-26T{6 + i // 3600 % 18:02d}:{i // 60 % 60:02d}:{i % 60:02d}.000Z"
+            kind = rng.random()
+            if kind < 0.25:
+                emit({"type": "custom", "customType": "state-snapshot", "timestamp": timestamp,
+                      "data": {"files": [{"path": f"/work/{n}.py", "text": "line\n" * 80}
+                                         for n in range(rng.randint(5, 40))]}})
+            elif kind < 0.45:
+                emit({"type": "message", "id": f"t{i}", "timestamp": timestamp,
+                      "message": {"role": "toolResult", "content": [
+                          {"type": "text", "text": "output " * rng.randint(50, 3000)}]}})
+            else:
+                role = "user" if kind < 0.7 else "assistant"
+                blocks = [{"type": "text", "text": f"message {i} " + "lorem ipsum " * rng.randint(5, 400)}]
+                if role == "assistant" and rng.random() < 0.4:
+                    blocks.insert(0, {"type": "thinking", "thinking": "hmm " * rng.randint(20, 500)})
+                emit({"type": "message", "id": f"m{i}", "timestamp": timestamp,
+                      "message": {"role": role, "content": blocks}})
+
+    return lines
+
+
+def run_mode(path: Path, prefilter: bool, use_orjson: bool):
+    """Time one full pass over the session; returns (seconds, messages)."""
+    saved = (clawdbot_parser.SESSION_LINE_TYPES, clawdbot_parser.ORJSON_AVAILABLE)
+    clawdbot_parser.SESSION_LINE_TYPES = saved[0] if prefilter else None
+    clawdbot_parser.ORJSON_AVAILABLE = saved[1] and use_orjson
+    try:
+        started = time.perf_counter()
+        messages = [(msg.index, msg.role, msg.content)
+                    for msg in clawdbot_parser.iter_clawdbot_messages(path)]
+        return time.perf_counter() - started, messages
+    finally:
+        clawdbot_parser.SESSION_LINE_TYPES, clawdbot_parser.ORJSON_AVAILABLE = saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--size-mb', type=float, default=100, help='Session size (default: 100)')
+    parser.add_argument('--keep', metavar='PATH', help='Write the session here and keep it')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(args.keep) if args.keep else Path(tmp) / "bench-session.jsonl"
+        lines = write_synthetic_session(path, args.size_mb)
+        size_mb = path.stat().st_size / (1024 * 1024)
+        print(f"\nSynthetic session: {lines} lines, {size_mb:.1f} MB\n")
+
+        modes = [
+            ("stdlib, decode every line", False, False),
+            ("stdlib, type pre-filter", True, False),
+        ]
+        if clawdbot_parser.ORJSON_AVAILABLE:
+            modes.append(("orjson, type pre-filter", True, True))
+        else:
+            print("  (orjson not installed: skipping the orjson mode)\n")
+
+        baseline_time = None
+        baseline_messages = None
+        for label, prefilter, use_orjson in modes:
+            elapsed, messages = run_mode(path, prefilter, use_orjson)
+            if baseline_messages is None:
+                baseline_time, baseline_messages = elapsed, messages
+            assert messages == baseline_messages, f"{label}: output differs"
+            print(f"  {label:<28} {elapsed:6.2f}s  {size_mb / elapsed:7.1f} MB/s  "
+                  f"x{baseline_time / elapsed:.2f}")
+
+        print(f"\n  {len(baseline_messages)} messages, identical in every mode")
+
+
+if __name__ == "__main__":
+    main()
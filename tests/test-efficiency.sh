@@ -180,7 +180,7 @@ test_mirror_uses_find_pattern() {
 
     # Count 'test -f' calls (bad pattern)
     local test_count
-    test_count=$(grep -c 'bot_cmd.*test -f\|bot_cmd "test -f' "$script" 2>/dev/null || echo "0")
+    test_count=$(grep -c 'bot_cmd.*test -f\|bot_cmd "test -f' "$script" 2>/dev/null || true)
 
     # Check for efficient find pattern (good pattern)
     local has_find=false
@@ -2,7 +2,7 @@
 # Tests for the config-driven identity system (Phases 1-4)
 #
 # Verifies: config validation, variable substitution, prompt assembly,
-# apply_substitutions() sync, and cronjob generation.
+# shared substitution, and cronjob generation.
 #
 # Usage:
 #   ./tests/test-identity-system.sh              # Run all tests
@@ -342,50 +342,35 @@ PYEOF
 }
 
 # ============================================================
-# Category 3: apply_substitutions() Sync (2 tests)
+# Category 3: Shared Substitution (2 tests)
 # ============================================================
-test_apply_substitutions_sync() {
+test_shared_substitution() {
     echo ""
-    echo "=== Category 3: apply_substitutions() Sync ==="
+    echo "=== Category 3: Shared Substitution ==="
 
     local assemble="$ROOT_DIR/tools/assemble-prompts.sh"
     local detect="$ROOT_DIR/tools/detect-conflicts.sh"
+    local helper="$ROOT_DIR/tools/helpers/assemble-prompts.py"
 
-    # 3.1 Function exists in both files
-    local found_assemble found_detect
-    found_assemble=$(grep -c 'apply_substitutions()' "$assemble" 2>/dev/null || echo 0)
-    found_detect=$(grep -c 'apply_substitutions()' "$detect" 2>/dev/null || echo 0)
+    # 3.1 Substitution is defined once, in the assembler helper
+    local found_helper found_shell
+    found_helper=$(grep -c '^def substitute(' "$helper" 2>/dev/null || echo 0)
+    found_shell=$(cat "$assemble" "$detect" | grep -c 'apply_substitutions()' || true)
 
-    if [[ "$found_assemble" -ge 1 && "$found_detect" -ge 1 ]]; then
-        pass "3.1 apply_substitutions() exists in both files"
+    if [[ "$found_helper" -ge 1 && "$found_shell" -eq 0 ]]; then
+        pass "3.1 Substitution defined only in assemble-prompts.py"
     else
-        fail "3.1 apply_substitutions() exists in both files" "assemble=$found_assemble detect=$found_detect"
+        fail "3.1 Substitution defined only in assemble-prompts.py" "helper=$found_helper shell=$found_shell"
     fi
 
-    # 3.2 Function bodies in sync
-    # Extract the function body from each file, normalize known differences
-    local assemble_body detect_body
-    assemble_body=$(sed -n '/^apply_substitutions()/,/^}/p' "$assemble")
-    detect_body=$(sed -n '/^apply_substitutions()/,/^}/p' "$detect")
-
-    # Normalize known differences:
-    # - detect has 'local workspace="$2"' (extra param) that assemble doesn't
-    # - detect uses '$workspace' where assemble uses '$AGENT_WORKSPACE'
-    local norm_assemble norm_detect
-    norm_assemble=$(echo "$assemble_body" | \
-        sed 's/\$AGENT_WORKSPACE/\$WORKSPACE_VAR/g')
-    norm_detect=$(echo "$detect_body" | \
-        sed '/local workspace="\$2"/d' | \
-        sed 's/\$workspace/\$WORKSPACE_VAR/g')
-
-    if diff <(echo "$norm_assemble") <(echo "$norm_detect") >/dev/null 2>&1; then
-        pass "3.2 Function bodies in sync (normalized)"
+    # 3.2 Both scripts go through the helper (conflict detection loads it
+    # from detect-conflicts.py)
+    if grep -q 'helpers/assemble-prompts.py' "$assemble" && \
+       grep -q 'helpers/detect-conflicts.py' "$detect" && \
+       grep -q 'assemble-prompts.py' "$ROOT_DIR/tools/helpers/detect-conflicts.py"; then
+        pass "3.2 assemble and detect-conflicts share the helper"
     else
-        fail "3.2 Function bodies in sync (normalized)"
-        if $VERBOSE; then
-            echo "  --- Diff (after normalizing known differences) ---"
-            diff <(echo "$norm_assemble") <(echo "$norm_detect") || true
-        fi
+        fail "3.2 assemble and detect-conflicts share the helper"
     fi
 }
 
@@ -760,7 +745,7 @@ echo "========================================="
 
 test_config_validation || true
 test_identity_completeness || true
-test_apply_substitutions_sync || true
+test_shared_substitution || true
 test_substitution_completeness || true
 test_variable_roundtrip || true
 test_cronjob_generation || true
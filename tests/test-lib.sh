@@ -730,6 +730,160 @@ EOF
     teardown
 }
 
+# ============================================================
+# Test: load_agent_config sets AGENT_* from one config read
+# ============================================================
+test_load_agent_config() {
+    echo ""
+    echo "=== Test: load_agent_config sets identity and variables ==="
+    setup
+
+    cat > "$TEMP_DIR/config.yaml" << 'EOF'
+agents:
+  test-main:
+    workspace: /Users/testuser/agents/test-main
+    prompts: [agents, tools]
+    content_pipeline: true
+    identity:
+      human_name: Pat O'Brien
+      signal_uuid: uuid-1234
+      peer_agent: test-rex
+    variables:
+      GREETING: "Hi $USER `date`"
+  test-rex:
+    identity:
+      human_name: Sam
+EOF
+
+    mkdir -p "$TEMP_DIR/tools/helpers"
+    cp "$ROOT_DIR/tools/helpers/config-env.py" "$ROOT_DIR/tools/helpers/parse-yaml.py" "$TEMP_DIR/tools/helpers/"
+
+    local exit_code=0
+    (
+        cd "$TEMP_DIR"
+        source "$TEMP_DIR/tools/lib.sh"
+        ROOT_DIR="$TEMP_DIR"
+        load_agent_config test-main
+
+        [[ "$AGENT_WORKSPACE" == "/Users/testuser/agents/test-main" ]] || exit 1
+        [[ "$AGENT_PROMPTS" == '["agents", "tools"]' ]] || exit 2
+        [[ "$AGENT_CONTENT_PIPELINE" == "true" ]] || exit 3
+        [[ "$AGENT_REMOTE_PATH" == "memory" ]] || exit 4
+        [[ "$AGENT_HUMAN_NAME" == "Pat O'Brien" ]] || exit 5
+        [[ "$AGENT_PEER_HUMAN_NAME" == "Sam" ]] || exit 6
+        [[ "$AGENT_CUSTOM_VARIABLES" == '{"GREETING": "Hi $USER `date`"}' ]] || exit 7
+
+        load_agent_config missing-agent
+        [[ -z "$AGENT_WORKSPACE" && "$AGENT_PROMPTS" == "[]" && -z "$AGENT_HUMAN_NAME" ]] || exit 8
+    ) || exit_code=$?
+
+    if [[ $exit_code -eq 0 ]]; then
+        pass "load_agent_config sets AGENT_* values with quoting intact"
+    else
+        fail "load_agent_config set wrong values (exit $exit_code)"
+    fi
+
+    teardown
+}
+
+# ============================================================
+# Test: load_vault_config reads vault settings
+# ============================================================
+test_load_vault_config() {
+    echo ""
+    echo "=== Test: load_vault_config reads vault settings ==="
+    setup
+
+    cat > "$TEMP_DIR/config.yaml" << 'EOF'
+vault:
+  enabled: true
+  path: /tmp/my vault
+  dirs: [sessions, "agents/with space"]
+  files: [config.yaml]
+EOF
+
+    mkdir -p "$TEMP_DIR/tools/helpers"
+    cp "$ROOT_DIR/tools/helpers/config-env.py" "$ROOT_DIR/tools/helpers/parse-yaml.py" "$TEMP_DIR/tools/helpers/"
+
+    local exit_code=0
+    (
+        cd "$TEMP_DIR"
+        source "$TEMP_DIR/tools/lib.sh"
+        ROOT_DIR="$TEMP_DIR"
+        load_vault_config
+
+        [[ "$VAULT_ENABLED" == "true" ]] || exit 1
+        [[ "$VAULT_PATH" == "/tmp/my vault" ]] || exit 2
+        [[ ${#VAULT_DIRS[@]} -eq 2 && "${VAULT_DIRS[1]}" == "agents/with space" ]] || exit 3
+        [[ "${VAULT_FILES[*]}" == "config.yaml" ]] || exit 4
+
+        echo "vault: {enabled: false}" > "$TEMP_DIR/config.yaml"
+        load_vault_config
+        [[ "$VAULT_ENABLED" == "false" && ${#VAULT_DIRS[@]} -eq 0 ]] || exit 5
+    ) || exit_code=$?
+
+    if [[ $exit_code -eq 0 ]]; then
+        pass "load_vault_config reads path and lists"
+    else
+        fail "load_vault_config set wrong values (exit $exit_code)"
+    fi
+
+    teardown
+}
+
+# ============================================================
+# Test: get_config_values resolves many keys from a snapshot
+# ============================================================
+test_get_config_values() {
+    echo ""
+    echo "=== Test: get_config_values batch lookup and snapshot ==="
+    setup
+
+    cat > "$TEMP_DIR/config.yaml" << 'EOF'
+agents:
+  test-main:
+    model: sonnet
+    heartbeat:
+      every: 30m
+      active_hours: {start: "08:00"}
+    tools_allow: [read, write]
+EOF
+
+    mkdir -p "$TEMP_DIR/tools/helpers"
+    cp "$ROOT_DIR/tools/helpers/parse-yaml.py" "$TEMP_DIR/tools/helpers/"
+
+    local exit_code=0
+    (
+        cd "$TEMP_DIR"
+        source "$TEMP_DIR/tools/lib.sh"
+        ROOT_DIR="$TEMP_DIR"
+        eval "$(get_config_values MODEL=agents.test-main.model \
+            HB=json:agents.test-main.heartbeat \
+            ALLOW=agents.test-main.tools_allow \
+            MISSING=agents.test-main.tools_deny)"
+
+        [[ "$MODEL" == "sonnet" ]] || exit 1
+        [[ "$HB" == "$(get_agent_heartbeat test-main)" ]] || exit 2
+        echo "$HB" | grep -q '"activeHours"' || exit 3
+        [[ "$ALLOW" == '["read", "write"]' ]] || exit 4
+        [[ -z "$MISSING" ]] || exit 5
+
+        # Snapshot written, and replaced when config.yaml changes
+        [[ $(ls "$TEMP_DIR/.cache"/config.*.json | wc -l) -eq 1 ]] || exit 6
+        sed_inplace 's/model: sonnet/model: opus/' "$TEMP_DIR/config.yaml"
+        [[ "$(get_agent_model test-main)" == "opus" ]] || exit 7
+        [[ $(ls "$TEMP_DIR/.cache"/config.*.json | wc -l) -eq 1 ]] || exit 8
+    ) || exit_code=$?
+
+    if [[ $exit_code -eq 0 ]]; then
+        pass "get_config_values matches single lookups; snapshot follows edits"
+    else
+        fail "get_config_values returned wrong values (exit $exit_code)"
+    fi
+
+    teardown
+}
+
 # ============================================================
 # Run all tests
 # ============================================================
@@ -752,6 +906,9 @@ test_get_agent_heartbeat
 test_has_openclaw_config
 test_get_voice_config
 test_get_voice_config_missing
+test_load_agent_config
+test_load_vault_config
+test_get_config_values
 
 # Summary
 echo ""
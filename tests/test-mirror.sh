@@ -297,6 +297,36 @@ test_core_files_list() {
     fi
 }
 
+# ============================================================
+# Test: Remote manifest lists files with size and mtime
+# ============================================================
+test_manifest_listing() {
+    echo ""
+    echo "=== Test: Remote manifest lists files with size and mtime ==="
+    setup
+
+    mkdir -p "$TEMP_DIR/ws/memory/dir.md"
+    printf 'abc' > "$TEMP_DIR/ws/AGENTS.md"
+    printf 'hello' > "$TEMP_DIR/ws/memory/2026-01-01 note.md"
+
+    # Run the same remote helper mirror.sh sends to the bot
+    local manifest_fn result
+    manifest_fn=$(grep '^MANIFEST_FN=' "$ROOT_DIR/tools/mirror.sh")
+    eval "$manifest_fn"
+    result=$(cd "$TEMP_DIR" && bash -c "$MANIFEST_FN; ls -d ws/AGENTS.md ws/MISSING.md 2>/dev/null | m prompts; find ws/memory -maxdepth 1 -name '*.md' | m memory")
+
+    if [[ $(echo "$result" | wc -l | tr -d ' ') -eq 2 ]] && \
+       echo "$result" | grep -qx "prompts 3 [0-9]* $TEMP_DIR/ws/AGENTS.md" && \
+       echo "$result" | grep -qx "memory 5 [0-9]* $TEMP_DIR/ws/memory/2026-01-01 note.md"; then
+        pass "Manifest has category, size, mtime and absolute path per file"
+    else
+        fail "Unexpected manifest"
+        log "Result: $result"
+    fi
+
+    teardown
+}
+
 # ============================================================
 # Run all tests
 # ============================================================
@@ -311,6 +341,7 @@ test_token_redaction_generic
 test_token_redaction_preserves
 test_directory_structure
 test_core_files_list
+test_manifest_listing
 
 # Summary
 echo ""
@@ -335,6 +335,40 @@ EOF
     teardown
 }
 
+# ============================================================
+# Test: Up-front .pulled set and rsync file list
+# ============================================================
+test_pulled_set_and_fetch_list() {
+    echo ""
+    echo "=== Test: Up-front .pulled set and rsync file list ==="
+    setup
+
+    cat > "$TEMP_DIR/.pulled" << 'EOF'
+abc-123-def
+abc-123
+EOF
+
+    # Same membership check pull-sessions.sh runs once per agent
+    local pulled_ids=$'\n'"$(cat "$TEMP_DIR/.pulled")"$'\n'
+    local fetch_ids=()
+    local session_id
+    for session_id in abc-123 abc-12 123-def abc-123-def new-1; do
+        if [[ "$pulled_ids" != *$'\n'"$session_id"$'\n'* ]]; then
+            fetch_ids+=("$session_id")
+        fi
+    done
+    printf '%s.jsonl\n' "${fetch_ids[@]}" > "$TEMP_DIR/files"
+
+    if [[ "${fetch_ids[*]}" == "abc-12 123-def new-1" ]] && \
+       [[ "$(cat "$TEMP_DIR/files")" == $'abc-12.jsonl\n123-def.jsonl\nnew-1.jsonl' ]]; then
+        pass "Only unpulled sessions go into the --files-from list"
+    else
+        fail "Wrong fetch list: ${fetch_ids[*]}"
+    fi
+
+    teardown
+}
+
 # ============================================================
 # Run all tests
 # ============================================================
@@ -351,6 +385,7 @@ test_session_id_empty_json
 test_summary_format
 test_empty_state_file
 test_session_id_special_chars
+test_pulled_set_and_fetch_list
 
 # Summary
 echo ""
@@ -498,6 +498,25 @@ test_case_statement_coverage() {
     fi
 }
 
+# ============================================================
+# Test: Content goes out in one transfer from the push plan
+# ============================================================
+test_single_content_transfer() {
+    echo ""
+    echo "=== Test: One content transfer per push ==="
+
+    local script="$ROOT_DIR/tools/push.sh"
+    local transfers
+    transfers=$(grep -c -- '--files-from=' "$script" || true)
+
+    if [[ "$transfers" -eq 1 ]] && grep -q 'push-plan.py' "$script" && \
+       ! grep -q 'rsync $RSYNC_OPTS "$AGENT_EXPORT_DIR' "$script"; then
+        pass "Changed files are sent in one --files-from rsync"
+    else
+        fail "Content should go out in one rsync from the push plan (found $transfers)"
+    fi
+}
+
 # ============================================================
 # Run all tests
 # ============================================================
@@ -521,6 +540,7 @@ test_subdirectory_routing_transcripts
 test_subdirectory_routing_docs
 test_mkdir_before_rsync
 test_case_statement_coverage
+test_single_content_transfer
 
 # Summary
 echo ""
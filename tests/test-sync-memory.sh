@@ -274,6 +274,61 @@ test_bot_base_path() {
     fi
 }
 
+# ============================================================
+# Test: Itemized changes are queued and summarized for reindex
+# ============================================================
+test_incremental_reindex() {
+    echo ""
+    echo "=== Test: Incremental reindex from itemized changes ==="
+
+    local tmp
+    tmp=$(mktemp -d)
+    mkdir -p "$tmp/agents/bruba-main"
+
+    local output exit_code=0
+    output=$(
+        source "$ROOT_DIR/tools/lib.sh"
+        AGENTS_DIR="$tmp/agents"
+        bot_cmd() { echo "$1" >> "$tmp/commands"; }
+
+        printf '%s\n' \
+            'sending incremental file list' \
+            'cd+++++++++ notes/' \
+            '>f+++++++++ notes/new file.md' \
+            '>f.st...... plan.md' \
+            '.f..t...... touched.md' \
+            '*deleting   old.md' \
+            '*deleting   gone/' \
+            'sent 1,234 bytes  received 56 bytes' |
+            itemized_changes "/ws/memory/" > "$AGENTS_DIR/bruba-main/.reindex-pending"
+        cat "$AGENTS_DIR/bruba-main/.reindex-pending"
+
+        reindex_memory bruba-main
+        reindex_memory bruba-main
+        reindex_memory bruba-main true
+    ) || exit_code=$?
+
+    local expected="A /ws/memory/notes/new file.md
+M /ws/memory/plan.md
+D /ws/memory/old.md
+  bruba-main: memory indexed (1 added, 1 changed, 1 deleted)
+  bruba-main: memory indexed (full reindex)"
+    local commands
+    commands=$(cat "$tmp/commands" 2>/dev/null)
+
+    if [[ $exit_code -eq 0 && "$output" == "$expected" \
+            && "$commands" == $'openclaw memory index --agent bruba-main\nopenclaw memory index --agent bruba-main --force' \
+            && ! -f "$tmp/agents/bruba-main/.reindex-pending" ]]; then
+        pass "Changes queued per file; reindex only when pending (--force only for full)"
+    else
+        fail "Incremental reindex output or commands differ"
+        log "Output: $output"
+        log "Commands: $commands"
+    fi
+
+    rm -rf "$tmp"
+}
+
 # ============================================================
 # Run all tests
 # ============================================================
@@ -291,6 +346,7 @@ test_memory_index
 test_workspace_snapshot_check
 test_ds_store_exclude
 test_bot_base_path
+test_incremental_reindex
 
 # Summary
 echo ""
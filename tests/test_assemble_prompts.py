@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for tools/helpers/assemble-prompts.py.
+
+Covers:
+- ${VAR} substitution: built-ins over custom variables, unknown left as-is
+- BOT-MANAGED sections taken from the mirror, markers included
+- Full assembly of a small repo: section order, markers, missing entries,
+  and the component hashes written for conflict detection
+"""
+
+import importlib.util
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TOOL_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(TOOL_ROOT))
+
+ASSEMBLE_PROMPTS = TOOL_ROOT / "tools" / "helpers" / "assemble-prompts.py"
+
+_spec = importlib.util.spec_from_file_location("assemble_prompts_helper", ASSEMBLE_PROMPTS)
+assemble_prompts = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(assemble_prompts)
+
+CONFIG = """\
+agents:
+  test-main:
+    workspace: /ws/test-main
+    prompts: [agents, tools]
+    identity:
+      human_name: Pat
+      peer_agent: test-rex
+    variables:
+      GOAL: be brief
+      WORKSPACE: ignored
+    agents_sections:
+      - header
+      - notes
+      - notes:short
+      - bot:approvals
+      - bot:gone
+      - nosuch
+    tools_sections:
+      - base
+  test-rex:
+    workspace: /ws/test-rex
+    prompts: []
+    identity:
+      human_name: Sam
+"""
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_substitution_values():
+    config = {'agents': {
+        'a': {'workspace': '/ws/a', 'identity': {'human_name': 'Pat', 'peer_agent': 'b'},
+              'variables': {'GOAL': 'x & y|z', 'WORKSPACE': 'custom', 'N': 5}},
+        'b': {'identity': {'human_name': 'Sam'}},
+    }}
+    values = assemble_prompts.agent_variables(config, 'a', '/shared')
+    text = "${WORKSPACE} ${HUMAN_NAME}/${PEER_HUMAN_NAME} ${GOAL} ${N} ${SHARED_TOOLS} ${SIGNAL_UUID}. ${OTHER}\n\n\n"
+
+    assert assemble_prompts.substitute(text, values) == "/ws/a Pat/Sam x & y|z 5 /shared . ${OTHER}\n"
+    assert assemble_prompts.substitute("", values) == "\n"
+
+
+def test_bot_section_from_mirror():
+    mirror = ("intro\n<!-- BOT-MANAGED: approvals -->\nls\n\n"
+              "<!-- /BOT-MANAGED: approvals -->\nrest")
+
+    assert assemble_prompts.bot_section(mirror, "approvals") == \
+        "<!-- BOT-MANAGED: approvals -->\nls\n\n<!-- /BOT-MANAGED: approvals -->\n"
+    assert assemble_prompts.bot_section(mirror, "gone") is None
+    assert assemble_prompts.bot_section(None, "approvals") is None
+
+
+def test_assemble_repo():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _write(root / "config.yaml", CONFIG)
+        _write(root / "templates/prompts/TOOLS.md", "Tools for ${AGENT_NAME}\n\n")
+        _write(root / "templates/prompts/sections/header.md", "# ${HUMAN_NAME}'s agent\n")
+        _write(root / "components/notes/prompts/AGENTS.snippet.md", "Notes in ${WORKSPACE}: ${GOAL}")
+        _write(root / "components/notes/prompts/AGENTS.short.snippet.md", "Short\n")
+        _write(root / "agents/test-main/mirror/prompts/AGENTS.md",
+               "<!-- BOT-MANAGED: approvals -->\nok\n<!-- /BOT-MANAGED: approvals -->\n")
+
+        result = subprocess.run(
+            [sys.executable, str(ASSEMBLE_PROMPTS), str(root / "config.yaml"), "assemble",
+             "--log-file", str(root / "assemble.log"), "test-main", "test-rex"],
+            capture_output=True, text=True)
+
+        assert result.returncode == 1, result.stderr
+        assert "  AGENTS.md (2 components,1 sections,1 bot)" in result.stdout
+        assert "  TOOLS.md (base)" in result.stdout
+        assert "Agent: test-rex" not in result.stdout
+        assert "WARNING: 2 sections missing" in result.stdout
+        assert "! Missing: nosuch" in (root / "assemble.log").read_text()
+
+        core = root / "agents/test-main/exports/core-prompts"
+        assert (core / "AGENTS.md").read_text() == (
+            "<!-- SECTION: header -->\n# Pat's agent\n<!-- /SECTION: header -->\n\n"
+            "<!-- COMPONENT: notes -->\nNotes in /ws/test-main: be brief\n<!-- /COMPONENT: notes -->\n\n"
+            "<!-- COMPONENT: notes:short -->\nShort\n<!-- /COMPONENT: notes:short -->\n\n"
+            "<!-- BOT-MANAGED: approvals -->\nok\n<!-- /BOT-MANAGED: approvals -->\n"
+        )
+        assert (core / "TOOLS.md").read_text() == "Tools for test-main\n\n"
+
+        hashes = json.loads((root / "agents/test-main/assembled/section-hashes.json").read_text())
+        assert sorted(hashes) == ["AGENTS.md"]
+        assert hashes["AGENTS.md"]["notes"] == \
+            assemble_prompts.section_hash("Notes in /ws/test-main: be brief\n")
+        assert sorted(hashes["AGENTS.md"]) == ["notes", "notes:short"]
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_substitution_values,
+        test_bot_section_from_mirror,
+        test_assemble_repo,
+    ]
+
+    print("\nRunning assemble-prompts.py tests...\n")
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ {test.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Tests for the Clawdbot JSONL session parser.
+
+Covers:
+- Message filtering (non-message lines, delivery-mirror, system messages)
+- Streaming conversion matches the in-memory conversion
+- Lazy timestamp parsing
+- Incremental follow conversion (resume, partial lines, recovery)
+- Batch parse-jsonl over a directory with --jobs
+- Skipping other line types undecoded
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TOOL_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(TOOL_ROOT))
+
+from components.distill.lib.clawdbot_parser import (
+    SessionInfo,
+    convert_session_file,
+    follow_session_file,
+    follow_state_path,
+    iter_clawdbot_messages,
+    parse_clawdbot_session,
+    parse_jsonl_line,
+    peek_line_type,
+    stream_session_file,
+)
+
+
+SESSION_LINES = [
+    {"type": "session", "id": "abcdef123456", "timestamp": "2026-01-26T06:03:04.901Z"},
+    {"type": "custom", "data": {}},
+    {"type": "message", "id": "m1", "timestamp": "2026-01-26T06:04:00.000Z",
+     "message": {"role": "user", "content": [{"type": "text", "text": "Hello there"}]}},
+    {"type": "message", "id": "m2", "timestamp": "2026-01-26T06:04:05.000Z",
+     "message": {"role": "assistant", "content": [
+         {"type": "thinking", "thinking": "hidden"},
+         {"type": "text", "text": "Hi! How can I help?"}]}},
+    {"type": "message", "id": "m3",
+     "message": {"role": "assistant", "model": "delivery-mirror",
+                 "content": [{"type": "text", "text": "Hi! How can I help?"}]}},
+    {"type": "message", "id": "m4",
+     "message": {"role": "user", "content": [{"type": "text", "text": "A new session was started"}]}},
+    {"type": "message", "id": "m5", "timestamp": "2026-01-26T06:05:00.000Z",
+     "message": {"role": "user", "content": [{"type": "text", "text": "Thanks\n[message_id: 42]"}]}},
+]
+
+EXPECTED_MARKDOWN = """=== MESSAGE 1 | USER ===
+Hello there
+
+=== MESSAGE 2 | ASSISTANT ===
+Hi! How can I help?
+
+=== MESSAGE 3 | USER ===
+Thanks
+"""
+
+
+def _write_session(directory: Path, lines=SESSION_LINES) -> Path:
+    path = directory / "session.jsonl"
+    with open(path, 'w', encoding='utf-8') as f:
+        for obj in lines:
+            f.write(json.dumps(obj) + "\n")
+        f.write("not json\n")
+    return path
+
+
+def test_convert_session_filters_messages():
+    """Only real user/assistant text messages are converted."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_session(Path(tmp))
+        content, session_id, session_start = convert_session_file(path)
+
+        assert content == EXPECTED_MARKDOWN
+        assert session_id == "abcdef123456"
+        assert session_start.isoformat() == "2026-01-26T06:03:04.901000+00:00"
+
+
+def test_stream_session_matches_convert():
+    """Streaming to a file gives the same output as the in-memory path."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_session(Path(tmp))
+        out_path = Path(tmp) / "out" / "session.md"
+
+        count, session_id, _ = stream_session_file(path, out_path)
+
+        assert count == 3
+        assert session_id == "abcdef123456"
+        assert out_path.read_text() == EXPECTED_MARKDOWN
+        assert not list(out_path.parent.glob("*.tmp"))
+
+
+def test_stream_session_without_messages_writes_nothing():
+    """A session with no messages produces no output file."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_session(Path(tmp), SESSION_LINES[:2])
+        out_path = Path(tmp) / "session.md"
+
+        count, session_id, _ = stream_session_file(path, out_path)
+
+        assert count == 0
+        assert session_id == "abcdef123456"
+        assert not out_path.exists()
+
+
+def test_timestamps_parsed_only_on_request():
+    """Message timestamps are parsed only when asked for."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_session(Path(tmp))
+
+        session = SessionInfo()
+        lazy = list(iter_clawdbot_messages(path, session=session))
+        assert all(msg.timestamp is None for msg in lazy)
+        assert session.session_id == "abcdef123456"
+
+        messages, _, _ = parse_clawdbot_session(path)
+        assert [msg.timestamp.minute for msg in messages] == [4, 4, 5]
+
+
+def _append_lines(path: Path, lines, partial: str = ""):
+    with open(path, 'a', encoding='utf-8') as f:
+        for obj in lines:
+            f.write(json.dumps(obj) + "\n")
+        f.write(partial)
+
+
+def test_follow_appends_only_new_messages():
+    """Each follow run parses only appended lines and numbers on."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        out_path = Path(tmp) / "intake" / "session.md"
+
+        _append_lines(path, SESSION_LINES[:3])
+        assert follow_session_file(path, out_path)[0] == 1
+        assert follow_session_file(path, out_path)[0] == 0
+
+        # The last line is still being written: left for the next run
+        partial = json.dumps(SESSION_LINES[6])
+        _append_lines(path, SESSION_LINES[3:6], partial[:20])
+        new_count, session_id, session_start = follow_session_file(path, out_path)
+        assert new_count == 1
+        assert session_id == "abcdef123456"
+        assert session_start.isoformat() == "2026-01-26T06:03:04.901000+00:00"
+
+        _append_lines(path, [], partial[20:] + "\n")
+        assert follow_session_file(path, out_path)[0] == 1
+        assert out_path.read_text() == EXPECTED_MARKDOWN
+        assert follow_state_path(out_path).exists()
+
+
+def test_follow_recovers_from_interrupted_append():
+    """Output past the recorded size is dropped before appending again."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        out_path = Path(tmp) / "session.md"
+
+        _append_lines(path, SESSION_LINES[:3])
+        follow_session_file(path, out_path)
+        with open(out_path, 'a', encoding='utf-8') as f:
+            f.write("\n=== MESSAGE 2 | ASSI")
+
+        _append_lines(path, SESSION_LINES[3:])
+        assert follow_session_file(path, out_path)[0] == 2
+        assert out_path.read_text() == EXPECTED_MARKDOWN
+
+
+def test_follow_restarts_when_input_replaced():
+    """A different session at the same path is converted from scratch."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        out_path = Path(tmp) / "session.md"
+
+        _append_lines(path, SESSION_LINES)
+        follow_session_file(path, out_path)
+
+        replacement = dict(SESSION_LINES[0], id="fedcba654321")
+        path.write_text("")
+        _append_lines(path, [replacement] + SESSION_LINES[1:])
+        new_count, session_id, _ = follow_session_file(path, out_path)
+
+        assert new_count == 3
+        assert session_id == "fedcba654321"
+        assert out_path.read_text() == EXPECTED_MARKDOWN
+
+
+def test_parse_jsonl_batch_directory_with_jobs():
+    """A directory converts in input order, the same at any valid --jobs."""
+    with tempfile.TemporaryDirectory() as tmp:
+        sessions = Path(tmp) / "sessions"
+        sessions.mkdir()
+        for name in ("b", "a", "c"):
+            (sessions / f"{name}.jsonl").write_text(_write_session(Path(tmp)).read_text())
+        (sessions / "notes.txt").write_text("ignored")
+
+        outputs = {}
+        for jobs in ("1", "2"):
+            out_dir = Path(tmp) / f"out{jobs}"
+            result = subprocess.run(
+                [sys.executable, "-m", "components.distill.lib.cli", "parse-jsonl",
+                 str(sessions), "-o", str(out_dir), "--jobs", jobs],
+                capture_output=True, text=True, cwd=TOOL_ROOT
+            )
+            assert result.returncode == 0, result.stderr
+            progress = [line for line in result.stdout.splitlines() if line.startswith("[")]
+            assert progress == [f"[{i}/3] Converting: {name}.jsonl"
+                                for i, name in enumerate("abc", 1)]
+            assert "Converted 3/3 files" in result.stdout
+            assert "files/s" in result.stdout and "MB/s" in result.stdout
+            outputs[jobs] = {p.name: p.read_text() for p in out_dir.iterdir()}
+
+        assert outputs["1"] == outputs["2"]
+        assert outputs["1"]["a.md"] == EXPECTED_MARKDOWN
+
+        # Only 0 means one per CPU; negative counts are rejected
+        result = subprocess.run(
+            [sys.executable, "-m", "components.distill.lib.cli", "parse-jsonl",
+             str(sessions), "-o", str(Path(tmp) / "out-neg"), "--jobs", "-5"],
+            capture_output=True, text=True, cwd=TOOL_ROOT
+        )
+        assert result.returncode == 2 and "--jobs" in result.stderr
+
+
+def test_line_type_prefilter():
+    """Lines of other types are skipped before decoding; unclear ones are decoded."""
+    assert peek_line_type('{"type": "custom", "data": {"type": "message"}}') == "custom"
+    assert peek_line_type('{"id": "x", "type": "message"}') is None
+
+    types = {"session", "message"}
+    assert parse_jsonl_line('{"type": "custom", broken', types) is None
+    assert parse_jsonl_line('{"type":"message","id":"a"}', types) == {"type": "message", "id": "a"}
+    assert parse_jsonl_line('{"id": "a", "type": "custom"}', types) == {"id": "a", "type": "custom"}
+    # Values only the stdlib accepts still decode
+    assert parse_jsonl_line('{"type": "message", "n": NaN}', types)["type"] == "message"
+    assert parse_jsonl_line("not json", types) is None
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_convert_session_filters_messages,
+        test_stream_session_matches_convert,
+        test_stream_session_without_messages_writes_nothing,
+        test_timestamps_parsed_only_on_request,
+        test_follow_appends_only_new_messages,
+        test_follow_recovers_from_interrupted_append,
+        test_follow_restarts_when_input_replaced,
+        test_parse_jsonl_batch_directory_with_jobs,
+        test_line_type_prefilter,
+    ]
+
+    print("\nRunning clawdbot parser tests...\n")
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ {test.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared transcription corrections engine.
+
+Covers:
+- Single-pass, longest-first matching with word boundaries
+- Case handling of replacements
+- Both corrections file formats
+- Hash-keyed cache file
+- canonicalize.apply_corrections and parse-jsonl.py using the engine
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TOOL_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(TOOL_ROOT))
+
+from components.distill.lib.corrections import (
+    CorrectionEngine,
+    load_correction_pairs,
+    load_correction_engine,
+    DEFAULT_CORRECTIONS_PATH,
+)
+from components.distill.lib.canonicalize import apply_corrections, load_corrections
+from components.distill.lib.models import TranscriptionFix
+
+PARSE_JSONL = TOOL_ROOT / "tools" / "helpers" / "parse-jsonl.py"
+
+
+def test_engine_single_pass_longest_first():
+    """A fix never re-matches another fix's output."""
+    engine = CorrectionEngine([("claude", "Claude"), ("claud", "Claude"), ("chat gpt", "ChatGPT")])
+    result, hits = engine.apply("ask claude or claud via chat gpt")
+    assert result == "ask Claude or Claude via ChatGPT"
+    assert hits == {0: 1, 1: 1, 2: 1}
+
+
+def test_engine_respects_word_boundaries():
+    """Terms don't fire inside longer words."""
+    engine = CorrectionEngine([("api", "API"), ("[music]", "")])
+    result, _ = engine.apply("the capital api[Music]")
+    assert result == "the capital API"
+
+
+def test_engine_case_handling():
+    """Cased replacements are used as written; lowercase ones follow the match."""
+    engine = CorrectionEngine([("chatgpt", "ChatGPT"), ("agenting", "agentic")])
+    result, _ = engine.apply("chatgpt. Agenting and agenting")
+    assert result == "ChatGPT. Agentic and agentic"
+
+
+def test_load_both_formats():
+    """Flat map and list format both load."""
+    with tempfile.TemporaryDirectory() as tmp:
+        flat = Path(tmp) / "flat.yaml"
+        flat.write_text('# comment\nchat gpt: ChatGPT\n"[music]": ""\n')
+        listed = Path(tmp) / "list.yaml"
+        listed.write_text('corrections:\n  - original: "chat gpt"\n    corrected: "ChatGPT"\n'
+                          '  - pattern: "clawd"\n    replacement: "Claude"\n')
+
+        assert load_correction_pairs(flat) == [("chat gpt", "ChatGPT"), ("[music]", "")]
+        assert load_correction_pairs(listed) == [("chat gpt", "ChatGPT"), ("clawd", "Claude")]
+
+
+def test_default_corrections_file_loads():
+    """The shipped flat corrections.yaml loads into canonicalize fixes."""
+    fixes = load_corrections(DEFAULT_CORRECTIONS_PATH)
+    assert any(fix.original == "chat gpt" and fix.corrected == "ChatGPT" for fix in fixes)
+
+
+def test_engine_cache_keyed_by_hash():
+    """The cache file is reused until the YAML changes."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "corrections.yaml"
+        cache = Path(tmp) / ".corrections.cache.json"
+        path.write_text("foo: Foo\n")
+
+        engine = load_correction_engine(path)
+        assert engine.pairs == [("foo", "Foo")]
+        assert cache.exists()
+
+        # A stale cache for the same hash is trusted...
+        data = json.loads(cache.read_text())
+        data["pairs"] = [["foo", "FOO"]]
+        cache.write_text(json.dumps(data))
+        assert load_correction_engine(path).pairs == [("foo", "FOO")]
+
+        # ...until the YAML itself changes
+        path.write_text("foo: Foo\nbar: Bar\n")
+        assert load_correction_engine(path).pairs == [("foo", "Foo"), ("bar", "Bar")]
+
+
+def test_canonicalize_apply_corrections_reports_applied():
+    """apply_corrections returns the fixes that matched, in order."""
+    fixes = [
+        TranscriptionFix(original="clawd bot", corrected="Clawdbot"),
+        TranscriptionFix(original="nowhere", corrected="Somewhere"),
+        TranscriptionFix(original="jason", corrected="JSON"),
+    ]
+    result, applied = apply_corrections("clawd bot wrote jason, Jason too", fixes)
+    assert result == "Clawdbot wrote JSON, JSON too"
+    assert [fix.original for fix in applied] == ["clawd bot", "jason"]
+
+
+def test_parse_jsonl_uses_engine():
+    """parse-jsonl.py --corrections-file applies corrections to messages."""
+    with tempfile.TemporaryDirectory() as tmp:
+        corrections = Path(tmp) / "corrections.yaml"
+        corrections.write_text("claud: Claude\nclaude: Claude\n")
+        session = Path(tmp) / "session.jsonl"
+        session.write_text(json.dumps({
+            "type": "message",
+            "timestamp": "2026-01-29T11:48:00Z",
+            "message": {"role": "user", "content": "ask claude and claud"},
+        }) + "\n")
+
+        result = subprocess.run(
+            ["python3", str(PARSE_JSONL), str(session), "--corrections-file", str(corrections)],
+            capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
+        assert "ask Claude and Claude" in result.stdout
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_engine_single_pass_longest_first,
+        test_engine_respects_word_boundaries,
+        test_engine_case_handling,
+        test_load_both_formats,
+        test_default_corrections_file_loads,
+        test_engine_cache_keyed_by_hash,
+        test_canonicalize_apply_corrections_reports_applied,
+        test_parse_jsonl_uses_engine,
+    ]
+
+    print("\nRunning corrections tests...\n")
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ {test.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
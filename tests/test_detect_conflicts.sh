@@ -26,6 +26,22 @@ log() {
     if $VERBOSE; then echo "$@"; fi
 }
 
+# Write config.yaml with bruba-main's agents_sections
+# Usage: write_config SECTION...
+write_config() {
+    {
+        echo "agents:"
+        echo "  bruba-main:"
+        echo "    workspace: /test/clawd"
+        echo "    prompts: [agents]"
+        echo "    agents_sections:"
+        local section
+        for section in "$@"; do
+            echo "      - $section"
+        done
+    } > "$TEMP_DIR/config.yaml"
+}
+
 setup() {
     TEMP_DIR=$(mktemp -d)
 
@@ -35,57 +51,14 @@ setup() {
     mkdir -p "$TEMP_DIR/templates/prompts/sections"
     mkdir -p "$TEMP_DIR/tools"
 
-    # Copy tools with modified lib.sh that respects TEST_ROOT_DIR
-    cp "$ROOT_DIR/tools/detect-conflicts.sh" "$TEMP_DIR/tools/"
+    # Real lib.sh and helpers; the agent's mirror dir points at mirror/
+    cp "$ROOT_DIR/tools/lib.sh" "$ROOT_DIR/tools/detect-conflicts.sh" "$TEMP_DIR/tools/"
+    mkdir -p "$TEMP_DIR/tools/helpers" "$TEMP_DIR/agents/bruba-main"
+    cp "$ROOT_DIR/tools/helpers/"{parse-yaml.py,config-env.py,assemble-prompts.py,detect-conflicts.py} \
+        "$TEMP_DIR/tools/helpers/"
+    ln -s ../../mirror "$TEMP_DIR/agents/bruba-main/mirror"
 
-    # Create modified lib.sh that uses TEST_ROOT_DIR if set
-    cat > "$TEMP_DIR/tools/lib.sh" << 'LIBEOF'
-#!/bin/bash
-# Test version of lib.sh - uses TEST_ROOT_DIR if set
-LIB_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-ROOT_DIR="${TEST_ROOT_DIR:-$(dirname "$LIB_DIR")}"
-
-load_config() {
-    local config_file="$ROOT_DIR/config.yaml"
-    if [[ ! -f "$config_file" ]]; then
-        echo "ERROR: config.yaml not found at $config_file" >&2
-        return 1
-    fi
-    SSH_HOST="test"
-    REMOTE_HOME="/test"
-    REMOTE_WORKSPACE="/test/clawd"
-    MIRROR_DIR="$ROOT_DIR/mirror"
-    EXPORTS_DIR="$ROOT_DIR/exports"
-}
-
-parse_common_args() {
-    VERBOSE=false
-    DRY_RUN=false
-    REMAINING_ARGS=("$@")
-    return 0
-}
-LIBEOF
-
-    # Create minimal config.yaml
-    cat > "$TEMP_DIR/config.yaml" << 'EOF'
-ssh:
-  host: test
-remote:
-  home: /test
-  workspace: /test/clawd
-local:
-  mirror: mirror
-EOF
-
-    # Add agents_sections to config.yaml
-    cat >> "$TEMP_DIR/config.yaml" << 'EOF'
-exports:
-  bot:
-    agents_sections:
-      - header
-      - existing-component
-      - bot:exec-approvals
-EOF
+    write_config header existing-component bot:exec-approvals
 
     # Create template section
     cat > "$TEMP_DIR/templates/prompts/sections/header.md" << 'EOF'
@@ -229,7 +202,7 @@ EOF
     log "Output: $output"
 
     assert_exit_code 1 $exit_code "Should exit 1 when conflicts found"
-    assert_contains "$output" "Conflicts detected" "Should report conflicts"
+    assert_contains "$output" "Total conflicts" "Should report conflicts"
     assert_contains "$output" "new-bot-section" "Should identify the new section"
     assert_contains "$output" "NEW BOT SECTIONS" "Should categorize as bot section"
 
@@ -273,7 +246,7 @@ EOF
 
     # THIS WAS THE BUG: script said "no conflicts" when claude-code was added
     assert_exit_code 1 $exit_code "Should exit 1 when new COMPONENT found"
-    assert_contains "$output" "Conflicts detected" "Should report conflicts"
+    assert_contains "$output" "Total conflicts" "Should report conflicts"
     assert_contains "$output" "claude-code" "Should identify claude-code"
     assert_contains "$output" "NEW COMPONENT SECTIONS" "Should categorize as component section"
 
@@ -312,7 +285,7 @@ EOF
     log "Output: $output"
 
     assert_exit_code 1 $exit_code "Should exit 1 when component edited"
-    assert_contains "$output" "Conflicts detected" "Should report conflicts"
+    assert_contains "$output" "Total conflicts" "Should report conflicts"
     assert_contains "$output" "existing-component" "Should identify edited component"
     assert_contains "$output" "EDITED COMPONENTS" "Should categorize as edited"
 
@@ -380,21 +353,7 @@ Handle routing for Siri requests.
 EOF
 
     # Update config to use variant syntax
-    cat > "$TEMP_DIR/config.yaml" << 'EOF'
-ssh:
-  host: test
-remote:
-  home: /test
-  workspace: /test/clawd
-local:
-  mirror: mirror
-exports:
-  bot:
-    agents_sections:
-      - header
-      - http-api:router
-      - bot:exec-approvals
-EOF
+    write_config header http-api:router bot:exec-approvals
 
     # Create mirror AGENTS.md with variant component
     cat > "$TEMP_DIR/mirror/prompts/AGENTS.md" << 'EOF'
@@ -440,21 +399,7 @@ Handle routing for Siri requests.
 EOF
 
     # Update config to use variant syntax
-    cat > "$TEMP_DIR/config.yaml" << 'EOF'
-ssh:
-  host: test
-remote:
-  home: /test
-  workspace: /test/clawd
-local:
-  mirror: mirror
-exports:
-  bot:
-    agents_sections:
-      - header
-      - http-api:router
-      - bot:exec-approvals
-EOF
+    write_config header http-api:router bot:exec-approvals
 
     # Create mirror with MODIFIED variant component
     cat > "$TEMP_DIR/mirror/prompts/AGENTS.md" << 'EOF'
@@ -486,6 +431,50 @@ EOF
     teardown
 }
 
+# =============================================================================
+# Test: Component edits are compared against the assembled hashes
+# =============================================================================
+test_compares_assembled_hashes() {
+    echo ""
+    echo "=== Test: Component edits compared against assembled hashes ==="
+    setup
+
+    cat > "$TEMP_DIR/mirror/prompts/AGENTS.md" << 'EOF'
+<!-- SECTION: header -->
+# Header Section
+<!-- /SECTION: header -->
+
+<!-- COMPONENT: existing-component -->
+## Existing Component
+As assembled last time.
+<!-- /COMPONENT: existing-component -->
+
+<!-- COMPONENT: new-feature -->
+New component
+<!-- /COMPONENT: new-feature -->
+EOF
+
+    # Last assembly wrote the mirror's version; the source has changed since
+    cd "$TEMP_DIR"
+    local body_hash
+    body_hash=$(printf '## Existing Component\nAs assembled last time.' | python3 -c \
+        "import hashlib, sys; print(hashlib.sha256(sys.stdin.buffer.read()).hexdigest())")
+    mkdir -p "$TEMP_DIR/agents/bruba-main/assembled"
+    echo "{\"AGENTS.md\": {\"existing-component\": \"$body_hash\"}}" \
+        > "$TEMP_DIR/agents/bruba-main/assembled/section-hashes.json"
+
+    output=$(TEST_ROOT_DIR="$TEMP_DIR" bash "$TEMP_DIR/tools/detect-conflicts.sh" 2>&1)
+    exit_code=$?
+
+    log "Output: $output"
+
+    assert_exit_code 1 $exit_code "Should exit 1 for the new component"
+    assert_not_contains "$output" "EDITED COMPONENTS" "Local source edit is not a bot edit"
+    assert_contains "$output" "Position: after 'existing-component'" "Should locate new component"
+
+    teardown
+}
+
 # =============================================================================
 # Run all tests
 # =============================================================================
@@ -498,6 +487,7 @@ test_detects_edited_component
 test_multiple_conflicts
 test_component_variant_support
 test_detects_edited_variant_component
+test_compares_assembled_hashes
 
 echo ""
 echo "================================"
@@ -6,6 +6,10 @@ These tests verify:
 - Export routing based on frontmatter type
 - Frontmatter preservation in variant output
 - Type parsing from frontmatter
+- Single-pass fan-out to profiles/agents grouped by redaction set
+- Parallel (--jobs) export matching serial output
+- Incremental export manifest (skip unchanged, stale reconciliation)
+- Agent inventories rendered from manifest entries
 
 Run with:
     python tests/run_tests.py test_export
@@ -28,8 +32,19 @@ from components.distill.lib.variants import (
 
 # Import the routing function - need to access it from cli module
 from components.distill.lib.cli import _get_content_subdirectory_and_prefix, _write_if_changed
+from components.distill.lib import cli as distill_cli
+from components.distill.lib.cli import ExportTarget, _route_canonical_file, _run_export
+from components.distill.lib.cli import (
+    EXPORT_MANIFEST_NAME,
+    _load_export_manifest,
+    _save_export_manifest,
+    _reconcile_from_manifest,
+    _write_inventories,
+)
+from components.distill.lib.variants import DocumentCache
 import tempfile
 import os
+import re
 
 try:
     import pytest
@@ -451,6 +466,303 @@ def test_write_if_changed_handles_empty_file():
         assert path.read_text() == "content"
 
 
+# =============================================================================
+# Unit tests for single-pass fan-out export
+# =============================================================================
+
+FANOUT_DOC = """---
+title: "Fan-out Test"
+slug: fanout
+date: 2026-01-31
+type: doc
+users: [user1]
+sensitivity:
+  terms:
+    names: [Alice]
+    health: [headache]
+---
+Alice had a headache.
+---
+
+<!-- === BACKMATTER === -->
+
+## Summary
+
+Alice summary.
+"""
+
+
+def _fanout_targets(root: Path) -> list:
+    return [
+        ExportTarget(name='a', output_dir=root / 'a', redaction=('names',)),
+        ExportTarget(name='b', output_dir=root / 'b', redaction=('names',), flatten=True),
+        ExportTarget(name='c', output_dir=root / 'c', redaction=('names', 'health')),
+        ExportTarget(name='bruba-main', output_dir=root / 'main', redaction=('names',), is_agent=True),
+        ExportTarget(name='bruba-rex', output_dir=root / 'rex', redaction=('names',), is_agent=True),
+    ]
+
+
+def test_route_groups_targets_by_redaction():
+    """Test that matching targets are grouped by redaction set and agents are routed by users."""
+    config, _, _ = parse_canonical_file(FANOUT_DOC)
+    targets = _fanout_targets(Path('/tmp/unused'))
+    unrouted = set()
+
+    groups, skips = _route_canonical_file(
+        Path('reference/fanout.md'), config, targets,
+        {'user1': ['bruba-main'], 'user2': ['bruba-rex']}, unrouted
+    )
+
+    assert [t.name for t in groups[('names',)]] == ['a', 'b', 'bruba-main']
+    assert [t.name for t in groups[('names', 'health')]] == ['c']
+    assert [(t.name, 'not routed' in reason) for t, reason in skips] == [('bruba-rex', True)]
+    assert not unrouted
+
+
+def test_route_unrouted_file_defaults_to_bruba_main():
+    """Test that files without users/agents go to bruba-main and are reported."""
+    config, _, _ = parse_canonical_file(FANOUT_DOC.replace("users: [user1]\n", ""))
+    targets = _fanout_targets(Path('/tmp/unused'))
+    unrouted = set()
+
+    groups, _ = _route_canonical_file(Path('reference/fanout.md'), config, targets, {}, unrouted)
+
+    assert 'bruba-main' in [t.name for t in groups[('names',)]]
+    assert 'bruba-rex' not in [t.name for g in groups.values() for t in g]
+    assert unrouted == {'fanout.md'}
+
+
+def test_export_file_renders_once_per_redaction_set():
+    """Test that one file is rendered once per distinct redaction set and written to every target."""
+    calls = []
+    original = distill_cli._render_variants
+
+    def counting_render(parsed, redaction, logger=None):
+        calls.append(redaction)
+        return original(parsed, redaction, logger)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = root / 'fanout.md'
+        source.write_text(FANOUT_DOC, encoding='utf-8')
+        targets = _fanout_targets(root)
+
+        distill_cli._render_variants = counting_render
+        try:
+            _run_export([source], targets, DocumentCache(), {'user1': ['bruba-main']}, set())
+        finally:
+            distill_cli._render_variants = original
+
+        assert sorted(calls) == [('names',), ('names', 'health')]
+
+        a_doc = (root / 'a' / 'docs' / 'Doc - fanout.md').read_text()
+        b_doc = (root / 'b' / 'Doc - fanout.md').read_text()
+        c_doc = (root / 'c' / 'docs' / 'Doc - fanout.md').read_text()
+        main_doc = (root / 'main' / 'docs' / 'Doc - fanout.md').read_text()
+        assert a_doc == b_doc == main_doc
+        assert "[REDACTED] had a headache" in a_doc
+        assert "[REDACTED] had a [REDACTED]" in c_doc
+        assert (root / 'b' / 'Summary - fanout.md').exists()
+        assert [t.processed for t in targets] == [1, 1, 1, 1, 0]
+
+
+def test_parallel_export_matches_serial():
+    """Test that --jobs N gives the same files and counts as a serial run."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        sources = []
+        for i in range(6):
+            source = root / 'src' / f'doc-{i}.md'
+            source.parent.mkdir(exist_ok=True)
+            source.write_text(FANOUT_DOC.replace('Alice summary', f'Summary {i}'), encoding='utf-8')
+            sources.append(source)
+        (root / 'src' / 'broken.md').write_text('no frontmatter\n', encoding='utf-8')
+        sources.append(root / 'src' / 'broken.md')
+
+        outputs = {}
+        for jobs in (1, 2):
+            targets = _fanout_targets(root / f'jobs{jobs}')
+            _run_export(sources, targets, DocumentCache(), {'user1': ['bruba-main']}, set(), jobs=jobs)
+            base = root / f'jobs{jobs}'
+            outputs[jobs] = (
+                {p.relative_to(base): p.read_text() for p in base.rglob('*.md')},
+                [(t.processed, t.unchanged, t.skipped, t.messages) for t in targets],
+            )
+
+        assert outputs[1] == outputs[2]
+        assert outputs[1][1][0][:3] == (6, 0, 1)
+
+
+def test_jobs_argument_validation():
+    """Test that --jobs accepts 0 (one per CPU) or a count, and rejects negatives."""
+    import argparse
+
+    assert distill_cli._job_count('0') == 0
+    assert distill_cli._job_count('3') == 3
+    for value in ('-5', 'x'):
+        try:
+            distill_cli._job_count(value)
+        except argparse.ArgumentTypeError:
+            continue
+        raise AssertionError(f"--jobs {value} was accepted")
+
+
+# =============================================================================
+# Unit tests for the incremental export manifest
+# =============================================================================
+
+def _manifest_export_run(sources: list, out_dir: Path, redaction=('names',), full=False):
+    """Run one export of sources to a single target, like cmd_export does."""
+    target = ExportTarget(name='p', output_dir=out_dir, redaction=redaction)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    _load_export_manifest(target, {}, full=full)
+    _run_export(sources, [target], DocumentCache(), {}, set(), verbose=True)
+    removed = 0
+    if target.previous is not None:
+        removed = _reconcile_from_manifest(out_dir, target.previous, target.written_paths)
+    _save_export_manifest(target)
+    return target, removed
+
+
+def test_manifest_skips_unchanged_inputs():
+    """Test that a second run reuses manifest entries without parsing or rendering."""
+    calls = []
+    original = distill_cli._render_variants
+
+    def counting_render(parsed, redaction, logger=None):
+        calls.append(redaction)
+        return original(parsed, redaction, logger)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = root / 'doc.md'
+        source.write_text(FANOUT_DOC, encoding='utf-8')
+        out_dir = root / 'out'
+
+        distill_cli._render_variants = counting_render
+        try:
+            first, _ = _manifest_export_run([source], out_dir)
+            second, _ = _manifest_export_run([source], out_dir)
+        finally:
+            distill_cli._render_variants = original
+
+        assert (out_dir / EXPORT_MANIFEST_NAME).exists()
+        assert len(calls) == 1
+        assert (first.processed, first.unchanged) == (1, 0)
+        assert (second.processed, second.unchanged) == (0, 1)
+        assert second.written_paths == first.written_paths
+
+
+def test_manifest_rerenders_on_input_or_rule_change():
+    """Test that changed content or changed profile rules force a re-render."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        source = root / 'doc.md'
+        source.write_text(FANOUT_DOC, encoding='utf-8')
+        out_dir = root / 'out'
+        out_file = out_dir / 'docs' / 'Doc - doc.md'
+
+        _manifest_export_run([source], out_dir)
+
+        source.write_text(FANOUT_DOC.replace('had a', 'still had a'), encoding='utf-8')
+        target, _ = _manifest_export_run([source], out_dir)
+        assert target.processed == 1
+        assert "still had a headache" in out_file.read_text()
+
+        target, _ = _manifest_export_run([source], out_dir, redaction=('names', 'health'))
+        assert target.processed == 1
+        assert "had a [REDACTED]" in out_file.read_text()
+
+        out_file.unlink()
+        target, _ = _manifest_export_run([source], out_dir, redaction=('names', 'health'))
+        assert target.processed == 1
+        assert out_file.exists()
+
+
+def test_manifest_reconciles_stale_outputs():
+    """Test that outputs of removed sources are deleted using the manifest."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        keep = root / 'keep.md'
+        gone = root / 'gone.md'
+        keep.write_text(FANOUT_DOC, encoding='utf-8')
+        gone.write_text(FANOUT_DOC.replace('type: doc', 'type: refdoc'), encoding='utf-8')
+        out_dir = root / 'out'
+        # Unrelated file not in the manifest is left alone
+        (out_dir / 'notes').mkdir(parents=True)
+        (out_dir / 'notes' / 'manual.md').write_text('manual')
+
+        _manifest_export_run([keep, gone], out_dir)
+        assert (out_dir / 'refdocs' / 'Refdoc - gone.md').exists()
+
+        gone.unlink()
+        target, removed = _manifest_export_run([keep], out_dir)
+
+        assert removed == 2  # refdoc + summary
+        assert not (out_dir / 'refdocs').exists()
+        assert not (out_dir / 'summaries' / 'Summary - gone.md').exists()
+        assert (out_dir / 'summaries' / 'Summary - keep.md').exists()
+        assert (out_dir / 'notes' / 'manual.md').exists()
+
+
+# =============================================================================
+# Unit tests for manifest-backed inventories
+# =============================================================================
+
+def test_inventory_from_manifest_entries():
+    """Test that inventories come from recorded entries, not re-read outputs."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        doc = root / 'doc.md'
+        talk = root / 'talk.md'
+        doc.write_text(FANOUT_DOC, encoding='utf-8')
+        talk.write_text(FANOUT_DOC.replace('type: doc', 'type: transcript\ndescription: "A chat"'),
+                        encoding='utf-8')
+        out_dir = root / 'out'
+        target = ExportTarget(name='bruba-main', output_dir=out_dir, is_agent=True,
+                              include={'type': ['doc', 'transcript']})
+        out_dir.mkdir()
+        _run_export([doc, talk], [target], DocumentCache(), {'user1': ['bruba-main']}, set())
+
+        entry = target.sources[doc.as_posix()]['inventory']
+        assert entry == {'file': 'docs/Doc - doc.md', 'description': 'Fan-out Test', 'date': '2026-01-31'}
+
+        # Exported copies are not re-read for indexed files; unindexed ones fall back
+        doc_out = out_dir / 'docs' / 'Doc - doc.md'
+        doc_out.write_text(doc_out.read_text().replace('Fan-out Test', 'Changed'))
+        (out_dir / 'docs' / 'Doc - manual.md').write_text('---\ntitle: Manual\n---\nText\n')
+        (out_dir / 'docs' / 'Doc - bare.md').write_text('No frontmatter\n')
+
+        summaries = _write_inventories(target, target.sources)
+        assert summaries == [
+            '  bruba-main: Document Inventory: 3 docs, 0 prompts, 0 refdocs',
+            '  bruba-main: Transcript Inventory: 1 transcripts',
+        ]
+        inventory = (out_dir / 'Document Inventory.md').read_text()
+        assert '## Docs (3)\n\n| File | Description | Date |\n|------|-------------|------|\n' in inventory
+        assert '| Doc - doc.md | Fan-out Test | 2026-01-31 |' in inventory
+        assert '| Doc - manual.md | Manual |' in inventory
+        assert '| Doc - bare.md | bare |' in inventory
+        assert '## Prompts' not in inventory
+        assert inventory.endswith('---\n*Auto-generated by bruba-godo*\n')
+        assert '| Transcript - talk.md | A chat | 2026-01-31 |' in \
+            (out_dir / 'Transcript Inventory.md').read_text()
+
+        # Unchanged rows keep the old Generated date; changed rows update it
+        doc_inventory = out_dir / 'Document Inventory.md'
+        doc_inventory.write_text(re.sub(r'Generated: \S+', 'Generated: 2026-01-01', inventory))
+        _write_inventories(target, target.sources)
+        assert 'Generated: 2026-01-01' in doc_inventory.read_text()
+        (out_dir / 'docs' / 'Doc - bare.md').unlink()
+        _write_inventories(target, target.sources)
+        assert 'Generated: 2026-01-01' not in doc_inventory.read_text()
+
+        target.include = {'type': ['doc']}
+        (out_dir / 'Transcript Inventory.md').unlink()
+        assert len(_write_inventories(target, {})) == 1
+        assert not (out_dir / 'Transcript Inventory.md').exists()
+
+
 # =============================================================================
 # Test runner
 # =============================================================================
@@ -484,6 +796,18 @@ def run_all_tests():
         test_write_if_changed_skips_identical,
         test_write_if_changed_overwrites_different,
         test_write_if_changed_handles_empty_file,
+        # Fan-out export
+        test_route_groups_targets_by_redaction,
+        test_route_unrouted_file_defaults_to_bruba_main,
+        test_export_file_renders_once_per_redaction_set,
+        test_parallel_export_matches_serial,
+        test_jobs_argument_validation,
+        # Incremental manifest
+        test_manifest_skips_unchanged_inputs,
+        test_manifest_rerenders_on_input_or_rule_change,
+        test_manifest_reconciles_stale_outputs,
+        # Inventories
+        test_inventory_from_manifest_entries,
     ]
 
     print("\nRunning export pipeline tests...\n")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for tools/helpers/parse-jsonl.py random access.
+
+Covers:
+- Line index built once and extended as the session grows
+- --extract and --search giving the same results with and without the index
+- Raw byte search still finding escaped and case-folded text
+"""
+
+import importlib.util
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TOOL_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(TOOL_ROOT))
+
+PARSE_JSONL = TOOL_ROOT / "tools" / "helpers" / "parse-jsonl.py"
+
+_spec = importlib.util.spec_from_file_location("parse_jsonl_helper", PARSE_JSONL)
+parse_jsonl = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parse_jsonl)
+
+
+def _message(text, role="user"):
+    return json.dumps({
+        "type": "message",
+        "timestamp": "2026-01-29T11:48:00Z",
+        "message": {"role": role, "content": [{"type": "text", "text": text}]},
+    })
+
+
+def _write_session(path: Path, count: int, start: int = 0, mode: str = 'w'):
+    with open(path, mode, encoding='utf-8') as f:
+        if mode == 'w':
+            f.write(json.dumps({"type": "session", "id": "abc"}) + "\n")
+        for i in range(start, start + count):
+            f.write(_message(f"message {i} about topic-{i % 7}") + "\n")
+            if i % 10 == 0:
+                f.write("\n")
+
+
+def _run(*args):
+    result = subprocess.run(
+        ["python3", str(PARSE_JSONL), *map(str, args)], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout
+
+
+def test_line_index_extends_as_session_grows():
+    """The index is reused and only the appended lines are scanned."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        _write_session(path, 30)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "message", "partial')
+
+        with parse_jsonl.MappedSession(path) as session:
+            first = list(session.offsets)
+        assert parse_jsonl.index_path(path).exists()
+
+        # Finish the partial line and add more
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('": 1}\n')
+        _write_session(path, 20, start=30, mode='a')
+
+        with parse_jsonl.MappedSession(path) as session:
+            grown = list(session.offsets)
+        with parse_jsonl.MappedSession(path, use_index_file=False) as session:
+            fresh = list(session.offsets)
+
+        assert grown[:len(first)] == first
+        assert grown == fresh
+        assert len(fresh) == len(path.read_text().splitlines())
+
+
+def test_extract_and_search_match_unindexed():
+    """--extract and --search print the same with and without the index."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        _write_session(path, 200)
+
+        for args in (["--extract", "40-55"], ["--extract", "210-400"],
+                     ["--search", "TOPIC-3"], ["--search", "message 1"],
+                     ["--search", "no such text"]):
+            assert _run(path, *args) == _run(path, "--no-index", *args), args
+
+
+def test_raw_search_finds_escaped_and_folded_text():
+    """Lines whose text only matches after decoding are still found."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "session.jsonl"
+        lines = [
+            _message("plain"),
+            json.dumps({"type": "message", "message": {"role": "user", "content": "at 300\u212a"}}),
+            json.dumps({"type": "message", "message": {"role": "user", "content": "İstanbul"}},
+                       ensure_ascii=False),
+            _message("say \"quoted\" things"),
+        ]
+        path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+        # Kelvin sign, \u-escaped in the raw line, lowercases to "k"
+        assert parse_jsonl.search_jsonl(path, "300K") == [2]
+        assert parse_jsonl.search_jsonl(path, "istanbul") == parse_jsonl.search_jsonl(
+            path, "istanbul", use_index=False)
+        assert parse_jsonl.search_jsonl(path, '"quoted"') == [4]
+        assert not parse_jsonl.raw_searchable('"quoted"')
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_line_index_extends_as_session_grows,
+        test_extract_and_search_match_unindexed,
+        test_raw_search_finds_escaped_and_folded_text,
+    ]
+
+    print("\nRunning parse-jsonl.py tests...\n")
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ {test.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for tools/helpers/push-plan.py.
+
+Covers:
+- First push stages everything by remote path; a second push stages nothing
+- Memory content (not core-prompts) is listed per agent as added/changed
+  paths for reindex
+- Export outputs are matched by their export manifest entry, not re-read,
+  unless modified after the manifest was written
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+TOOL_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(TOOL_ROOT))
+
+PUSH_PLAN = TOOL_ROOT / "tools" / "helpers" / "push-plan.py"
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _setup(root):
+    exports = root / "agents" / "test-main" / "exports"
+    _write(exports / "core-prompts" / "AGENTS.md", "agents\n")
+    _write(exports / "docs" / "Doc - a.md", "doc a\n")
+    _write(exports / "transcripts" / "Transcript - t.md", "talk\n")
+    _write(exports / "Document Inventory.md", "inventory\n")
+    _write(exports / "notes.txt", "not pushed from root\n")
+    mappings = "".join(
+        "\t".join(["test-main", label, str(exports / source), dest, mode]) + "\n"
+        for label, source, dest, mode in [
+            ("core-prompts", "core-prompts", "/ws/main", "tree"),
+            ("docs", "docs", "/ws/main/memory/docs", "tree"),
+            ("transcripts", "transcripts", "/ws/main/memory/transcripts", "tree"),
+            ("root", "", "/ws/main/memory", "top"),
+        ]
+    )
+    return exports, mappings
+
+
+def _plan(root, mappings):
+    """Run a plan and commit its manifests; returns (stdout, staged paths, memory changes)."""
+    stage = root / "push" / "stage"
+    result = subprocess.run(
+        [sys.executable, str(PUSH_PLAN), "--staging", str(stage),
+         "--agents-dir", str(root / "agents"), "--changes-dir", str(root / "push" / "changes")],
+        input=mappings, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    staged = (root / "push" / "stage.files").read_text().splitlines()
+    changes = root / "push" / "changes" / "test-main"
+    changed = changes.read_text().splitlines() if changes.exists() else []
+    for line in staged:
+        assert (stage / line).is_symlink()
+    for manifest in (root / "push" / "stage.manifests").read_text().splitlines():
+        os.replace(manifest + ".new", manifest)
+    shutil.rmtree(root / "push")
+    return result.stdout, staged, changed
+
+
+def test_stages_changes_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        exports, mappings = _setup(root)
+
+        out, staged, changed = _plan(root, mappings)
+        assert sorted(staged) == [
+            "ws/main/AGENTS.md",
+            "ws/main/memory/Document Inventory.md",
+            "ws/main/memory/docs/Doc - a.md",
+            "ws/main/memory/transcripts/Transcript - t.md",
+        ]
+        assert "  docs: 1 files (0 unchanged)" in out
+        assert changed == [
+            "A /ws/main/memory/docs/Doc - a.md",
+            "A /ws/main/memory/transcripts/Transcript - t.md",
+            "A /ws/main/memory/Document Inventory.md",
+        ]
+
+        out, staged, changed = _plan(root, mappings)
+        assert staged == [] and changed == []
+        assert "(no changes, 4 files up to date)" in out
+
+        # Config-only change: pushed, but no reindex
+        _write(exports / "core-prompts" / "AGENTS.md", "agents v2\n")
+        out, staged, changed = _plan(root, mappings)
+        assert staged == ["ws/main/AGENTS.md"]
+        assert changed == []
+
+
+def test_export_manifest_hashes():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        exports, mappings = _setup(root)
+        doc = exports / "docs" / "Doc - a.md"
+        manifest = exports / ".distill-manifest.json"
+        _write(manifest, json.dumps({"version": "1", "rules_hash": "r", "sources": {
+            "docs/a.md": {"hash": "h1", "outputs": ["docs/Doc - a.md"], "counted": 1}}}))
+        os.utime(doc, (1000, 1000))
+        _plan(root, mappings)
+
+        # Same source hash: the output isn't compared by content
+        doc.write_text("edited by hand\n")
+        os.utime(doc, (1000, 1000))
+        _, staged, _ = _plan(root, mappings)
+        assert staged == []
+
+        # New source hash from a re-export
+        _write(manifest, manifest.read_text().replace('"h1"', '"h2"'))
+        _, staged, changed = _plan(root, mappings)
+        assert staged == ["ws/main/memory/docs/Doc - a.md"]
+        assert changed == ["M /ws/main/memory/docs/Doc - a.md"]
+
+        # Modified after the export manifest: hashed by content
+        doc.write_text("newer\n")
+        _, staged, _ = _plan(root, mappings)
+        assert staged == ["ws/main/memory/docs/Doc - a.md"]
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_stages_changes_once,
+        test_export_manifest_hashes,
+    ]
+
+    print("\nRunning push-plan.py tests...\n")
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ {test.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -376,6 +376,55 @@ HEARTBEAT_OK
         Path(f.name).unlink()
 
 
+def test_pattern_order_decides_type():
+    """The first pattern in order names the type, wherever each one matches."""
+    content = """=== MESSAGE 1 | USER ===
+[Signal <REDACTED-NAME> id:100 2026-01-28 10:00 EST] beta comes before alpha here
+
+=== MESSAGE 2 | ASSISTANT ===
+Noted.
+"""
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+        f.write(content)
+        f.flush()
+
+        stdout, _ = run_remove_noise_with_patterns(
+            f.name, ["alpha::first", "beta::second"], dry_run=True
+        )
+
+        assert "[first]" in stdout
+        assert "[second]" not in stdout
+
+        Path(f.name).unlink()
+
+
+def test_backreference_pattern():
+    """Patterns that can't join the combined regex still match on their own."""
+    content = """=== MESSAGE 1 | USER ===
+[Signal <REDACTED-NAME> id:100 2026-01-28 10:00 EST] again again
+
+=== MESSAGE 2 | ASSISTANT ===
+Heard you the first time.
+
+=== MESSAGE 3 | USER ===
+[Signal <REDACTED-NAME> id:101 2026-01-28 10:01 EST] once
+"""
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as f:
+        f.write(content)
+        f.flush()
+
+        stdout, result = run_remove_noise_with_patterns(f.name, [r"(\w+) \1$::repeat"])
+
+        assert "again again" not in result
+        assert "=== MESSAGE 1 | ASSISTANT ===" in result
+        assert "=== MESSAGE 2 | USER ===" in result
+        assert "once" in result
+
+        Path(f.name).unlink()
+
+
 if __name__ == "__main__":
     test_heartbeat_removal()
     print("✓ test_heartbeat_removal")
@@ -410,4 +459,10 @@ if __name__ == "__main__":
     test_no_builtin_flag()
     print("✓ test_no_builtin_flag")
 
+    test_pattern_order_decides_type()
+    print("✓ test_pattern_order_decides_type")
+
+    test_backreference_pattern()
+    print("✓ test_backreference_pattern")
+
     print("\nAll tests passed!")
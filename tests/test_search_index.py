@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for the full-text search index (distill index / distill search).
+
+Covers:
+- Indexing sessions, intake markdown and canonical files
+- Incremental updates (unchanged, appended, reindexed, removed)
+- Query quoting and filters
+"""
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+TOOL_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(TOOL_ROOT))
+
+from components.distill.lib.search_index import SearchIndex, default_index_roots, fts_query
+
+CANONICAL = """---
+title: "Planning notes"
+slug: 2026-01-20-planning
+date: 2026-01-20
+source: claude
+---
+
+=== MESSAGE 0 | USER ===
+Let's plan the garden irrigation schedule.
+
+=== MESSAGE 1 | ASSISTANT ===
+Water the tomatoes every morning.
+"""
+
+
+def _message_line(text, role="user", ts="2026-01-26T06:04:00.000Z"):
+    return json.dumps({"type": "message", "timestamp": ts,
+                       "message": {"role": role, "content": [{"type": "text", "text": text}]}}) + "\n"
+
+
+def _make_tree(base: Path) -> Path:
+    sessions = base / "agents" / "bot" / "sessions"
+    intake = base / "agents" / "bot" / "intake"
+    reference = base / "reference" / "transcripts"
+    for directory in (sessions, intake, reference):
+        directory.mkdir(parents=True)
+
+    session = sessions / "abc123.jsonl"
+    session.write_text(
+        json.dumps({"type": "session", "id": "abc123", "timestamp": "2026-01-26T06:00:00Z"}) + "\n"
+        + _message_line("How do I rotate the cleanup-reminders.py logs?")
+        + _message_line("Use logrotate for the reminders logs.", role="assistant")
+    )
+    # Converted copy of the session: skipped, its messages are already indexed
+    (intake / "abc123.md").write_text("=== MESSAGE 1 | USER ===\nrotate logs\n")
+    (intake / "pasted.md").write_text("=== MESSAGE 1 | USER ===\nA pasted chat about irrigation\n")
+    (reference / "2026-01-20-planning.md").write_text(CANONICAL)
+    return session
+
+
+def test_index_and_search():
+    """Messages from every source type are found, with their metadata."""
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        _make_tree(base)
+
+        with SearchIndex(base / "index.sqlite") as index:
+            stats = index.update(default_index_roots(base))
+            assert stats.files_seen == 3
+            assert index.counts() == (3, 5)
+
+            hits = index.search(fts_query("cleanup-reminders.py"))
+            assert [(h.session_id, h.message_index, h.role) for h in hits] == [("abc123", 1, "user")]
+            assert hits[0].timestamp.startswith("2026-01-26T06:04")
+            assert "[cleanup-reminders.py]" in hits[0].snippet
+
+            hits = index.search(fts_query("irrigation"))
+            assert sorted(Path(h.path).name for h in hits) == ["2026-01-20-planning.md", "pasted.md"]
+            canonical = [h for h in hits if h.session_id == "2026-01-20-planning"][0]
+            assert canonical.timestamp == "2026-01-20"
+
+            assert [h.role for h in index.search(fts_query("reminders"), role="assistant")] == ["assistant"]
+            assert index.search(fts_query("irrigation"), since="2026-01-25") == []
+
+
+def test_incremental_update():
+    """Grown sessions are appended, edited files reindexed, deleted files dropped."""
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        session = _make_tree(base)
+        db = base / "index.sqlite"
+
+        with SearchIndex(db) as index:
+            index.update(default_index_roots(base))
+
+            stats = index.update(default_index_roots(base))
+            assert stats.files_unchanged == 3 and stats.messages_added == 0
+
+            with open(session, "a") as f:
+                f.write(_message_line("Zanzibar holiday photos"))
+                f.write(_message_line("partial line still being writ")[:30])
+            stats = index.update(default_index_roots(base))
+            assert stats.files_appended == 1 and stats.messages_added == 1
+            assert index.search(fts_query("zanzibar"))[0].message_index == 3
+
+            (base / "agents" / "bot" / "intake" / "pasted.md").unlink()
+            (base / "reference" / "transcripts" / "2026-01-20-planning.md").write_text(
+                CANONICAL.replace("tomatoes", "peppers"))
+            stats = index.update(default_index_roots(base))
+            assert stats.files_removed == 1 and stats.files_reindexed == 1
+            assert index.search(fts_query("tomatoes")) == []
+            assert len(index.search(fts_query("peppers"))) == 1
+            assert index.search(fts_query("pasted")) == []
+
+
+def test_fts_query_quotes_words():
+    """Plain words are quoted so FTS5 operators and punctuation are literal."""
+    assert fts_query('say "hi" AND-OR') == '"say" """hi""" "AND-OR"'
+    assert fts_query("  two   words ") == '"two" "words"'
+
+
+def run_all_tests():
+    """Run all tests and report results."""
+    tests = [
+        test_index_and_search,
+        test_incremental_update,
+        test_fts_query_quotes_words,
+    ]
+
+    print("\nRunning search index tests...\n")
+
+    passed = 0
+    failed = 0
+
+    for test in tests:
+        try:
+            test()
+            print(f"  ✓ {test.__name__}")
+            passed += 1
+        except AssertionError as e:
+            print(f"  ✗ {test.__name__}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"  ✗ {test.__name__}: {type(e).__name__}: {e}")
+            failed += 1
+
+    print(f"\n{passed} passed, {failed} failed")
+    return failed == 0
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
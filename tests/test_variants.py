@@ -25,11 +25,18 @@ from components.distill.lib.variants import (
     generate_variants,
     generate_variants_from_content,
     VariantOptions,
+    DocumentCache,
     _fuzzy_find,
     _normalize_for_matching,
+    apply_redaction,
+    get_term_matcher,
 )
-from components.distill.lib.models import SectionSpec, CodeBlockSpec
+from components.distill.lib.models import (
+    SectionSpec, CodeBlockSpec, Sensitivity, SensitivityTerms, SensitivitySection
+)
+from components.distill.lib.content import AnchorIndex, SpanEdits
 from components.distill.lib.canonicalize import canonicalize, load_corrections
+from components.distill.lib.parsing import UI_ARTIFACTS, remove_ui_artifacts, clean_bruba_artifacts
 
 try:
     import pytest
@@ -164,6 +171,30 @@ def test_ui_artifacts_cleaned_in_variants():
     assert "5 steps" not in result.transcript
 
 
+def test_remove_ui_artifacts_matches_sequential_patterns():
+    """The single-scan cleaner matches applying UI_ARTIFACTS one by one."""
+    samples = [
+        "Hello\n4:02 PM\n\nShow more\n\n\nWorld",
+        "\t 4:02 PM  \n---  \nPASTED  \nShow moreAM  \n",
+        "Claude\n\n14s\n\n2 / 2\nThought process\n  indented\n5 Steps",
+        "R\n\n\n\n* \n1. \nFailed to view\npasted\nShow less\nShow more11:34 AM",
+        "text\n---\n\n   \n---\nmore text\n3 steps",
+    ]
+    for sample in samples:
+        expected = sample
+        for pattern in UI_ARTIFACTS:
+            expected = pattern.sub('', expected)
+        assert remove_ui_artifacts(sample) == expected, repr(sample)
+
+
+def test_clean_bruba_artifacts():
+    """Bruba/Whisper artifacts are transformed; plain text is untouched."""
+    content = ("[Audio] User text: [Signal Michael id:uuid:1 +5s 2026-01-26 18:49 EST] "
+               "<media:audio> Transcript: [00:00.000 --> 00:04.000]  Hello there")
+    assert clean_bruba_artifacts(content) == "[Transcript] Hello there"
+    assert clean_bruba_artifacts("Nothing to see here.") == "Nothing to see here."
+
+
 # =============================================================================
 # Unit tests for parse_canonical_file
 # =============================================================================
@@ -306,6 +337,143 @@ Part C."""
     assert "Part C" in result
 
 
+def test_apply_section_removals_reports_failures():
+    """Unresolved sections are reported; an enclosing section still applies."""
+    content = "Intro. BEGIN one MIDDLE two END Outro."
+    specs = [
+        SectionSpec(start="BEGIN", end="END", description="outer"),
+        SectionSpec(start="MIDDLE", end="Outro", description="inside outer"),
+        SectionSpec(start="Intro", end="Outro", description="overlaps outer"),
+        SectionSpec(start="missing", end="END"),
+        SectionSpec(start="Intro", end="nowhere"),
+    ]
+    failures = []
+
+    result, count = apply_section_removals(content, specs, failures=failures)
+
+    # Same as applying each section in turn to the edited text
+    assert count == 2
+    assert result == "\n\n[Removed: overlaps outer]\n\n."
+    assert [(f.spec.description, f.reason) for f in failures] == [
+        ("inside outer", "start_not_found"),
+        ("", "start_not_found"),
+        ("", "start_not_found"),
+    ]
+
+
+def test_apply_section_removals_nested():
+    """Nested removals give the sequential result in either order."""
+    content = "intro\nOUTER START\nalpha\nINNER START\nbeta\nINNER END\ngamma\nOUTER END\noutro"
+    inner = SectionSpec(start="INNER START", end="INNER END")
+    outer = SectionSpec(start="OUTER START", end="OUTER END")
+    expected = "intro\n\n\n[Section removed]\n\n\noutro"
+
+    assert apply_section_removals(content, [inner, outer]) == (expected, 2)
+    assert apply_section_removals(content, [outer, inner]) == (expected, 1)
+
+
+def test_apply_redaction_nested_sections():
+    """A sensitive section enclosing an earlier one is still redacted whole."""
+    content = "Notes. HEALTH START diagnosis details PERSONAL START name PERSONAL END more HEALTH END Done."
+    health = SensitivitySection(start="HEALTH START", end="HEALTH END", tags=["health"])
+    personal = SensitivitySection(start="PERSONAL START", end="PERSONAL END", tags=["personal"])
+    expected = "Notes. \n\n[Redacted: health content]\n\n Done."
+
+    failures = []
+    result, count = apply_redaction(
+        content, Sensitivity(sections=[personal, health]), ["health", "personal"], failures=failures
+    )
+    assert (result, count) == (expected, 2)
+    assert failures == []
+
+    result, count = apply_redaction(
+        content, Sensitivity(sections=[health, personal]), ["health", "personal"]
+    )
+    assert (result, count) == (expected, 1)
+
+
+def test_apply_section_removals_partial_overlap():
+    """A section ending inside an earlier removal resolves against the edited text."""
+    content = "A. one [x] two END three [/x] B. END C."
+    specs = [
+        SectionSpec(start="[x]", end="[/x]", description="x"),
+        SectionSpec(start="one", end="END", description="one"),
+    ]
+
+    result, count = apply_section_removals(content, specs)
+
+    assert count == 2
+    assert result == "A. \n\n[Removed: one]\n\n C."
+
+
+def test_apply_section_removals_skips_claimed_anchors():
+    """A repeated anchor resolves to the next occurrence outside earlier removals."""
+    content = "A. [x] one [/x] B. [x] two [/x] C."
+    specs = [
+        SectionSpec(start="[x]", end="[/x]", description="first"),
+        SectionSpec(start="[x]", end="[/x]", description="second"),
+    ]
+
+    result, count = apply_section_removals(content, specs)
+
+    assert count == 2
+    assert "one" not in result and "two" not in result
+    assert result.index("[Removed: first]") < result.index("B.") < result.index("[Removed: second]")
+
+
+def test_span_edits_apply_in_one_pass():
+    """SpanEdits applies sorted replacements, absorbs enclosed spans, rejects partial overlaps."""
+    edits = SpanEdits("0123456789")
+    assert edits.add(6, 8, "b")
+    assert edits.add(1, 3, "a")
+    assert not edits.add(2, 4, "x")
+    assert not edits.add(7, 9, "x")
+    assert edits.add(3, 3, "+")
+    assert edits.covering(7) == (6, 8)
+    assert edits.covering(8) is None
+    assert edits.covering(4, 7) == (6, 8)
+    assert edits.apply() == "0a+345b89"
+    assert edits.add(0, 4, "c")
+    assert len(edits) == 2
+    assert edits.apply() == "c45b89"
+
+
+# =============================================================================
+# Unit tests for term redaction
+# =============================================================================
+
+def test_apply_redaction_terms_single_pass():
+    """All terms are redacted case-insensitively with per-term hit counts."""
+    content = "Alice met bob. ALICE had a headache; Bob did not."
+    sensitivity = Sensitivity(terms=SensitivityTerms(
+        names=["Alice", "Bob"], health=["headache"]
+    ))
+    hits = {}
+
+    result, count = apply_redaction(
+        content, sensitivity, ["names", "health"], term_hits=hits
+    )
+
+    assert result == ("[REDACTED] met [REDACTED]. [REDACTED] had a [REDACTED]; "
+                      "[REDACTED] did not.")
+    assert count == 5
+    assert hits == {"Alice": 2, "Bob": 2, "headache": 1}
+
+
+def test_apply_redaction_prefers_longest_term():
+    """A longer term wins over a shorter one it contains."""
+    sensitivity = Sensitivity(terms=SensitivityTerms(names=["Bob", "Bobby Tables"]))
+    result, count = apply_redaction("Ask Bobby Tables or Bob.", sensitivity, ["names"])
+    assert result == "Ask [REDACTED] or [REDACTED]."
+    assert count == 2
+
+
+def test_term_matcher_cached_per_term_set():
+    """The compiled matcher is reused for the same term set."""
+    assert get_term_matcher(("a", "b")) is get_term_matcher(("a", "b"))
+    assert get_term_matcher(("a", "b")) is not get_term_matcher(("a",))
+
+
 # =============================================================================
 # Unit tests for fuzzy matching
 # =============================================================================
@@ -342,6 +510,39 @@ def test_normalize_for_matching():
     assert _normalize_for_matching("Punctuation! Is? Removed.") == "punctuation is removed"
 
 
+def test_anchor_index_punctuation_in_first_word():
+    """Normalized match works when the anchor's first word has punctuation."""
+    content = "Intro text.\n\nDon't   stop -- now, please."
+    pos = _fuzzy_find(content, "dont stop now")
+    assert pos == content.index("Don't")
+
+
+def test_anchor_index_start_offset():
+    """Lookups honour the start offset in original coordinates."""
+    content = "Next step: deploy. Later... Next, step: deploy!"
+    index = AnchorIndex(content)
+    first = index.find("next step deploy")
+    second = index.find("next step deploy", first + 1)
+    assert first == 0
+    assert second == content.index("Next,")
+    assert index.find("next step deploy", second + 1) is None
+
+
+def test_anchor_index_maps_back_across_collapsed_text():
+    """Offsets map back to the original across collapsed whitespace."""
+    content = "  a,   b;\n\n  c --  target   phrase  here. d"
+    index = AnchorIndex(content)
+    pos = index.find("Target phrase, here")
+    assert pos == content.index("target")
+
+
+def test_anchor_index_many_common_first_words():
+    """Common first words don't change the result."""
+    content = "the cat " * 2000 + "the dog's bowl"
+    pos = _fuzzy_find(content, "the dogs bowl")
+    assert pos == content.index("the dog's")
+
+
 # =============================================================================
 # Unit tests for process_code_blocks
 # =============================================================================
@@ -522,6 +723,106 @@ Also keep this.
     assert "[Removed: removed]" in result.transcript
 
 
+# =============================================================================
+# Unit tests - DocumentCache
+# =============================================================================
+
+CACHE_DOC = """---
+title: "Cached"
+slug: cached
+date: 2026-01-24
+sensitivity:
+  terms:
+    names: [Alice]
+---
+Alice said hello.
+---
+
+<!-- === BACKMATTER === -->
+
+## Summary
+
+Cached summary.
+"""
+
+
+def test_document_cache_parses_once():
+    """Test that repeated parse() calls reuse the first result."""
+    import tempfile
+    calls = []
+
+    def counting_parser(content):
+        calls.append(content)
+        return parse_canonical_file(content)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "doc.md"
+        path.write_text(CACHE_DOC, encoding='utf-8')
+        cache = DocumentCache()
+
+        first = cache.parse(path, counting_parser)
+        second = cache.parse(path, counting_parser)
+
+        assert len(calls) == 1
+        assert first is second
+        assert first[0].title == "Cached"
+
+
+def test_document_cache_invalidates_on_change():
+    """Test that a changed file (mtime/size) is re-read and re-parsed."""
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "doc.md"
+        path.write_text(CACHE_DOC, encoding='utf-8')
+        cache = DocumentCache()
+
+        assert cache.parse(path)[0].title == "Cached"
+
+        path.write_text(CACHE_DOC.replace('"Cached"', '"Edited title"'), encoding='utf-8')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert cache.parse(path)[0].title == "Edited title"
+
+
+def test_document_cache_reraises_parse_errors():
+    """Test that a cached parse failure is raised on every lookup."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "broken.md"
+        path.write_text("no frontmatter\n", encoding='utf-8')
+        cache = DocumentCache()
+
+        for _ in range(2):
+            try:
+                cache.parse(path)
+                assert False, "Should have raised ValueError"
+            except ValueError as e:
+                assert "frontmatter" in str(e)
+
+
+def test_generate_variants_from_parsed_matches_path():
+    """Test that passing a parsed document gives the same output as a path."""
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "doc.md"
+        path.write_text(CACHE_DOC, encoding='utf-8')
+        options = VariantOptions(redact_categories=['names'])
+
+        from_path = generate_variants(path, options)
+        from_parsed = generate_variants(
+            None, options, parsed=DocumentCache().parse(path)
+        )
+
+        assert from_parsed.transcript == from_path.transcript
+        assert from_parsed.summary == from_path.summary
+        assert "[REDACTED] said hello" in from_parsed.transcript
+
+
 def run_all_tests():
     """Run all tests and report results."""
     tests = [
@@ -531,6 +832,8 @@ def run_all_tests():
         test_code_block_processing,
         test_full_export_variant_generation,
         test_ui_artifacts_cleaned_in_variants,
+        test_remove_ui_artifacts_matches_sequential_patterns,
+        test_clean_bruba_artifacts,
         # Unit tests - parse_canonical_file
         test_parse_canonical_file_basic,
         test_parse_canonical_file_no_backmatter,
@@ -540,12 +843,26 @@ def run_all_tests():
         test_apply_section_removals_not_found,
         test_apply_section_removals_with_replacement,
         test_apply_section_removals_multiple,
+        test_apply_section_removals_reports_failures,
+        test_apply_section_removals_skips_claimed_anchors,
+        test_apply_section_removals_nested,
+        test_apply_section_removals_partial_overlap,
+        test_apply_redaction_nested_sections,
+        test_span_edits_apply_in_one_pass,
+        # Unit tests - term redaction
+        test_apply_redaction_terms_single_pass,
+        test_apply_redaction_prefers_longest_term,
+        test_term_matcher_cached_per_term_set,
         # Unit tests - fuzzy matching
         test_fuzzy_find_exact,
         test_fuzzy_find_case_insensitive,
         test_fuzzy_find_normalized,
         test_fuzzy_find_not_found,
         test_normalize_for_matching,
+        test_anchor_index_punctuation_in_first_word,
+        test_anchor_index_start_offset,
+        test_anchor_index_maps_back_across_collapsed_text,
+        test_anchor_index_many_common_first_words,
         # Unit tests - process_code_blocks
         test_process_code_blocks_keep,
         test_process_code_blocks_summarize,
@@ -555,6 +872,11 @@ def run_all_tests():
         test_generate_variants_from_content_basic,
         test_generate_variants_options,
         test_generate_variants_with_sections_remove,
+        # Unit tests - DocumentCache
+        test_document_cache_parses_once,
+        test_document_cache_invalidates_on_change,
+        test_document_cache_reraises_parse_errors,
+        test_generate_variants_from_parsed_matches_path,
     ]
 
     print("\nRunning variants tests...\n")
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Assemble prompt files for every agent in one run.
+
+Replaces the per-section bash loop in assemble-prompts.sh: config.yaml is
+parsed once (from parse-yaml.py's snapshot when unchanged), each template,
+section and component snippet is read once and shared across agents, and
+${VAR} substitution is a single regex pass per chunk.
+
+Section entries resolve the same way assemble-prompts.sh documents:
+base / manager-base / web-base / guru-base templates, bot:NAME sections
+from the mirror, component snippets (name or name:variant), then template
+sections (AGENTS.md only).
+
+Each agent's component hashes are written to assembled/section-hashes.json
+so detect-conflicts.py can compare the mirror without re-rendering.
+
+Usage:
+    assemble-prompts.py <config> assemble [options] AGENT...
+    assemble-prompts.py <config> render AGENT FILE
+
+Examples:
+    assemble-prompts.py config.yaml assemble --agents-dir agents bruba-main
+    assemble-prompts.py config.yaml render bruba-main components/voice/prompts/AGENTS.snippet.md
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Parsing (and the JSON snapshot cache) is shared with parse-yaml.py
+_spec = importlib.util.spec_from_file_location("parse_yaml", Path(__file__).with_name("parse-yaml.py"))
+parse_yaml = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parse_yaml)
+
+
+# Prompt files managed by assembly (others are managed directly on the bot)
+PROMPT_FILES = ['agents', 'tools', 'heartbeat']
+
+# Base template entries -> (templates/prompts subdir, log label)
+BASE_TEMPLATES = {
+    'base': ('', 'Base'),
+    'manager-base': ('manager', 'Manager-Base'),
+    'web-base': ('web', 'Web-Base'),
+    'guru-base': ('guru', 'Guru-Base'),
+}
+
+PROMPT_LIMIT = 20000
+
+# Per-agent component hashes, written to agents/<name>/assembled/
+HASH_MANIFEST = 'section-hashes.json'
+
+VARIABLE_PATTERN = re.compile(r'\$\{([A-Za-z0-9_]+)\}')
+
+
+def load_yaml(config_file):
+    """Parse config.yaml, from its snapshot if the content is unchanged."""
+    with open(config_file) as f:
+        return parse_yaml.load_data(config_file, f.read()) or {}
+
+
+def agent_variables(config, agent_name, shared_tools):
+    """Substitution values for an agent: custom variables, then built-ins."""
+    agents = config.get('agents') or {}
+    agent = agents.get(agent_name) or {}
+    identity = agent.get('identity') or {}
+    peer = agents.get(identity.get('peer_agent', '')) or {}
+    peer_identity = peer.get('identity') or {}
+
+    values = {k: str(v) for k, v in (agent.get('variables') or {}).items()}
+    # Built-ins take precedence over a custom variable of the same name
+    values.update({k: '' if v is None else str(v) for k, v in {
+        'WORKSPACE': agent.get('workspace') or '',
+        'AGENT_NAME': agent_name,
+        'SHARED_TOOLS': shared_tools,
+        'HUMAN_NAME': identity.get('human_name', ''),
+        'SIGNAL_UUID': identity.get('signal_uuid', ''),
+        'PEER_AGENT': identity.get('peer_agent', ''),
+        'PEER_HUMAN_NAME': peer_identity.get('human_name', ''),
+    }.items()})
+    return values
+
+
+def substitute(text, values):
+    """Replace known ${VAR} references; unknown ones are left as-is.
+
+    Trailing newlines collapse to one, as the shell version did.
+    """
+    text = VARIABLE_PATTERN.sub(lambda m: values.get(m.group(1), m.group(0)), text)
+    return text.rstrip('\n') + '\n'
+
+
+def section_hash(body):
+    """Content hash of a section body, ignoring trailing newlines."""
+    return hashlib.sha256(body.rstrip('\n').encode('utf-8')).hexdigest()
+
+
+def bot_section(mirror_text, name):
+    """Extract a BOT-MANAGED section (markers included) from mirror text."""
+    if mirror_text is None:
+        return None
+    start = f"<!-- BOT-MANAGED: {name} -->"
+    end = f"<!-- /BOT-MANAGED: {name} -->"
+    lines = mirror_text.split('\n')
+    try:
+        first = lines.index(start)
+        last = lines.index(end, first + 1)
+    except ValueError:
+        return None
+    return '\n'.join(lines[first:last + 1]) + '\n'
+
+
+class Assembler:
+    """Resolves section entries against the repo, caching file reads."""
+
+    def __init__(self, root, config, agents_dir, shared_tools, dry_run=False, log_file=None, verbose=False):
+        self.root = Path(root)
+        self.config = config
+        self.agents_dir = Path(agents_dir)
+        self.shared_tools = shared_tools
+        self.dry_run = dry_run
+        self.verbose = verbose
+        self.log_handle = open(log_file, 'a') if log_file else None
+        self._files = {}
+
+        self.total_files = 0
+        self.total_sections = 0
+        self.total_missing = 0
+
+    def log(self, message):
+        """Same format as lib.sh log(): always to the log file, echoed if verbose."""
+        if self.log_handle:
+            stamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self.log_handle.write(f"[{stamp}] {message}\n")
+        if self.verbose:
+            print(message)
+
+    def read(self, path):
+        """File content, or None if missing; each path is read once."""
+        path = Path(path)
+        if path not in self._files:
+            try:
+                self._files[path] = path.read_text(encoding='utf-8')
+            except (FileNotFoundError, IsADirectoryError):
+                self._files[path] = None
+        return self._files[path]
+
+    def agent_config(self, agent_name):
+        return (self.config.get('agents') or {}).get(agent_name) or {}
+
+    def resolve(self, entry, prompt_name, values, mirror_text):
+        """Classify an entry and build its content.
+
+        Returns (section_type, content, body): content is the text to
+        write (None when missing), body a component's substituted snippet.
+        """
+        upper = prompt_name.upper()
+
+        if entry in BASE_TEMPLATES:
+            subdir = BASE_TEMPLATES[entry][0]
+            text = self.read(self.root / 'templates' / 'prompts' / subdir / f"{upper}.md")
+            if text is None:
+                return 'missing', None, None
+            return entry, substitute(text, values) + '\n', None
+
+        if entry.startswith('bot:'):
+            return 'bot', bot_section(mirror_text, entry[4:]), None
+
+        # component or component:variant (resolves to exactly one file)
+        component, _, variant = entry.partition(':')
+        snippet = f"{upper}.{variant}.snippet.md" if variant else f"{upper}.snippet.md"
+        text = self.read(self.root / 'components' / component / 'prompts' / snippet)
+        if text is not None:
+            body = substitute(text, values)
+            return 'component', f"<!-- COMPONENT: {entry} -->\n{body}<!-- /COMPONENT: {entry} -->\n\n", body
+
+        # Template sections are only used for AGENTS.md
+        if prompt_name == 'agents':
+            text = self.read(self.root / 'templates' / 'prompts' / 'sections' / f"{entry}.md")
+            if text is not None:
+                return 'section', (f"<!-- SECTION: {entry} -->\n" + substitute(text, values)
+                                   + f"<!-- /SECTION: {entry} -->\n\n"), None
+
+        return 'missing', None, None
+
+    def assemble_prompt_file(self, agent_name, prompt_name, values):
+        """Assemble one prompt file for an agent.
+
+        Returns {component entry: hash} for the components written.
+        """
+        upper = prompt_name.upper()
+        sections = self.agent_config(agent_name).get(f"{prompt_name}_sections") or []
+
+        if not sections:
+            self.log(f"  Skipped: {upper}.md (no {prompt_name}_sections in config)")
+            return {}
+
+        self.log("")
+        self.log(f"Assembling: {upper}.md")
+
+        agent_dir = self.agents_dir / agent_name
+        mirror_text = self.read(agent_dir / 'mirror' / 'prompts' / f"{upper}.md")
+
+        base_added = 0
+        counts = {'component': 0, 'section': 0, 'bot': 0}
+        missing = 0
+        chunks = []
+        hashes = {}
+
+        for entry in sections:
+            entry = str(entry)
+            section_type, content, body = self.resolve(entry, prompt_name, values, mirror_text)
+
+            if section_type == 'missing':
+                self.log(f"  ! Missing: {entry} (not found as component or section for {upper})")
+                missing += 1
+            elif self.dry_run:
+                if section_type in BASE_TEMPLATES:
+                    self.log(f"  Would add {section_type} template")
+                elif section_type == 'bot':
+                    self.log(f"  Would add bot section: {entry[4:]}")
+                else:
+                    self.log(f"  Would add {section_type}: {entry}")
+            elif section_type == 'bot' and content is None:
+                self.log(f"  ! Missing bot section: {entry[4:]} (not in mirror)")
+                missing += 1
+            else:
+                chunks.append(content)
+                if section_type in BASE_TEMPLATES:
+                    subdir, label = BASE_TEMPLATES[section_type]
+                    template = '/'.join(p for p in ('templates/prompts', subdir, f"{upper}.md") if p)
+                    self.log(f"  + {label}: {template}")
+                    base_added = 1
+                else:
+                    name = entry[4:] if section_type == 'bot' else entry
+                    self.log(f"  + {section_type.capitalize()}: {name}")
+                    counts[section_type] += 1
+                    if body is not None:
+                        hashes[entry] = section_hash(body)
+
+        if not self.dry_run:
+            output_file = agent_dir / 'exports' / 'core-prompts' / f"{upper}.md"
+            output_file.write_text(''.join(chunks), encoding='utf-8')
+
+        file_total = base_added + sum(counts.values())
+        if not self.dry_run and file_total > 0:
+            self.total_files += 1
+            self.total_sections += file_total
+
+            parts = []
+            if base_added:
+                parts.append("base")
+            if counts['component']:
+                parts.append(f"{counts['component']} components")
+            if counts['section']:
+                parts.append(f"{counts['section']} sections")
+            if counts['bot']:
+                parts.append(f"{counts['bot']} bot")
+            print(f"  {upper}.md ({','.join(parts)})")
+
+        self.total_missing += missing
+        return hashes
+
+    def assemble_agent(self, agent_name):
+        """Assemble every configured prompt file for one agent."""
+        agent = self.agent_config(agent_name)
+
+        if not agent.get('prompts'):
+            self.log(f"Skipping {agent_name} (no prompts configured)")
+            return
+        if not agent.get('workspace'):
+            self.log(f"Skipping {agent_name} (no workspace)")
+            return
+
+        self.log("")
+        self.log(f"=== Agent: {agent_name} ===")
+        print("")
+        print(f"Agent: {agent_name}")
+
+        if not self.dry_run:
+            (self.agents_dir / agent_name / 'exports' / 'core-prompts').mkdir(parents=True, exist_ok=True)
+
+        values = agent_variables(self.config, agent_name, self.shared_tools)
+        manifest = {}
+        for prompt_name in PROMPT_FILES:
+            hashes = self.assemble_prompt_file(agent_name, prompt_name, values)
+            if hashes:
+                manifest[f"{prompt_name.upper()}.md"] = hashes
+
+        # Component hashes as assembled, for detect-conflicts.py to compare
+        # the mirror against without re-rendering
+        if not self.dry_run:
+            manifest_file = self.agents_dir / agent_name / 'assembled' / HASH_MANIFEST
+            manifest_file.parent.mkdir(parents=True, exist_ok=True)
+            manifest_file.write_text(json.dumps(manifest, indent=2, sort_keys=True) + '\n')
+
+    def run(self, agent_names):
+        """Assemble all agents, then print the summary and prompt sizes.
+
+        Returns the exit code (1 if any section was missing).
+        """
+        for agent_name in agent_names:
+            self.assemble_agent(agent_name)
+
+        self.log("")
+        self.log("=== Summary ===")
+        if self.dry_run:
+            self.log("Dry run complete")
+        else:
+            self.log(f"Assembled: {self.total_files} files, {self.total_sections} total sections")
+
+        print("")
+        print(f"Assembled: {self.total_files} prompt files")
+
+        print("")
+        print("Prompt sizes:")
+        for agent_name in agent_names:
+            core_dir = self.agents_dir / agent_name / 'exports' / 'core-prompts'
+            if not core_dir.is_dir():
+                continue
+            for prompt_file in sorted(core_dir.glob('*.md')):
+                if not prompt_file.is_file():
+                    continue
+                chars = prompt_file.stat().st_size
+                if chars > PROMPT_LIMIT:
+                    print(f"  ⚠️  {agent_name}/{prompt_file.name}: {chars} chars (OVER LIMIT: {PROMPT_LIMIT})")
+                else:
+                    print(f"  ✓ {agent_name}/{prompt_file.name}: {chars} chars")
+
+        if self.log_handle:
+            self.log_handle.close()
+
+        if self.total_missing > 0:
+            print(f"WARNING: {self.total_missing} sections missing")
+            return 1
+        return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Assemble prompt files from config-driven section order")
+    parser.add_argument("config", help="Path to config.yaml (its directory is the repo root)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    assemble_parser = sub.add_parser("assemble", help="Assemble prompt files for agents")
+    assemble_parser.add_argument("agents", nargs="*", help="Agent names (default: all in config)")
+    assemble_parser.add_argument("--agents-dir", help="Per-agent directory root (default: <root>/agents)")
+    assemble_parser.add_argument("--shared-tools", default="", help="Value for ${SHARED_TOOLS}")
+    assemble_parser.add_argument("--log-file", help="Append log lines here")
+    assemble_parser.add_argument("--dry-run", "-n", action="store_true", help="Show what would be assembled")
+    assemble_parser.add_argument("--verbose", "-v", action="store_true", help="Echo log lines")
+
+    render_parser = sub.add_parser("render", help="Print a file with an agent's substitutions applied")
+    render_parser.add_argument("agent", help="Agent name")
+    render_parser.add_argument("file", help="Template or snippet to render")
+    render_parser.add_argument("--shared-tools", default="", help="Value for ${SHARED_TOOLS}")
+
+    args = parser.parse_args()
+
+    try:
+        config = load_yaml(args.config)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.command == "render":
+        values = agent_variables(config, args.agent, args.shared_tools)
+        sys.stdout.write(substitute(Path(args.file).read_text(encoding='utf-8'), values))
+        return
+
+    root = Path(args.config).resolve().parent
+    assembler = Assembler(
+        root, config,
+        agents_dir=args.agents_dir or root / 'agents',
+        shared_tools=args.shared_tools,
+        dry_run=args.dry_run,
+        log_file=args.log_file,
+        verbose=args.verbose,
+    )
+    sys.exit(assembler.run(args.agents or list((config.get('agents') or {}).keys())))
+
+
+if __name__ == '__main__':
+    main()
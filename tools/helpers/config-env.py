@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Load config.yaml once and print shell variables for lib.sh.
+
+Each run prints one block of shell-quoted assignments that lib.sh
+evaluates, instead of starting a Python interpreter per variable. The
+parse is served from parse-yaml.py's snapshot when config.yaml is unchanged.
+
+Usage:
+    config-env.py <config> agent <name>       # AGENT_* variables (load_agent_config)
+    config-env.py <config> vault              # VAULT_* variables (load_vault_config)
+    config-env.py <config> agents [--flag F]  # Agent names, one per line
+
+Examples:
+    eval "$(config-env.py config.yaml agent bruba-main)"
+    config-env.py config.yaml agents --flag content_pipeline
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import shlex
+import sys
+from pathlib import Path
+
+# Parsing (and the JSON snapshot cache) is shared with parse-yaml.py
+_spec = importlib.util.spec_from_file_location("parse_yaml", Path(__file__).with_name("parse-yaml.py"))
+parse_yaml = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parse_yaml)
+
+
+# Used when the agent can't be read from config.yaml
+AGENT_DEFAULTS = {'workspace': None, 'prompts': [], 'remote_path': 'memory', 'content_pipeline': False}
+
+
+def load_yaml(config_file):
+    """Parse config.yaml, from its snapshot if the content is unchanged."""
+    with open(config_file) as f:
+        return parse_yaml.load_data(config_file, f.read())
+
+
+def assign(name, value):
+    """Format a shell-eval-safe assignment; lists become bash arrays."""
+    if isinstance(value, list):
+        return f"{name}=(" + ' '.join(shlex.quote(str(item)) for item in value) + ")"
+    return f"{name}={shlex.quote(value if isinstance(value, str) else str(value))}"
+
+
+def agent_data(config, agent_name):
+    """Collect an agent's settings, falling back to defaults on any error."""
+    try:
+        agents = config.get('agents', {})
+        agent = agents.get(agent_name, {})
+        identity = agent.get('identity', {})
+        peer_identity = agents.get(identity.get('peer_agent', ''), {}).get('identity', {})
+        data = {
+            'workspace': agent.get('workspace'),
+            'prompts': agent.get('prompts', []),
+            'remote_path': agent.get('remote_path', 'memory'),
+            'content_pipeline': agent.get('content_pipeline', False),
+            'identity': identity,
+            'peer_human_name': peer_identity.get('human_name', ''),
+            'variables': agent.get('variables', {}),
+        }
+        # Round-trip so values look the same as they do in JSON
+        return json.loads(json.dumps(data))
+    except Exception:
+        return dict(AGENT_DEFAULTS)
+
+
+def agent_assignments(config, agent_name):
+    """Shell assignments for load_agent_config."""
+    d = agent_data(config, agent_name)
+    identity = d.get('identity', {})
+    return [
+        assign('AGENT_WORKSPACE', d.get('workspace') or ''),
+        assign('AGENT_PROMPTS', json.dumps(d.get('prompts', []))),
+        assign('AGENT_REMOTE_PATH', d.get('remote_path') or 'memory'),
+        assign('AGENT_CONTENT_PIPELINE', 'true' if d.get('content_pipeline') else 'false'),
+        assign('AGENT_HUMAN_NAME', identity.get('human_name', '')),
+        assign('AGENT_SIGNAL_UUID', identity.get('signal_uuid', '')),
+        assign('AGENT_PEER_AGENT', identity.get('peer_agent', '')),
+        assign('AGENT_PEER_HUMAN_NAME', d.get('peer_human_name', '')),
+        assign('AGENT_CUSTOM_VARIABLES', json.dumps(d.get('variables', {}))),
+    ]
+
+
+def vault_assignments(config):
+    """Shell assignments for load_vault_config."""
+    try:
+        vault = config.get('vault', {})
+        enabled = bool(vault.get('enabled'))
+    except Exception:
+        enabled = False
+
+    if not enabled:
+        return [assign('VAULT_ENABLED', 'false'), assign('VAULT_PATH', ''),
+                assign('VAULT_DIRS', []), assign('VAULT_FILES', [])]
+
+    try:
+        path = os.path.expanduser(vault['path'])
+    except Exception:
+        path = ''
+
+    return [
+        assign('VAULT_ENABLED', 'true'),
+        assign('VAULT_PATH', path),
+        assign('VAULT_DIRS', _entries(vault, 'dirs')),
+        assign('VAULT_FILES', _entries(vault, 'files')),
+    ]
+
+
+def _entries(section, key):
+    """A list setting, or [] if it's missing or not a list."""
+    try:
+        return list(section.get(key, []))
+    except Exception:
+        return []
+
+
+def agent_names(config, flag=None):
+    """Configured agent names, optionally only those with a truthy flag."""
+    agents = config.get('agents', {})
+    if flag is None:
+        return list(agents.keys())
+    return [name for name, cfg in agents.items() if cfg.get(flag, False)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Print config.yaml values as shell variables")
+    parser.add_argument("config", help="Path to config.yaml")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    agent_parser = sub.add_parser("agent", help="AGENT_* variables for one agent")
+    agent_parser.add_argument("name", help="Agent name")
+
+    sub.add_parser("vault", help="VAULT_* variables")
+
+    agents_parser = sub.add_parser("agents", help="List agent names")
+    agents_parser.add_argument("--flag", help="Only agents with this setting true (e.g. content_pipeline)")
+
+    args = parser.parse_args()
+
+    if args.command == "agents":
+        # Errors here fail the call, as the old per-list queries did
+        try:
+            names = agent_names(load_yaml(args.config), args.flag)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        for name in names:
+            print(name)
+        return
+
+    try:
+        config = load_yaml(args.config)
+    except Exception:
+        config = None
+
+    if args.command == "agent":
+        lines = agent_assignments(config, args.name)
+    else:
+        lines = vault_assignments(config)
+    print('\n'.join(lines))
+
+
+if __name__ == '__main__':
+    main()
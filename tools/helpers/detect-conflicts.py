@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Detect conflicts between mirrored prompt files and config/components.
+
+Each mirror file is parsed once into a map of its BOT-MANAGED, COMPONENT
+and SECTION blocks with content hashes. Components are checked against the
+hashes assemble-prompts.py recorded in assembled/section-hashes.json; an
+entry with no recorded hash falls back to rendering the snippet.
+
+Conflicts detected:
+    1. New BOT-MANAGED sections in mirror not in config
+    2. New COMPONENT sections in mirror not in config
+    3. Component content differs from what was assembled (bot edited it)
+
+Usage:
+    detect-conflicts.py <config> check [options] AGENT...
+    detect-conflicts.py <config> show [options] AGENT FILE KIND NAME
+
+Examples:
+    detect-conflicts.py config.yaml check --agents-dir agents bruba-main
+    detect-conflicts.py config.yaml check --blocked bruba-main bruba-manager
+    detect-conflicts.py config.yaml show bruba-main agents BOT-MANAGED exec-approvals
+
+Exit codes: 0 = no conflicts (or section shown), 1 = conflicts (or section
+not found), 2 = error.
+"""
+
+import argparse
+import importlib.util
+import json
+import re
+import sys
+from pathlib import Path
+
+# Config loading, substitution and hashing are shared with assembly
+_spec = importlib.util.spec_from_file_location("assemble_prompts", Path(__file__).with_name("assemble-prompts.py"))
+assemble_prompts = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(assemble_prompts)
+
+
+MARKER_PATTERN = re.compile(r'^<!-- (/?)(BOT-MANAGED|COMPONENT|SECTION): (.+) -->$')
+BOT_NAME_PATTERN = re.compile(r'<!-- BOT-MANAGED: ([^>]+) -->')
+COMPONENT_NAME_PATTERN = re.compile(r'<!-- COMPONENT: ([^>]+) -->')
+HEADING_PATTERN = re.compile(r'^## (.+)$')
+
+# Entries that are never component snippets
+NON_COMPONENT_ENTRIES = ('base', 'manager-base')
+
+
+class MirrorFile:
+    """A mirror prompt file parsed in one pass.
+
+    sections maps (kind, name) to the block's lines (markers excluded), for
+    the first complete block of each name; positions maps (kind, name) to the
+    section or heading it follows.
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.sections = {}
+        self.positions = {}
+
+        lines = text.split('\n')
+        if text.endswith('\n'):
+            lines.pop()
+
+        opened = {}
+        prev = ''
+        for i, line in enumerate(lines):
+            match = MARKER_PATTERN.match(line)
+            if not match:
+                heading = HEADING_PATTERN.match(line)
+                if heading and not prev:
+                    prev = f"after-heading:{heading.group(1)}"
+                continue
+
+            closing, kind, name = match.groups()
+            key = (kind, name)
+            if closing:
+                if key in opened and key not in self.sections:
+                    self.sections[key] = lines[opened[key] + 1:i]
+                continue
+
+            opened.setdefault(key, i)
+            self.positions.setdefault(key, prev)
+            if ' ' not in name:
+                prev = f"bot:{name}" if kind == 'BOT-MANAGED' else name
+
+    def names(self, pattern):
+        """Marker names in file order (duplicates kept), as grep -o found them."""
+        return [word for found in pattern.findall(self.text) for word in found.split()]
+
+    def content(self, kind, name):
+        """A block's text (one newline per line), or None if not found."""
+        lines = self.sections.get((kind, name))
+        if lines is None:
+            return None
+        return ''.join(line + '\n' for line in lines)
+
+    def position(self, kind, name):
+        return self.positions.get((kind, name), 'unknown')
+
+
+class ConflictChecker:
+    """Compares mirror files with config sections and assembled hashes."""
+
+    def __init__(self, root, config, agents_dir, shared_tools):
+        self.root = Path(root)
+        self.config = config
+        self.agents_dir = Path(agents_dir)
+        self.shared_tools = shared_tools
+
+    def agent_config(self, agent_name):
+        return (self.config.get('agents') or {}).get(agent_name) or {}
+
+    def recorded_hashes(self, agent_name):
+        """Component hashes from the agent's last assembly ({} if none)."""
+        manifest = self.agents_dir / agent_name / 'assembled' / assemble_prompts.HASH_MANIFEST
+        try:
+            return json.loads(manifest.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def component_file(self, entry, upper):
+        """Snippet path for component or component:variant."""
+        component, _, variant = entry.partition(':')
+        snippet = f"{upper}.{variant}.snippet.md" if variant else f"{upper}.snippet.md"
+        return self.root / 'components' / component / 'prompts' / snippet
+
+    def check_file(self, agent_name, prompt_name, mirror, sections, recorded, values):
+        """Conflicts in one mirror file: (new bot, new components, edited)."""
+        upper = prompt_name.upper()
+        config_bot = {s[4:] for s in sections if s.startswith('bot:')}
+        config_all = {s[4:] if s.startswith('bot:') else s for s in sections}
+
+        new_bot = [name for name in mirror.names(BOT_NAME_PATTERN) if name not in config_bot]
+        new_components = [name for name in mirror.names(COMPONENT_NAME_PATTERN) if name not in config_all]
+
+        # Edits are only checked for the agent that uses components
+        edited = []
+        if agent_name == 'bruba-main':
+            for entry in sections:
+                if entry.startswith('bot:') or entry in NON_COMPONENT_ENTRIES:
+                    continue
+                component_file = self.component_file(entry, upper)
+                if not component_file.is_file():
+                    continue
+                mirror_content = mirror.content('COMPONENT', entry)
+                if mirror_content is None:
+                    continue
+
+                expected = recorded.get(entry)
+                if expected is None:
+                    text = component_file.read_text(encoding='utf-8')
+                    expected = assemble_prompts.section_hash(assemble_prompts.substitute(text, values))
+                if assemble_prompts.section_hash(mirror_content) != expected:
+                    edited.append(entry)
+
+        return new_bot, new_components, edited
+
+    def check_agent(self, agent_name, report=True):
+        """Check every prompt file for an agent; returns the conflict count."""
+        agent = self.agent_config(agent_name)
+        if not agent.get('workspace'):
+            return 0
+
+        recorded = self.recorded_hashes(agent_name)
+        values = assemble_prompts.agent_variables(self.config, agent_name, self.shared_tools)
+        total = 0
+
+        for prompt_name in assemble_prompts.PROMPT_FILES:
+            upper = prompt_name.upper()
+            mirror_file = self.agents_dir / agent_name / 'mirror' / 'prompts' / f"{upper}.md"
+            if not mirror_file.is_file():
+                continue
+
+            sections = [str(s) for s in agent.get(f"{prompt_name}_sections") or []]
+            if not sections:
+                continue
+
+            mirror = MirrorFile(mirror_file.read_text(encoding='utf-8'))
+            new_bot, new_components, edited = self.check_file(
+                agent_name, prompt_name, mirror, sections, recorded.get(f"{upper}.md", {}), values)
+
+            count = len(new_bot) + len(new_components) + len(edited)
+            if count and report:
+                self.report(agent_name, prompt_name, mirror, count, new_bot, new_components, edited)
+            total += count
+
+        return total
+
+    def report(self, agent_name, prompt_name, mirror, count, new_bot, new_components, edited):
+        upper = prompt_name.upper()
+        print(f"=== {agent_name}: {upper}.md: {count} conflicts ===")
+        print("")
+
+        if new_bot:
+            print("NEW BOT SECTIONS:")
+            for section in new_bot:
+                print("")
+                print(f"  Section: {section}")
+                print(f"  Position: after '{mirror.position('BOT-MANAGED', section)}'")
+                print("  Preview:")
+                content = mirror.content('BOT-MANAGED', section)
+                if content is not None:
+                    preview = content.rstrip('\n').split('\n')
+                    for line in preview[:5]:
+                        print(f"    {line}")
+                    if len(preview) > 5:
+                        print(f"    ... ({len(preview) - 5} more lines)")
+                print("")
+                print(f"  To keep: Add 'bot:{section}' to {prompt_name}_sections in config.yaml")
+                print("  To discard: Section will be removed on next push")
+            print("")
+
+        if new_components:
+            print("NEW COMPONENT SECTIONS:")
+            for section in new_components:
+                print("")
+                print(f"  Component: {section}")
+                print(f"  Position: after '{mirror.position('COMPONENT', section)}'")
+                print("")
+                print(f"  To keep as component: Create components/{section}/prompts/{upper}.snippet.md")
+                print(f"                        Add '{section}' to {prompt_name}_sections in config.yaml")
+                print(f"  To keep as bot-managed: Add 'bot:{section}' to {prompt_name}_sections")
+                print("  To discard: Section will be removed on next push")
+            print("")
+
+        if edited:
+            print("EDITED COMPONENTS:")
+            for component in edited:
+                print("")
+                print(f"  Component: {component}")
+                print(f"  Source: components/{component}/prompts/{upper}.snippet.md")
+                print("")
+                print("  Options:")
+                print("    1. Keep bot's version: copy changes to source component")
+                print("    2. Discard bot's changes: next push will overwrite")
+                print("    3. Convert to bot-managed: rename to BOT-MANAGED section")
+                print("")
+                print(f"  Run: ./tools/detect-conflicts.sh --agent={agent_name} --diff {component} {prompt_name}")
+            print("")
+
+    def run(self, agent_names):
+        """Full report for the agents; returns the exit code."""
+        print("Checking for conflicts...")
+        print("")
+
+        total = sum(self.check_agent(agent_name) for agent_name in agent_names)
+
+        if total == 0:
+            print("No conflicts detected")
+            return 0
+
+        print("")
+        print(f"Total conflicts: {total}")
+        print("")
+        print("Run with --show-section NAME [FILE] to see full content")
+        print("Run with --diff NAME [FILE] to compare component to mirror")
+        print("Use --agent=NAME to filter by agent")
+        print("")
+        print("REMEMBER: Always ask user before accepting or discarding bot changes.")
+        return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Detect conflicts between mirror and config/components")
+    parser.add_argument("config", help="Path to config.yaml (its directory is the repo root)")
+    parser.add_argument("--agents-dir", help="Per-agent directory root (default: <root>/agents)")
+    parser.add_argument("--shared-tools", default="", help="Value for ${SHARED_TOOLS}")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    check_parser = sub.add_parser("check", help="Report conflicts")
+    check_parser.add_argument("agents", nargs="*", help="Agent names (default: all in config)")
+    check_parser.add_argument("--blocked", action="store_true",
+                              help="Only print names of agents with conflicts (assembly pre-check)")
+
+    show_parser = sub.add_parser("show", help="Print one section from a mirror file")
+    show_parser.add_argument("agent", help="Agent name")
+    show_parser.add_argument("file", help="Prompt file (agents, tools, heartbeat, ...)")
+    show_parser.add_argument("kind", choices=["BOT-MANAGED", "COMPONENT", "SECTION"], help="Marker kind")
+    show_parser.add_argument("name", help="Section name")
+
+    args = parser.parse_args()
+
+    try:
+        config = assemble_prompts.load_yaml(args.config)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    root = Path(args.config).resolve().parent
+    checker = ConflictChecker(root, config, args.agents_dir or root / 'agents', args.shared_tools)
+
+    if args.command == "show":
+        mirror_file = checker.agents_dir / args.agent / 'mirror' / 'prompts' / f"{args.file.upper()}.md"
+        content = None
+        if mirror_file.is_file():
+            content = MirrorFile(mirror_file.read_text(encoding='utf-8')).content(args.kind, args.name)
+        if content is None:
+            sys.exit(1)
+        sys.stdout.write(content)
+        return
+
+    agent_names = args.agents or list((config.get('agents') or {}).keys())
+    if args.blocked:
+        blocked = [name for name in agent_names if checker.check_agent(name, report=False)]
+        for name in blocked:
+            print(name)
+        sys.exit(1 if blocked else 0)
+
+    sys.exit(checker.run(agent_names))
+
+
+if __name__ == '__main__':
+    main()
@@ -17,6 +17,12 @@ Examples:
 Options:
     --corrections    Apply transcription corrections from components/distill/config/corrections.yaml
     --corrections-file <path>  Use custom corrections file
+    --no-index       Don't use or write the <file>.idx line index
+
+--extract and --search use a line-offset index kept next to the session
+(session.jsonl.idx). It is built once with mmap and extended when the
+session grows, so --extract reads only the requested lines and --search
+scans the raw bytes, decoding only lines that contain the term.
 
 Output format:
     ## Session: <id>
@@ -30,48 +36,54 @@ Output format:
 """
 
 import sys
-import json
 import re
 import os
+import mmap
+import bisect
+import struct
+import hashlib
+from array import array
 from datetime import datetime
 from pathlib import Path
 
+# Share the corrections engine with the distill pipeline
+REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+sys.path.insert(0, str(REPO_ROOT))
 
-def load_corrections(corrections_file=None):
-    """Load transcription corrections from YAML file."""
-    if corrections_file is None:
-        # Default location: components/distill/config/corrections.yaml relative to repo root
-        script_dir = Path(__file__).parent
-        repo_root = script_dir.parent.parent
-        corrections_file = repo_root / "components" / "distill" / "config" / "corrections.yaml"
-    else:
-        corrections_file = Path(corrections_file)
+from components.distill.lib.corrections import load_correction_engine
+from components.distill.lib.clawdbot_parser import loads_json, peek_line_type
+
+# Entry types never shown or searched; their lines are skipped undecoded
+SKIPPED_TYPES = ('session', 'custom')
+
+# Line index: header (magic, indexed size, sha256 of the first bytes), then
+# one native uint64 start offset per line. A machine-local cache.
+INDEX_MAGIC = b'JLIDX001'
+INDEX_HEADER = struct.Struct('<8sQ32s')
+INDEX_HEAD_BYTES = 4096
+
+# --search reads the mapped session in line-aligned chunks of about this size
+SEARCH_CHUNK_BYTES = 8 * 1024 * 1024
 
-    if not corrections_file.exists():
-        return {}
+# Characters JSON encoders may escape; terms containing them can't be
+# found in the raw bytes, so they fall back to decoding every line
+JSON_ESCAPED_CHARS = set('"\\/<>&\'')
 
-    corrections = {}
+# The only non-ASCII characters whose lower() contains an ASCII letter
+# (Kelvin sign, dotted capital I), raw UTF-8 or \u-escaped
+FOLDED_ASCII = {
+    'k': [b'\xe2\x84\xaa', b'\\u212a'],
+    'i': [b'\xc4\xb0', b'\\u0130'],
+}
+
+
+def load_corrections(corrections_file=None):
+    """Load transcription corrections (compiled, cached by file hash)."""
     try:
-        # Simple YAML parsing without external dependency
-        with open(corrections_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith('#'):
-                    continue
-                # Parse key: value pairs
-                if ':' in line:
-                    # Handle quoted values
-                    match = re.match(r'^"?([^"]+)"?\s*:\s*"?([^"]*)"?$', line)
-                    if match:
-                        wrong, correct = match.groups()
-                        # Skip if value is explicitly empty (removal entries)
-                        corrections[wrong.strip()] = correct.strip()
+        return load_correction_engine(corrections_file)
     except Exception as e:
         print(f"Warning: Could not load corrections file: {e}", file=sys.stderr)
-        return {}
-
-    return corrections
+        return None
 
 
 def apply_corrections(text, corrections):
@@ -79,28 +91,7 @@ def apply_corrections(text, corrections):
     if not corrections or not text:
         return text
 
-    result = text
-
-    # Apply simple replacements (case-insensitive)
-    for wrong, correct in corrections.items():
-        if not wrong:
-            continue
-        # Create case-insensitive pattern
-        pattern = re.compile(re.escape(wrong), re.IGNORECASE)
-
-        def replace_match(m):
-            # If correct is empty, remove the match
-            if not correct:
-                return ''
-            # Try to preserve case of first character
-            matched = m.group(0)
-            if matched[0].isupper() and correct[0].islower():
-                return correct[0].upper() + correct[1:]
-            elif matched[0].islower() and correct[0].isupper():
-                return correct[0].lower() + correct[1:]
-            return correct
-
-        result = pattern.sub(replace_match, result)
+    result, _ = corrections.apply(text)
 
     # Clean up whisper artifacts
     result = clean_whisper_artifacts(result)
@@ -216,27 +207,161 @@ def should_skip_entry(entry):
     return False
 
 
-def parse_jsonl(filepath):
-    """Parse JSONL file and yield (line_num, entry) tuples."""
+def decode_entry(line):
+    """Decode one JSONL line, or None if it is blank, invalid or skipped."""
+    if peek_line_type(line) in SKIPPED_TYPES:
+        return None
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        return loads_json(line)
+    except ValueError:
+        return None
+
+
+def index_path(filepath):
+    """Return the line index file for a session."""
+    return Path(str(filepath) + '.idx')
+
+
+def _head_digest(mm, size):
+    return hashlib.sha256(mm[:min(size, INDEX_HEAD_BYTES)]).digest()
+
+
+def _load_index_file(path, mm, size):
+    """Return (offsets, indexed_size) from an index file, or None if unusable."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    if len(data) < INDEX_HEADER.size:
+        return None
+
+    magic, indexed_size, digest = INDEX_HEADER.unpack_from(data)
+    body = data[INDEX_HEADER.size:]
+    if magic != INDEX_MAGIC or indexed_size > size or len(body) % 8:
+        return None
+    # Sessions only grow; a different start means a different file
+    if digest != _head_digest(mm, indexed_size):
+        return None
+
+    offsets = array('Q')
+    offsets.frombytes(body)
+    return offsets, indexed_size
+
+
+def _save_index_file(path, offsets, mm, size):
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, size, _head_digest(mm, size)))
+            f.write(offsets.tobytes())
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Read-only location: the index is just rebuilt next time
+
+
+def _scan_line_starts(mm, offsets, start, size):
+    """Append the start offset of each line beginning at or after start."""
+    pos = start
+    find = mm.find
+    while pos < size:
+        offsets.append(pos)
+        newline = find(b'\n', pos)
+        if newline < 0:
+            break
+        pos = newline + 1
+
+
+def load_line_index(filepath, mm, size, use_index_file=True):
+    """
+    Return line start offsets for a mapped session (offsets[n - 1] is line n).
+
+    The index file is reused while the session only grows: new lines are
+    scanned from where the last run stopped and the file is updated.
+    """
+    path = index_path(filepath)
+    loaded = _load_index_file(path, mm, size) if use_index_file else None
+
+    if loaded is None:
+        offsets, indexed_size = array('Q'), 0
+        _scan_line_starts(mm, offsets, 0, size)
+    else:
+        offsets, indexed_size = loaded
+        if indexed_size == size:
+            return offsets
+        start = indexed_size
+        if offsets and mm[indexed_size - 1:indexed_size] != b'\n':
+            # The last indexed line was still being written: skip past it
+            newline = mm.find(b'\n', indexed_size)
+            start = newline + 1 if newline >= 0 else size
+        _scan_line_starts(mm, offsets, start, size)
+
+    if use_index_file:
+        _save_index_file(path, offsets, mm, size)
+    return offsets
+
+
+class MappedSession:
+    """A session file mapped read-only, with its line index."""
+
+    def __init__(self, filepath, use_index_file=True):
+        self._file = open(filepath, 'rb')
+        self.size = os.fstat(self._file.fileno()).st_size
+        # mmap can't map an empty file
+        self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self.offsets = load_line_index(filepath, self.mm, self.size, use_index_file) if self.size else array('Q')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.size:
+            self.mm.close()
+        self._file.close()
+
+    def line(self, line_num):
+        """Return line line_num (1-based) as text."""
+        start = self.offsets[line_num - 1]
+        end = self.offsets[line_num] if line_num < len(self.offsets) else self.size
+        return self.mm[start:end].decode('utf-8', errors='replace')
+
+    def line_at(self, pos):
+        """Return the 1-based number of the line containing byte pos."""
+        return bisect.bisect_right(self.offsets, pos)
+
+
+def parse_jsonl(filepath, line_range=None, use_index=True):
+    """
+    Parse JSONL file and yield (line_num, entry) tuples.
+
+    With line_range (start, end), only those lines are read, via the line index.
+    """
+    if line_range and use_index:
+        with MappedSession(filepath) as session:
+            first = max(line_range[0], 1)
+            last = min(line_range[1], len(session.offsets))
+            for i in range(first, last + 1):
+                entry = decode_entry(session.line(i))
+                if entry is not None:
+                    yield (i, entry)
+        return
+
     with open(filepath, 'r') as f:
         for i, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entry = json.loads(line)
+            entry = decode_entry(line)
+            if entry is not None:
                 yield (i, entry)
-            except json.JSONDecodeError:
-                continue
 
 
-def to_markdown(filepath, line_range=None, corrections=None):
+def to_markdown(filepath, line_range=None, corrections=None, use_index=True):
     """Convert JSONL session to markdown format."""
     output = []
     session_id = None
     start_time = None
 
-    for line_num, entry in parse_jsonl(filepath):
+    for line_num, entry in parse_jsonl(filepath, line_range, use_index):
         # Apply line range filter if specified
         if line_range:
             start, end = line_range
@@ -295,13 +420,77 @@ def to_markdown(filepath, line_range=None, corrections=None):
     return '\n'.join(header_lines + output)
 
 
-def search_jsonl(filepath, term):
+def raw_searchable(term):
+    """
+    Whether term can be found by scanning raw session bytes.
+
+    False for terms that JSON encoding may change (non-ASCII or escaped
+    characters); those are searched by decoding every line.
+    """
+    lowered = term.lower()
+    return bool(lowered) and lowered.isascii() and not any(
+        ch in JSON_ESCAPED_CHARS or ord(ch) < 0x20 for ch in lowered
+    )
+
+
+def _matches_term(entry, lowered_term):
+    return lowered_term in extract_message_text(entry).lower()
+
+
+def _candidate_lines(session, term):
+    """
+    Return the sorted numbers of lines that may contain term, ignoring case.
+
+    Works through line-aligned chunks: each is lowercased and searched for
+    term with bytes.find. Lines holding a FOLDED_ASCII sequence for one of
+    term's letters are candidates too, since they can lowercase to term.
+    """
+    needles = [term.lower().encode('ascii')]
+    for ch in set(term.lower()):
+        needles.extend(FOLDED_ASCII.get(ch, ()))
+
+    offsets = session.offsets
+    line_count = len(offsets)
+    candidates = set()
+    first_line = 1
+
+    while first_line <= line_count:
+        chunk_start = offsets[first_line - 1]
+        end_line = bisect.bisect_right(offsets, chunk_start + SEARCH_CHUNK_BYTES, lo=first_line)
+        chunk_end = offsets[end_line] if end_line < line_count else session.size
+        lowered = session.mm[chunk_start:chunk_end].lower()
+
+        for needle in needles:
+            pos = lowered.find(needle)
+            while pos >= 0:
+                line_num = session.line_at(chunk_start + pos)
+                candidates.add(line_num)
+                # Continue from the next line
+                next_start = offsets[line_num] if line_num < line_count else session.size
+                pos = lowered.find(needle, next_start - chunk_start)
+
+        first_line = end_line + 1
+
+    return sorted(candidates)
+
+
+def search_jsonl(filepath, term, use_index=True):
     """Search JSONL for lines containing term, return line numbers."""
+    lowered = term.lower()
+
+    if not (use_index and raw_searchable(term)):
+        return [
+            line_num for line_num, entry in parse_jsonl(filepath)
+            if _matches_term(entry, lowered)
+        ]
+
+    # Find candidate lines in the raw bytes; decode only those
     matches = []
-    for line_num, entry in parse_jsonl(filepath):
-        text = extract_message_text(entry)
-        if term.lower() in text.lower():
-            matches.append(line_num)
+    with MappedSession(filepath) as session:
+        for line_num in _candidate_lines(session, term):
+            entry = decode_entry(session.line(line_num))
+            if entry is not None and _matches_term(entry, lowered):
+                matches.append(line_num)
     return matches
 
 
@@ -313,6 +502,7 @@ def main():
     filepath = sys.argv[1]
     corrections = None
     corrections_file = None
+    use_index = '--no-index' not in sys.argv[2:]
 
     # Parse arguments
     i = 2
@@ -335,13 +525,13 @@ def main():
             except (ValueError, IndexError):
                 print("Error: Range must be in format START-END (e.g., 150-160)", file=sys.stderr)
                 sys.exit(1)
-            print(to_markdown(filepath, line_range, corrections))
+            print(to_markdown(filepath, line_range, corrections, use_index))
             return
             i += 2
 
         elif arg == '--search' and i + 1 < len(sys.argv):
             term = sys.argv[i + 1]
-            matches = search_jsonl(filepath, term)
+            matches = search_jsonl(filepath, term, use_index)
             if matches:
                 print(f"Found {len(matches)} matches:")
                 for m in matches:
@@ -7,6 +7,12 @@ Usage:
     parse-yaml.py <file> --json          # Output as JSON
     parse-yaml.py <file> --frontmatter   # Extract YAML frontmatter from markdown
     parse-yaml.py <file> --to-json <key> # Output key as JSON with camelCase keys
+    parse-yaml.py <file> --batch NAME=<key> NAME=json:<key> ...
+                                         # Many keys at once, as shell assignments
+
+The parsed file is snapshotted as JSON in .cache/ next to it, keyed on a
+hash of its content, so repeat lookups skip the YAML parse (and the
+PyYAML import). Set PARSE_YAML_CACHE=0 to bypass the snapshot.
 
 Examples:
     parse-yaml.py config.yaml ssh.host
@@ -14,18 +20,23 @@ Examples:
     parse-yaml.py config.yaml agents.bruba-main.tools_allow
     parse-yaml.py document.md --frontmatter
     parse-yaml.py config.yaml --to-json openclaw.compaction
+    eval "$(parse-yaml.py config.yaml --batch MODEL=agents.bruba-main.model HB=json:agents.bruba-main.heartbeat)"
 """
 
 import sys
 import json
+import os
 import re
+import shlex
+import hashlib
+import importlib.util
+from pathlib import Path
+
+# Use PyYAML for proper nested structure support (imported only when parsing)
+HAS_PYYAML = importlib.util.find_spec('yaml') is not None
 
-# Try to use PyYAML for proper nested structure support
-try:
-    import yaml
-    HAS_PYYAML = True
-except ImportError:
-    HAS_PYYAML = False
+# Bump when the snapshot layout or parsing changes
+SNAPSHOT_VERSION = 1
 
 
 def parse_yaml(content):
@@ -34,6 +45,7 @@ def parse_yaml(content):
     falls back to simple parser for basic configs.
     """
     if HAS_PYYAML:
+        import yaml
         return yaml.safe_load(content) or {}
     else:
         # Fallback to simple parser (limited - doesn't handle deep nesting)
@@ -136,6 +148,55 @@ def parse_yaml_simple(content):
     return result
 
 
+def snapshot_path(filepath, content):
+    """Snapshot file for this content: .cache/<stem>.<hash>.json beside the file."""
+    parser = 'pyyaml' if HAS_PYYAML else 'simple'
+    key = f"{SNAPSHOT_VERSION}:{parser}\0{content}".encode('utf-8', 'surrogatepass')
+    digest = hashlib.sha256(key).hexdigest()[:16]
+    path = Path(filepath).resolve()
+    return path.parent / '.cache' / f"{path.stem}.{digest}.json"
+
+
+def write_snapshot(snapshot, data):
+    """Save parsed data if JSON holds it exactly; drop older snapshots of the file."""
+    try:
+        text = json.dumps(data)
+        if json.loads(text) != data:
+            return  # e.g. non-string keys: the snapshot would read back differently
+    except (TypeError, ValueError):
+        return  # e.g. dates: not JSON
+
+    stem = snapshot.name[:-len('.json')].rsplit('.', 1)[0]
+    own = re.compile(re.escape(stem) + r'\.[0-9a-f]{16}\.json$')
+    try:
+        snapshot.parent.mkdir(exist_ok=True)
+        tmp = snapshot.with_name(f".{snapshot.name}.{os.getpid()}.tmp")
+        tmp.write_text(text)
+        os.replace(tmp, snapshot)
+        for old in snapshot.parent.glob(f"{stem}.*.json"):
+            if old != snapshot and own.match(old.name):
+                old.unlink()
+    except OSError:
+        pass  # Read-only location: just parse every time
+
+
+def load_data(filepath, content):
+    """Parse a YAML file, served from its JSON snapshot when the content is unchanged."""
+    if os.environ.get('PARSE_YAML_CACHE', '1') == '0':
+        return parse_yaml(content)
+
+    snapshot = snapshot_path(filepath, content)
+    try:
+        with open(snapshot) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    data = parse_yaml(content)
+    write_snapshot(snapshot, data)
+    return data
+
+
 def extract_frontmatter(content):
     """Extract YAML frontmatter from markdown file."""
     match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
@@ -204,6 +265,41 @@ def transform_keys_to_camel(obj):
         return obj
 
 
+def format_value(value):
+    """Format a looked-up value the way a single key lookup prints it."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+
+def batch_assignments(data, specs):
+    """
+    Resolve NAME=key.path specs into shell assignments.
+
+    NAME=json:key.path gives the --to-json form. Missing keys become empty.
+    """
+    lines = []
+    for spec in specs:
+        name, sep, key_path = spec.partition('=')
+        if not sep or not re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', name):
+            raise ValueError(f"Invalid batch spec (expected NAME=key.path): {spec}")
+
+        to_json = key_path.startswith('json:')
+        if to_json:
+            key_path = key_path[len('json:'):]
+
+        value = get_nested_value(data, key_path)
+        if value is None:
+            text = ''
+        elif to_json:
+            text = json.dumps(transform_keys_to_camel(value), indent=2)
+        else:
+            # Command substitution would drop trailing newlines, so do the same
+            text = format_value(value).rstrip('\n')
+        lines.append(f"{name}={shlex.quote(text)}")
+    return lines
+
+
 def main():
     if len(sys.argv) < 3:
         print(__doc__, file=sys.stderr)
@@ -220,7 +316,7 @@ def main():
         sys.exit(1)
 
     if operation == '--json':
-        data = parse_yaml(content)
+        data = load_data(filepath, content)
         print(json.dumps(data, indent=2))
     elif operation == '--frontmatter':
         data = extract_frontmatter(content)
@@ -231,23 +327,28 @@ def main():
             print("Error: --to-json requires a key path", file=sys.stderr)
             sys.exit(1)
         key_path = sys.argv[3]
-        data = parse_yaml(content)
+        data = load_data(filepath, content)
         value = get_nested_value(data, key_path)
         if value is None:
             sys.exit(1)
         # Transform keys to camelCase
         transformed = transform_keys_to_camel(value)
         print(json.dumps(transformed, indent=2))
+    elif operation == '--batch':
+        # Resolve many keys from one parse
+        try:
+            lines = batch_assignments(load_data(filepath, content), sys.argv[3:])
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print('\n'.join(lines))
     else:
         # Get specific key
-        data = parse_yaml(content)
+        data = load_data(filepath, content)
         value = get_nested_value(data, operation)
         if value is None:
             sys.exit(1)
-        elif isinstance(value, (dict, list)):
-            print(json.dumps(value))
-        else:
-            print(value)
+        print(format_value(value))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Plan a content push: work out which exported files changed since they were
+last delivered, and stage them for one transfer per host.
+
+push.sh describes what goes where as mapping lines on stdin. Each agent
+keeps a push manifest (agents/<name>/.push-manifest) of what was last
+delivered to its workspace: one "<hash> <remote path>" line per file.
+
+File hashes come from the export manifest where it covers a file (the
+export's source hash under its version and profile rules decides the
+output exactly), so export outputs are not read. Everything else
+(core-prompts, inventories) is hashed by content.
+
+Changed files are symlinked into a staging tree laid out by absolute
+remote path, and listed in <staging>.files, so a single
+`rsync --copy-links --files-from` to host:/ delivers every agent's
+changes. New manifests are written next to the old ones as .new; push.sh
+moves them into place once the transfer succeeds.
+
+Memory content changes are written per agent as "A <path>" (added) and
+"M <path>" (changed) lines for the reindex step. Push never deletes on the
+bot, so it produces no "D" lines.
+
+Mapping lines (tab-separated):
+    AGENT  LABEL  SOURCE  DEST  MODE
+
+    MODE is "tree" (every file under SOURCE, kept relative to DEST) or
+    "top" (*.md directly in SOURCE). LABEL "core-prompts" is workspace
+    config; every other label is memory content.
+
+Usage:
+    push-plan.py --staging DIR [--agents-dir DIR] [--changes-dir DIR] [--full] [--dry-run] [--verbose] < mappings
+
+Outputs:
+    stdout           Per-agent summary lines for push.sh to print
+    <staging>.files  Staged paths (relative to the staging dir), one per line
+    <staging>.manifests  Push manifests with a .new version to move into place
+    --changes-dir    One file per agent whose memory content changed,
+                     listing its added/changed paths
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+PUSH_MANIFEST = '.push-manifest'
+EXPORT_MANIFEST = '.distill-manifest.json'
+
+# Labels that are not memory content (changes don't need a reindex)
+CONFIG_LABELS = ('core-prompts',)
+
+
+def file_hash(path):
+    """sha256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(path):
+    """Push manifest as {remote path: hash} ({} if missing)."""
+    entries = {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                digest, _, remote = line.rstrip('\n').partition(' ')
+                if remote:
+                    entries[remote] = digest
+    except OSError:
+        pass
+    return entries
+
+
+def export_hashes(export_dir):
+    """
+    Output hashes derived from the export manifest.
+
+    Returns ({path relative to export_dir: hash}, manifest mtime). Hashes
+    are only trusted for files not modified since the manifest was
+    written; see ExportIndex.lookup.
+    """
+    manifest_path = Path(export_dir) / EXPORT_MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+        sources = manifest.get('sources', {})
+    except (OSError, ValueError, AttributeError):
+        return {}, 0
+
+    prefix = f"{manifest.get('version')}:{manifest.get('rules_hash')}:"
+    hashes = {}
+    for entry in sources.values():
+        if not entry.get('outputs'):
+            continue
+        token = hashlib.sha256((prefix + entry.get('hash', '')).encode('utf-8')).hexdigest()
+        for rel in entry['outputs']:
+            hashes[rel] = f"x{token}"
+    return hashes, manifest_path.stat().st_mtime
+
+
+class ExportIndex:
+    """Per-agent export manifest lookups, loaded on first use."""
+
+    def __init__(self):
+        self._loaded = {}
+
+    def lookup(self, export_dir, path, mtime):
+        """Hash for path from the export manifest, or None if not covered."""
+        if export_dir not in self._loaded:
+            self._loaded[export_dir] = export_hashes(export_dir)
+        hashes, manifest_mtime = self._loaded[export_dir]
+        if not hashes or mtime > manifest_mtime:
+            return None
+        try:
+            rel = path.relative_to(export_dir).as_posix()
+        except ValueError:
+            return None
+        return hashes.get(rel)
+
+
+def mapping_files(source, mode):
+    """Local files a mapping delivers, with paths relative to SOURCE."""
+    if not source.is_dir():
+        return []
+    if mode == 'top':
+        return sorted(
+            (p, p.name) for p in source.iterdir()
+            if p.is_file() and p.suffix == '.md'
+        )
+    found = []
+    for dirpath, dirnames, filenames in os.walk(source):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            found.append((path, path.relative_to(source).as_posix()))
+    return found
+
+
+class PushPlan:
+    """Compares local exports against each agent's push manifest."""
+
+    def __init__(self, staging, agents_dir, full=False, dry_run=False, verbose=False):
+        self.staging = Path(staging)
+        self.agents_dir = Path(agents_dir)
+        self.full = full
+        self.dry_run = dry_run
+        self.verbose = verbose
+        self.exports = ExportIndex()
+        self.staged = []
+        self.manifests = []
+        self.changes = {}
+
+    def plan_agent(self, agent, mappings):
+        """Stage one agent's changed files and write its new manifest."""
+        manifest_path = self.agents_dir / agent / PUSH_MANIFEST
+        delivered = {} if self.full else load_manifest(manifest_path)
+        export_dir = self.agents_dir / agent / 'exports'
+        current = {}
+        changes = []
+
+        print(f"Agent: {agent}")
+        total_changed = 0
+        for label, source, dest, mode in mappings:
+            changed = unchanged = 0
+            for path, rel in mapping_files(Path(source), mode):
+                remote = f"{dest.rstrip('/')}/{rel}"
+                digest = self.exports.lookup(export_dir, path, path.stat().st_mtime) or file_hash(path)
+                current[remote] = digest
+                if delivered.get(remote) == digest:
+                    unchanged += 1
+                    continue
+                changed += 1
+                self.stage(path, remote)
+                if label not in CONFIG_LABELS:
+                    changes.append(f"{'M' if remote in delivered else 'A'} {remote}")
+                if self.verbose:
+                    print(f"    + {remote}")
+            if changed:
+                print(f"  {label}: {changed} files ({unchanged} unchanged)")
+            total_changed += changed
+
+        if not total_changed:
+            print(f"  (no changes, {len(current)} files up to date)")
+        if changes:
+            self.changes[agent] = changes
+
+        if not self.dry_run:
+            new_path = manifest_path.with_name(PUSH_MANIFEST + '.new')
+            new_path.parent.mkdir(parents=True, exist_ok=True)
+            new_path.write_text(
+                ''.join(f"{digest} {remote}\n" for remote, digest in sorted(current.items())),
+                encoding='utf-8'
+            )
+            self.manifests.append(manifest_path)
+
+    def stage(self, path, remote):
+        """Symlink a local file into the staging tree at its remote path."""
+        rel = remote.lstrip('/')
+        link = self.staging / rel
+        link.parent.mkdir(parents=True, exist_ok=True)
+        if link.is_symlink() or link.exists():
+            link.unlink()
+        link.symlink_to(path.resolve())
+        self.staged.append(rel)
+
+    def run(self, lines):
+        agents = {}
+        for line in lines:
+            line = line.rstrip('\n')
+            if not line:
+                continue
+            agent, label, source, dest, mode = line.split('\t')
+            agents.setdefault(agent, []).append((label, source, dest, mode))
+
+        self.staging.mkdir(parents=True, exist_ok=True)
+        for agent, mappings in agents.items():
+            self.plan_agent(agent, mappings)
+
+        files_path = self.staging.with_name(self.staging.name + '.files')
+        files_path.write_text(''.join(f"{rel}\n" for rel in self.staged), encoding='utf-8')
+        manifests_path = self.staging.with_name(self.staging.name + '.manifests')
+        manifests_path.write_text(''.join(f"{p}\n" for p in self.manifests), encoding='utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Plan a push from export and push manifests")
+    parser.add_argument("--staging", required=True, help="Staging dir to build (laid out by remote path)")
+    parser.add_argument("--agents-dir", default="agents", help="Per-agent directory root (default: agents)")
+    parser.add_argument("--changes-dir", help="Write each agent's memory content changes here")
+    parser.add_argument("--full", action="store_true", help="Ignore push manifests and send everything")
+    parser.add_argument("--dry-run", "-n", action="store_true", help="Don't write new manifests")
+    parser.add_argument("--verbose", "-v", action="store_true", help="List every staged file")
+    args = parser.parse_args()
+
+    plan = PushPlan(args.staging, args.agents_dir, args.full, args.dry_run, args.verbose)
+    try:
+        plan.run(sys.stdin)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.changes_dir:
+        changes_dir = Path(args.changes_dir)
+        changes_dir.mkdir(parents=True, exist_ok=True)
+        for agent, changes in plan.changes.items():
+            (changes_dir / agent).write_text(''.join(f"{line}\n" for line in changes), encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,9 @@ Noise patterns:
 - Heartbeat sequences (exec denial + HEARTBEAT_OK response pairs)
 - System errors (gateway timeouts, connection errors)
 - Empty ping/pong exchanges ("test", "you up", etc.)
+
+Each message is classified once against all patterns folded into one
+regex, and the kept spans are joined and cleaned up in a single pass.
 """
 
 import re
@@ -74,32 +77,83 @@ def parse_messages(content: str) -> list[dict]:
     return messages
 
 
-def is_noise(msg: dict, extra_patterns: list[tuple] = None, skip_builtin: bool = False) -> tuple[bool, str]:
-    """Check if a message is noise. Returns (is_noise, noise_type)."""
-    content = msg['content']
+# Inline flag letters for scoping each pattern's flags inside the combined regex
+SCOPED_FLAGS = [(re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's')]
+
+# Backreferences only work in a pattern compiled on its own
+BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
 
-    # Check keep patterns first
-    for pattern in KEEP_PATTERNS:
-        if pattern.search(content):
-            return False, ''
+# Blank-line runs collapsed after removal, and headers renumbered in the same scan
+CLEANUP_PATTERN = re.compile(r'(\n{3,})|=== MESSAGE \d+ \| (USER|ASSISTANT) ===')
 
-    # Check built-in noise patterns
-    if not skip_builtin:
-        for pattern, noise_type in NOISE_PATTERNS:
+
+def combine_patterns(patterns: list[tuple]):
+    """Fold (regex, type) pairs into one regex with a named group per pattern.
+
+    Each pattern keeps its own IGNORECASE/MULTILINE/DOTALL flags. Returns
+    None if the patterns can't be combined (backreferences, clashing group
+    names, global inline flags); callers then try them one at a time.
+    """
+    if not patterns:
+        return None
+    parts = []
+    for i, (pattern, _) in enumerate(patterns):
+        if BACKREFERENCE.search(pattern.pattern) or not isinstance(pattern.pattern, str):
+            return None
+        on = ''.join(letter for flag, letter in SCOPED_FLAGS if pattern.flags & flag)
+        off = ''.join(letter for flag, letter in SCOPED_FLAGS if not pattern.flags & flag)
+        parts.append(f"(?P<n{i}>(?{on}-{off}:{pattern.pattern}))" if off else
+                     f"(?P<n{i}>(?{on}:{pattern.pattern}))")
+    try:
+        return re.compile('|'.join(parts))
+    except re.error:
+        return None
+
+
+class NoiseMatcher:
+    """Built-in and custom noise patterns, tried as one combined regex."""
+
+    def __init__(self, extra_patterns: list[tuple] = None, skip_builtin: bool = False):
+        self.patterns = ([] if skip_builtin else list(NOISE_PATTERNS)) + list(extra_patterns or [])
+        self.combined = combine_patterns(self.patterns)
+
+    def classify(self, content: str) -> str:
+        """Return the noise type of a message's content, or '' if it isn't noise."""
+        # Check keep patterns first
+        for pattern in KEEP_PATTERNS:
             if pattern.search(content):
-                return True, noise_type
+                return ''
 
-    # Check custom patterns
-    if extra_patterns:
-        for pattern, noise_type in extra_patterns:
+        if self.combined is None:
+            candidates = self.patterns
+        else:
+            match = self.combined.search(content)
+            if match is None:
+                return ''
+            # The leftmost match may come from a later pattern; the first
+            # pattern in list order that matches anywhere decides the type
+            first = int(match.lastgroup[1:])
+            candidates = self.patterns[:first + 1]
+
+        for pattern, noise_type in candidates:
             if pattern.search(content):
-                return True, noise_type
+                return noise_type
+        return ''
+
 
-    return False, ''
+def is_noise(msg: dict, extra_patterns: list[tuple] = None, skip_builtin: bool = False) -> tuple[bool, str]:
+    """Check if a message is noise. Returns (is_noise, noise_type)."""
+    noise_type = NoiseMatcher(extra_patterns, skip_builtin).classify(msg['content'])
+    return bool(noise_type), noise_type
 
 
 def find_noise_sequences(messages: list[dict], extra_patterns: list[tuple] = None, skip_builtin: bool = False) -> list[dict]:
     """Find noise messages and related sequences (e.g., heartbeat pairs)."""
+    matcher = NoiseMatcher(extra_patterns, skip_builtin)
+
+    # Classify every message exactly once
+    types = [matcher.classify(msg['content']) for msg in messages]
+
     noise_msgs = []
     skip_next = False
 
@@ -108,69 +162,64 @@ def find_noise_sequences(messages: list[dict], extra_patterns: list[tuple] = Non
             skip_next = False
             continue
 
-        is_noisy, noise_type = is_noise(msg, extra_patterns, skip_builtin)
+        noise_type = types[i]
+        if not noise_type:
+            continue
+
+        noise_msgs.append({
+            'msg': msg,
+            'type': noise_type,
+        })
 
-        if is_noisy:
+        if msg['role'] != 'USER' or i + 1 >= len(messages):
+            continue
+
+        # A heartbeat trigger is answered by HEARTBEAT_OK, a ping by a ping response
+        expected = {'heartbeat': 'heartbeat', 'ping': 'ping-response'}.get(noise_type)
+        if expected and types[i + 1] == expected:
             noise_msgs.append({
-                'msg': msg,
-                'type': noise_type,
+                'msg': messages[i + 1],
+                'type': expected,
             })
-
-            # If this is a heartbeat trigger, the next message is likely HEARTBEAT_OK
-            if noise_type == 'heartbeat' and msg['role'] == 'USER':
-                if i + 1 < len(messages):
-                    next_msg = messages[i + 1]
-                    next_is_noisy, next_type = is_noise(next_msg, extra_patterns, skip_builtin)
-                    if next_is_noisy and next_type == 'heartbeat':
-                        noise_msgs.append({
-                            'msg': next_msg,
-                            'type': next_type,
-                        })
-                        skip_next = True
-
-            # If this is a ping, check if next is a ping response
-            if noise_type == 'ping' and msg['role'] == 'USER':
-                if i + 1 < len(messages):
-                    next_msg = messages[i + 1]
-                    next_is_noisy, next_type = is_noise(next_msg, extra_patterns, skip_builtin)
-                    if next_is_noisy and next_type == 'ping-response':
-                        noise_msgs.append({
-                            'msg': next_msg,
-                            'type': next_type,
-                        })
-                        skip_next = True
+            skip_next = True
 
     return noise_msgs
 
 
-def remove_noise(content: str, noise_msgs: list[dict]) -> str:
-    """Remove noise messages from content."""
+def remove_noise(content: str, noise_msgs: list[dict], renumber: bool = False) -> str:
+    """Remove noise messages from content.
+
+    Kept spans are joined once; blank-line cleanup (and renumbering, if
+    asked) then happens in a single scan of the result.
+    """
     if not noise_msgs:
         return content
 
-    # Sort by position descending so we can remove from end to start
-    noise_msgs = sorted(noise_msgs, key=lambda x: x['msg']['header_start'], reverse=True)
-
-    result = content
-    for noise in noise_msgs:
-        msg = noise['msg']
-        result = result[:msg['header_start']] + result[msg['end']:]
-
-    # Clean up multiple blank lines
-    result = re.sub(r'\n{3,}', '\n\n', result)
+    removed = sorted((noise['msg']['header_start'], noise['msg']['end']) for noise in noise_msgs)
 
-    return result
+    def kept_spans():
+        pos = 0
+        for start, end in removed:
+            if start > pos:
+                yield content[pos:start]
+            pos = max(pos, end)
+        yield content[pos:]
 
+    result = ''.join(kept_spans())
 
-def renumber_messages(content: str) -> str:
-    """Renumber messages sequentially after removal."""
-    counter = [0]  # Use list to allow modification in nested function
+    counter = 0
 
-    def replace_msg_num(match):
-        counter[0] += 1
-        return f"=== MESSAGE {counter[0]} | {match.group(1)} ==="
+    def cleanup(match):
+        nonlocal counter
+        if match.group(1):
+            # Clean up multiple blank lines
+            return '\n\n'
+        if not renumber:
+            return match.group(0)
+        counter += 1
+        return f"=== MESSAGE {counter} | {match.group(2)} ==="
 
-    return re.sub(r'=== MESSAGE \d+ \| (USER|ASSISTANT) ===', replace_msg_num, content)
+    return CLEANUP_PATTERN.sub(cleanup, result)
 
 
 def load_custom_patterns(pattern_args: list[str], pattern_file: str = None) -> list[tuple]:
@@ -254,12 +303,8 @@ def main():
         print("\n(dry run - no changes made)")
         sys.exit(0)
 
-    # Remove noise
-    result = remove_noise(content, noise_msgs)
-
-    # Renumber unless disabled
-    if not args.no_renumber:
-        result = renumber_messages(result)
+    # Remove noise, renumbering unless disabled
+    result = remove_noise(content, noise_msgs, renumber=not args.no_renumber)
 
     # Write back
     filepath.write_text(result)
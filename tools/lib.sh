@@ -66,147 +66,63 @@ load_config() {
 # Sets: VAULT_ENABLED, VAULT_PATH, VAULT_DIRS[], VAULT_FILES[]
 load_vault_config() {
     local config_file="$ROOT_DIR/config.yaml"
+    local helper="$ROOT_DIR/tools/helpers/config-env.py"
 
-    VAULT_ENABLED=$(python3 -c "
-import yaml
-with open('$config_file') as f:
-    c = yaml.safe_load(f)
-v = c.get('vault', {})
-print('true' if v.get('enabled') else 'false')
-" 2>/dev/null || echo "false")
-
-    if [[ "$VAULT_ENABLED" != "true" ]]; then
-        VAULT_PATH=""
-        VAULT_DIRS=()
-        VAULT_FILES=()
-        return 0
-    fi
-
-    VAULT_PATH=$(python3 -c "
-import yaml, os
-with open('$config_file') as f:
-    c = yaml.safe_load(f)
-print(os.path.expanduser(c['vault']['path']))
-" 2>/dev/null)
-
-    # Arrays for dirs and files
+    # Defaults if config.yaml can't be read
+    VAULT_ENABLED="false"
+    VAULT_PATH=""
     VAULT_DIRS=()
-    while IFS= read -r line; do
-        VAULT_DIRS+=("$line")
-    done < <(python3 -c "
-import yaml
-with open('$config_file') as f:
-    c = yaml.safe_load(f)
-for d in c.get('vault',{}).get('dirs',[]):
-    print(d)
-" 2>/dev/null)
-
     VAULT_FILES=()
-    while IFS= read -r line; do
-        VAULT_FILES+=("$line")
-    done < <(python3 -c "
-import yaml
-with open('$config_file') as f:
-    c = yaml.safe_load(f)
-for f2 in c.get('vault',{}).get('files',[]):
-    print(f2)
-" 2>/dev/null)
+
+    # All vault settings from one config read
+    local assignments
+    assignments=$("$helper" "$config_file" vault 2>/dev/null) || return 0
+    eval "$assignments"
 }
 
 # Get list of configured agents (excludes agents with null workspace or empty prompts)
 # Usage: mapfile -t AGENTS < <(get_agents)
 get_agents() {
     local config_file="$ROOT_DIR/config.yaml"
+    local helper="$ROOT_DIR/tools/helpers/config-env.py"
 
-    python3 -c "
-import yaml
-import sys
-try:
-    with open('$config_file') as f:
-        config = yaml.safe_load(f)
-    agents = config.get('agents', {})
-    for name in agents.keys():
-        print(name)
-except Exception as e:
-    print(f'Error: {e}', file=sys.stderr)
-    sys.exit(1)
-" 2>/dev/null
+    "$helper" "$config_file" agents 2>/dev/null
 }
 
 # Get list of agents with content_pipeline: true
 # Usage: mapfile -t CP_AGENTS < <(get_content_pipeline_agents)
 get_content_pipeline_agents() {
     local config_file="$ROOT_DIR/config.yaml"
+    local helper="$ROOT_DIR/tools/helpers/config-env.py"
 
-    python3 -c "
-import yaml, sys
-try:
-    with open('$config_file') as f:
-        config = yaml.safe_load(f)
-    for name, cfg in config.get('agents', {}).items():
-        if cfg.get('content_pipeline', False):
-            print(name)
-except Exception as e:
-    print(f'Error: {e}', file=sys.stderr)
-    sys.exit(1)
-" 2>/dev/null
+    "$helper" "$config_file" agents --flag content_pipeline 2>/dev/null
 }
 
 # Get list of agents with reset_cycle: true
 # Usage: mapfile -t RESET_AGENTS < <(get_reset_agents)
 get_reset_agents() {
     local config_file="$ROOT_DIR/config.yaml"
+    local helper="$ROOT_DIR/tools/helpers/config-env.py"
 
-    python3 -c "
-import yaml, sys
-try:
-    with open('$config_file') as f:
-        config = yaml.safe_load(f)
-    for name, cfg in config.get('agents', {}).items():
-        if cfg.get('reset_cycle', False):
-            print(name)
-except Exception as e:
-    print(f'Error: {e}', file=sys.stderr)
-    sys.exit(1)
-" 2>/dev/null
+    "$helper" "$config_file" agents --flag reset_cycle 2>/dev/null
 }
 
 # Get list of agents with export_cycle: true
 # Usage: mapfile -t EXPORT_AGENTS < <(get_export_agents)
 get_export_agents() {
     local config_file="$ROOT_DIR/config.yaml"
+    local helper="$ROOT_DIR/tools/helpers/config-env.py"
 
-    python3 -c "
-import yaml, sys
-try:
-    with open('$config_file') as f:
-        config = yaml.safe_load(f)
-    for name, cfg in config.get('agents', {}).items():
-        if cfg.get('export_cycle', False):
-            print(name)
-except Exception as e:
-    print(f'Error: {e}', file=sys.stderr)
-    sys.exit(1)
-" 2>/dev/null
+    "$helper" "$config_file" agents --flag export_cycle 2>/dev/null
 }
 
 # Get list of agents with wake_cycle: true
 # Usage: mapfile -t WAKE_AGENTS < <(get_wake_agents)
 get_wake_agents() {
     local config_file="$ROOT_DIR/config.yaml"
+    local helper="$ROOT_DIR/tools/helpers/config-env.py"
 
-    python3 -c "
-import yaml, sys
-try:
-    with open('$config_file') as f:
-        config = yaml.safe_load(f)
-    for name, cfg in config.get('agents', {}).items():
-        if cfg.get('wake_cycle', False):
-            print(name)
-except Exception as e:
-    print(f'Error: {e}', file=sys.stderr)
-    sys.exit(1)
-" 2>/dev/null
+    "$helper" "$config_file" agents --flag wake_cycle 2>/dev/null
 }
 
 # Load config for a specific agent
@@ -216,50 +132,27 @@ except Exception as e:
 load_agent_config() {
     local agent="${1:-bruba-main}"
     local config_file="$ROOT_DIR/config.yaml"
+    local helper="$ROOT_DIR/tools/helpers/config-env.py"
 
     AGENT_NAME="$agent"
 
-    # Use Python to reliably parse nested YAML
-    local agent_data
-    agent_data=$(python3 -c "
-import yaml
-import json
-import sys
-try:
-    with open('$config_file') as f:
-        config = yaml.safe_load(f)
-    agent = config.get('agents', {}).get('$agent', {})
-    all_agents = config.get('agents', {})
-    identity = agent.get('identity', {})
-    peer_id = identity.get('peer_agent', '')
-    peer_agent = all_agents.get(peer_id, {})
-    peer_identity = peer_agent.get('identity', {})
-    print(json.dumps({
-        'workspace': agent.get('workspace'),
-        'prompts': agent.get('prompts', []),
-        'remote_path': agent.get('remote_path', 'memory'),
-        'content_pipeline': agent.get('content_pipeline', False),
-        'identity': identity,
-        'peer_human_name': peer_identity.get('human_name', ''),
-        'variables': agent.get('variables', {})
-    }))
-except Exception as e:
-    print(json.dumps({'workspace': None, 'prompts': [], 'remote_path': 'memory', 'content_pipeline': False}))
-" 2>/dev/null)
-
-    AGENT_WORKSPACE=$(echo "$agent_data" | python3 -c "import json,sys; d=json.load(sys.stdin); print(d.get('workspace') or '')" 2>/dev/null)
-    AGENT_PROMPTS=$(echo "$agent_data" | python3 -c "import json,sys; d=json.load(sys.stdin); print(json.dumps(d.get('prompts', [])))" 2>/dev/null)
-    AGENT_REMOTE_PATH=$(echo "$agent_data" | python3 -c "import json,sys; d=json.load(sys.stdin); print(d.get('remote_path') or 'memory')" 2>/dev/null)
-    AGENT_CONTENT_PIPELINE=$(echo "$agent_data" | python3 -c "import json,sys; d=json.load(sys.stdin); print('true' if d.get('content_pipeline') else 'false')" 2>/dev/null)
-
-    # Identity fields
-    AGENT_HUMAN_NAME=$(echo "$agent_data" | python3 -c "import json,sys; d=json.load(sys.stdin); print(d.get('identity',{}).get('human_name',''))" 2>/dev/null)
-    AGENT_SIGNAL_UUID=$(echo "$agent_data" | python3 -c "import json,sys; d=json.load(sys.stdin); print(d.get('identity',{}).get('signal_uuid',''))" 2>/dev/null)
-    AGENT_PEER_AGENT=$(echo "$agent_data" | python3 -c "import json,sys; d=json.load(sys.stdin); print(d.get('identity',{}).get('peer_agent',''))" 2>/dev/null)
-    AGENT_PEER_HUMAN_NAME=$(echo "$agent_data" | python3 -c "import json,sys; d=json.load(sys.stdin); print(d.get('peer_human_name',''))" 2>/dev/null)
-
-    # Custom variables as JSON (applied via Python in apply_substitutions)
-    AGENT_CUSTOM_VARIABLES=$(echo "$agent_data" | python3 -c "import json,sys; d=json.load(sys.stdin); print(json.dumps(d.get('variables', {})))" 2>/dev/null)
+    # Defaults if config.yaml can't be read
+    AGENT_WORKSPACE=""
+    AGENT_PROMPTS="[]"
+    AGENT_REMOTE_PATH="memory"
+    AGENT_CONTENT_PIPELINE="false"
+    AGENT_HUMAN_NAME=""
+    AGENT_SIGNAL_UUID=""
+    AGENT_PEER_AGENT=""
+    AGENT_PEER_HUMAN_NAME=""
+    AGENT_CUSTOM_VARIABLES="{}"
+
+    # Every AGENT_* value from one config read (identity fields, custom
+    # variables as JSON for apply_substitutions)
+    local assignments
+    if assignments=$("$helper" "$config_file" agent "$agent" 2>/dev/null); then
+        eval "$assignments"
+    fi
 
     # Derived paths (all per-agent dirs live under agents/{name}/)
     AGENT_DIR="$AGENTS_DIR/$agent"
@@ -293,6 +186,16 @@ get_agent_tools_deny() {
     "$helper" "$config_file" "agents.$agent.tools_deny" 2>/dev/null || true
 }
 
+# Get many config.yaml values from one parse, as shell assignments
+# Usage: eval "$(get_config_values NAME=key.path NAME2=json:key.path ...)"
+# json: gives the same output as --to-json (camelCase keys); missing keys are empty
+get_config_values() {
+    local config_file="$ROOT_DIR/config.yaml"
+    local helper="$ROOT_DIR/tools/helpers/parse-yaml.py"
+
+    "$helper" "$config_file" --batch "$@" 2>/dev/null || true
+}
+
 # Get subagents config from config.yaml
 # Usage: get_subagents_config
 # Returns: JSON object with subagent settings
@@ -527,6 +430,91 @@ bot_scp() {
     esac
 }
 
+# Copy many files from one bot directory in a single transfer
+# Usage: bot_fetch_files "remote_dir" "local_dir" "list_file"
+# list_file has one path per line, relative to remote_dir (subdirectories
+# are recreated under local_dir).
+# Returns non-zero if any file failed to copy.
+bot_fetch_files() {
+    local remote_dir="$1"
+    local local_dir="$2"
+    local list_file="$3"
+
+    case "$BOT_TRANSPORT" in
+        sudo)
+            # Same machine - no round trips to save, copy each with sudo
+            local name status=0
+            while IFS= read -r name; do
+                [[ -z "$name" ]] && continue
+                mkdir -p "$(dirname "$local_dir/$name")"
+                sudo -u "$BOT_USER" cat "$remote_dir/$name" > "$local_dir/$name" || status=1
+            done < "$list_file"
+            return $status
+            ;;
+        tailscale-ssh)
+            # One rsync over tailscale ssh, compressed in transit
+            rsync -e "tailscale ssh" -qz --files-from="$list_file" \
+                "$BOT_USER@$BOT_HOST:$remote_dir/" "$local_dir/"
+            ;;
+        ssh|*)
+            # Default: one rsync over the multiplexed SSH connection
+            rsync -e "ssh $SSH_OPTS" -qz --files-from="$list_file" \
+                "$BOT_USER@$BOT_HOST:$remote_dir/" "$local_dir/"
+            ;;
+    esac
+}
+
+# Turn rsync --itemize-changes output (stdin) into memory change lines:
+# "A path" (added), "M path" (changed), "D path" (deleted). Directories
+# and other lines (headers, totals) are dropped.
+# Usage: rsync -ai ... | itemized_changes "/remote/dest/"
+itemized_changes() {
+    awk -v prefix="$1" '
+        /^\*deleting / { sub(/^\*deleting +/, ""); if ($0 !~ /\/$/) print "D " prefix $0; next }
+        /^[<>]f\+\+\+\+\+\+\+\+\+ / { print "A " prefix substr($0, 13); next }
+        /^[<>]f/ { print "M " prefix substr($0, 13); next }
+    '
+}
+
+# Reindex an agent's memory on the bot if anything changed
+# Changes are read from agents/{agent}/.reindex-pending ("A|M|D path" lines
+# appended by push.sh and sync-memory.sh); the file is kept until a reindex
+# succeeds. openclaw's index already skips unchanged files, so only a full
+# reindex (--force, rebuilds every file) needs full=true.
+# Usage: reindex_memory "agent" [full]
+# Prints one status line if it ran the index command
+# Returns: 0 if indexed or nothing pending, 1 if the index command failed
+reindex_memory() {
+    local agent="$1"
+    local full="${2:-false}"
+    local pending="${AGENTS_DIR:-$ROOT_DIR/agents}/$agent/.reindex-pending"
+    local cmd="openclaw memory index --agent $agent"
+    local summary
+
+    if [[ "$full" == "true" ]]; then
+        cmd="$cmd --force"
+        summary="full reindex"
+    elif [[ -s "$pending" ]]; then
+        # Latest change per path wins (a file added then edited counts once)
+        summary=$(awk '
+            { kind = $1; sub(/^[AMD] /, ""); last[$0] = kind }
+            END {
+                for (path in last) count[last[path]]++
+                printf "%d added, %d changed, %d deleted", count["A"], count["M"], count["D"]
+            }' "$pending")
+    else
+        return 0
+    fi
+
+    if bot_cmd "$cmd" >/dev/null 2>&1; then
+        rm -f "$pending"
+        echo "  $agent: memory indexed ($summary)"
+        return 0
+    fi
+    echo "  $agent: Warning: Memory index failed (may need manual reindex)"
+    return 1
+}
+
 # Parse common arguments
 # Sets: QUIET, DRY_RUN, VERBOSE
 parse_common_args() {
@@ -8,12 +8,17 @@
 #   ./tools/mirror.sh --verbose          # Show detailed output
 #   ./tools/mirror.sh --dry-run          # Show what would be mirrored
 #
+# Each agent takes one bot call to list its files (with sizes and mtimes)
+# and one rsync to fetch the ones that changed since the last run, as
+# recorded in mirror/{agent}/.manifest. Unchanged files are not copied.
+#
 # Output structure:
 #   mirror/{agent}/
 #     prompts/    - AGENTS.md, MEMORY.md, etc.
 #     memory/     - Date-prefixed memory entries
 #     config/     - Config files (tokens redacted)
 #     tools/      - Bot's tool scripts
+#     .manifest   - "category size mtime path" of each mirrored file
 #
 # Logs: logs/mirror.log
 
@@ -68,6 +73,29 @@ else
 fi
 
 TOTAL_MIRRORED=0
+TOTAL_FETCHED=0
+TOTAL_SKIPPED=0
+TOTAL_SKIPPED_BYTES=0
+
+# Staging area for batched transfers
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# Remote helper for the manifest: reads paths on stdin and prints
+# "category size mtime path" for each regular file (GNU or BSD stat)
+MANIFEST_FN='m() { while IFS= read -r p; do case "$p" in /*) ;; *) p="$PWD/$p" ;; esac; [ -f "$p" ] && echo "$1 $(stat -c "%s %Y" "$p" 2>/dev/null || stat -f "%z %m" "$p") $p"; done; return 0; }'
+
+# Format a byte count for the summary
+human_bytes() {
+    local bytes="$1"
+    if [[ $bytes -ge 1048576 ]]; then
+        echo "$((bytes / 1048576)) MB"
+    elif [[ $bytes -ge 1024 ]]; then
+        echo "$((bytes / 1024)) KB"
+    else
+        echo "$bytes bytes"
+    fi
+}
 
 # Process each agent
 for agent in "${AGENTS[@]}"; do
@@ -85,159 +113,165 @@ for agent in "${AGENTS[@]}"; do
     log "Mirror dir: $AGENT_MIRROR_DIR"
 
     AGENT_MIRRORED=0
+    AGENT_FETCHED=0
+    AGENT_SKIPPED=0
+    AGENT_SKIPPED_BYTES=0
 
     # Create directories
     if [[ "$DRY_RUN" != "true" ]]; then
         mkdir -p "$AGENT_MIRROR_DIR"/{prompts,memory,config,tools}
     fi
 
-    # Core prompt files - single SSH call to list all existing .md files
-    log ""
-    log "Prompts ($AGENT_WORKSPACE/*.md):"
+    # Build one remote command that lists every file to mirror:
+    #   prompts/ - core prompt files in the workspace
+    #   memory/  - memory/*.md (date-prefixed ones are kept below)
+    #   config/  - openclaw config (main agent only, tokens redacted)
+    #   tools/   - tools/*.sh (main agent only)
+    #   state/   - state/*.json (manager only)
+    #   results/ - results/*.md (guru only)
     CORE_FILES="AGENTS.md MEMORY.md USER.md IDENTITY.md SOUL.md TOOLS.md HEARTBEAT.md BOOTSTRAP.md"
-    EXISTING_PROMPTS=$(bot_cmd "cd $AGENT_WORKSPACE && ls $CORE_FILES 2>/dev/null" || true)
-    for file in $EXISTING_PROMPTS; do
-        if [[ "$DRY_RUN" == "true" ]]; then
-            log "  Would mirror: prompts/$file"
-        else
-            bot_scp "$AGENT_WORKSPACE/$file" "$AGENT_MIRROR_DIR/prompts/$file"
-            log "  + prompts/$file"
-        fi
-        AGENT_MIRRORED=$((AGENT_MIRRORED + 1))
+    prompt_paths=""
+    for file in $CORE_FILES; do
+        prompt_paths+=" $AGENT_WORKSPACE/$file"
     done
+    MANIFEST_CMD="$MANIFEST_FN; ls -d$prompt_paths 2>/dev/null | m prompts"
+    MANIFEST_CMD+="; find $AGENT_WORKSPACE/memory -maxdepth 1 -name '*.md' 2>/dev/null | m memory"
+    if [[ "$agent" == "bruba-main" ]]; then
+        MANIFEST_CMD+="; ls -d $REMOTE_OPENCLAW/openclaw.json $REMOTE_OPENCLAW/exec-approvals.json 2>/dev/null | m config"
+        MANIFEST_CMD+="; find $AGENT_WORKSPACE/tools -maxdepth 1 -name '*.sh' 2>/dev/null | m tools"
+    fi
+    if [[ "$agent" == "bruba-manager" ]]; then
+        MANIFEST_CMD+="; find $AGENT_WORKSPACE/state -maxdepth 1 -name '*.json' 2>/dev/null | m state"
+    fi
+    if [[ "$agent" == "bruba-guru" ]]; then
+        MANIFEST_CMD+="; find $AGENT_WORKSPACE/results -maxdepth 1 -name '*.md' 2>/dev/null | m results"
+    fi
 
-    # Memory files (date-prefixed only) - single find call (returns empty if dir doesn't exist)
-    log ""
-    log "Memory ($AGENT_WORKSPACE/memory/):"
-    MEMORY_COUNT=0
-    while IFS= read -r remote_file; do
+    # One bot call for the whole listing, with sizes and mtimes
+    REMOTE_MANIFEST=$(bot_cmd "$MANIFEST_CMD" 2>/dev/null || true)
+
+    # Compare against what the last run mirrored; only changed or
+    # missing files are fetched
+    MANIFEST_FILE="$AGENT_MIRROR_DIR/.manifest"
+    OLD_MANIFEST=$'\n'"$(cat "$MANIFEST_FILE" 2>/dev/null || true)"$'\n'
+    NEW_MANIFEST=()
+    FETCH_LINES=()
+    last_category=""
+
+    while read -r category size mtime remote_file; do
         [[ -z "$remote_file" ]] && continue
         filename=$(basename "$remote_file")
 
-        # Only pull files starting with YYYY-MM-DD
-        if [[ "$filename" =~ ^[0-9]{4}-[0-9]{2}-[0-9]{2} ]]; then
-            if [[ "$DRY_RUN" == "true" ]]; then
-                log "  Would mirror: memory/$filename"
-            else
-                bot_scp "$remote_file" "$AGENT_MIRROR_DIR/memory/$filename"
-                log "  + memory/$filename"
-            fi
-            AGENT_MIRRORED=$((AGENT_MIRRORED + 1))
-            MEMORY_COUNT=$((MEMORY_COUNT + 1))
+        # Only mirror memory files starting with YYYY-MM-DD
+        if [[ "$category" == "memory" && ! "$filename" =~ ^[0-9]{4}-[0-9]{2}-[0-9]{2} ]]; then
+            continue
         fi
-    done < <(bot_cmd "find $AGENT_WORKSPACE/memory -maxdepth 1 -name '*.md' 2>/dev/null" || true)
 
-    if [[ $MEMORY_COUNT -eq 0 ]]; then
-        log "  (no memory files)"
-    fi
+        if [[ "$category" != "$last_category" ]]; then
+            log ""
+            log "$category:"
+            last_category="$category"
+        fi
 
-    # Config files - only for main agent (has openclaw config)
-    if [[ "$agent" == "bruba-main" ]]; then
-        log ""
-        log "Config ($REMOTE_OPENCLAW/*.json):"
-        CONFIG_FILES="openclaw.json exec-approvals.json"
-        EXISTING_CONFIGS=$(bot_cmd "cd $REMOTE_OPENCLAW && ls $CONFIG_FILES 2>/dev/null" || true)
-        for config_file in $EXISTING_CONFIGS; do
-            if [[ "$DRY_RUN" == "true" ]]; then
-                log "  Would mirror: config/$config_file"
-            else
-                if [[ "$config_file" == "openclaw.json" ]]; then
-                    # Redact sensitive tokens
-                    bot_cmd "cat $REMOTE_OPENCLAW/$config_file" 2>/dev/null | \
-                        sed 's/"botToken"[[:space:]]*:[[:space:]]*"[^"]*"/"botToken": "[REDACTED]"/g' | \
-                        sed 's/"token"[[:space:]]*:[[:space:]]*"[^"]*"/"token": "[REDACTED]"/g' \
-                        > "$AGENT_MIRROR_DIR/config/$config_file"
-                    log "  + config/$config_file (tokens redacted)"
-                else
-                    bot_scp "$REMOTE_OPENCLAW/$config_file" "$AGENT_MIRROR_DIR/config/$config_file"
-                    log "  + config/$config_file"
-                fi
-            fi
-            AGENT_MIRRORED=$((AGENT_MIRRORED + 1))
-        done
-    fi
+        line="$category $size $mtime $remote_file"
+        AGENT_MIRRORED=$((AGENT_MIRRORED + 1))
 
-    # Tool scripts - only for main agent
-    if [[ "$agent" == "bruba-main" ]]; then
-        log ""
-        log "Tools ($AGENT_WORKSPACE/tools/):"
-        TOOLS_COUNT=0
-        while IFS= read -r remote_file; do
-            [[ -z "$remote_file" ]] && continue
-            filename=$(basename "$remote_file")
-            if [[ "$DRY_RUN" == "true" ]]; then
-                log "  Would mirror: tools/$filename"
-            else
-                bot_scp "$remote_file" "$AGENT_MIRROR_DIR/tools/$filename"
-                log "  + tools/$filename"
-            fi
-            AGENT_MIRRORED=$((AGENT_MIRRORED + 1))
-            TOOLS_COUNT=$((TOOLS_COUNT + 1))
-        done < <(bot_cmd "find $AGENT_WORKSPACE/tools -maxdepth 1 -name '*.sh' 2>/dev/null" || true)
+        if [[ "$OLD_MANIFEST" == *$'\n'"$line"$'\n'* && -f "$AGENT_MIRROR_DIR/$category/$filename" ]]; then
+            log "  = $category/$filename (unchanged)"
+            NEW_MANIFEST+=("$line")
+            AGENT_SKIPPED=$((AGENT_SKIPPED + 1))
+            AGENT_SKIPPED_BYTES=$((AGENT_SKIPPED_BYTES + size))
+            continue
+        fi
 
-        if [[ $TOOLS_COUNT -eq 0 ]]; then
-            log "  (no tools)"
+        if [[ "$DRY_RUN" == "true" ]]; then
+            log "  Would mirror: $category/$filename"
+        else
+            FETCH_LINES+=("$line")
         fi
+    done <<< "$REMOTE_MANIFEST"
+
+    if [[ $AGENT_MIRRORED -eq 0 ]]; then
+        log "  (no files)"
     fi
 
-    # State files - for manager (single find call)
-    if [[ "$agent" == "bruba-manager" ]]; then
-        log ""
-        log "State ($AGENT_WORKSPACE/state/):"
-        STATE_COUNT=0
-        while IFS= read -r remote_file; do
-            [[ -z "$remote_file" ]] && continue
-            mkdir -p "$AGENT_MIRROR_DIR/state" 2>/dev/null || true
-            filename=$(basename "$remote_file")
-            if [[ "$DRY_RUN" == "true" ]]; then
-                log "  Would mirror: state/$filename"
-            else
-                bot_scp "$remote_file" "$AGENT_MIRROR_DIR/state/$filename"
-                log "  + state/$filename"
-            fi
-            AGENT_MIRRORED=$((AGENT_MIRRORED + 1))
-            STATE_COUNT=$((STATE_COUNT + 1))
-        done < <(bot_cmd "find $AGENT_WORKSPACE/state -maxdepth 1 -name '*.json' 2>/dev/null" || true)
-        if [[ $STATE_COUNT -eq 0 ]]; then
-            log "  (no state files)"
+    # Fetch every changed file in one compressed rsync into a staging
+    # dir (keeping remote paths), then move each into place
+    if [[ ${#FETCH_LINES[@]} -gt 0 ]]; then
+        STAGE_DIR="$WORK_DIR/$agent"
+        mkdir -p "$STAGE_DIR"
+        list_file="$WORK_DIR/$agent.files"
+        : > "$list_file"
+        for line in "${FETCH_LINES[@]}"; do
+            remote_file="${line#* * * }"
+            echo "${remote_file#/}" >> "$list_file"
+        done
+
+        if ! bot_fetch_files "/" "$STAGE_DIR" "$list_file" 2>/dev/null; then
+            log ""
+            log "WARNING: Batched transfer failed, copying files one at a time"
+            for line in "${FETCH_LINES[@]}"; do
+                remote_file="${line#* * * }"
+                [[ -f "$STAGE_DIR$remote_file" ]] && continue
+                mkdir -p "$(dirname "$STAGE_DIR$remote_file")"
+                bot_scp "$remote_file" "$STAGE_DIR$remote_file" 2>/dev/null || rm -f "$STAGE_DIR$remote_file"
+            done
         fi
-    fi
 
-    # Results files - for guru (single find call)
-    if [[ "$agent" == "bruba-guru" ]]; then
         log ""
-        log "Results ($AGENT_WORKSPACE/results/):"
-        RESULTS_COUNT=0
-        while IFS= read -r remote_file; do
-            [[ -z "$remote_file" ]] && continue
-            mkdir -p "$AGENT_MIRROR_DIR/results" 2>/dev/null || true
+        for line in "${FETCH_LINES[@]}"; do
+            read -r category size mtime remote_file <<< "$line"
             filename=$(basename "$remote_file")
-            if [[ "$DRY_RUN" == "true" ]]; then
-                log "  Would mirror: results/$filename"
+            staged="$STAGE_DIR$remote_file"
+
+            if [[ ! -f "$staged" ]]; then
+                log "  ERROR: Failed to copy $category/$filename"
+                continue
+            fi
+
+            mkdir -p "$AGENT_MIRROR_DIR/$category"
+            if [[ "$category" == "config" && "$filename" == "openclaw.json" ]]; then
+                # Redact sensitive tokens
+                sed 's/"botToken"[[:space:]]*:[[:space:]]*"[^"]*"/"botToken": "[REDACTED]"/g' "$staged" | \
+                    sed 's/"token"[[:space:]]*:[[:space:]]*"[^"]*"/"token": "[REDACTED]"/g' \
+                    > "$AGENT_MIRROR_DIR/$category/$filename"
+                rm -f "$staged"
+                log "  + $category/$filename (tokens redacted)"
             else
-                bot_scp "$remote_file" "$AGENT_MIRROR_DIR/results/$filename"
-                log "  + results/$filename"
+                mv "$staged" "$AGENT_MIRROR_DIR/$category/$filename"
+                log "  + $category/$filename"
             fi
-            AGENT_MIRRORED=$((AGENT_MIRRORED + 1))
-            RESULTS_COUNT=$((RESULTS_COUNT + 1))
-        done < <(bot_cmd "find $AGENT_WORKSPACE/results -maxdepth 1 -name '*.md' 2>/dev/null" || true)
-        if [[ $RESULTS_COUNT -eq 0 ]]; then
-            log "  (no results files)"
+            NEW_MANIFEST+=("$line")
+            AGENT_FETCHED=$((AGENT_FETCHED + 1))
+        done
+    fi
+
+    # Record what is now mirrored (failed files are retried next run)
+    if [[ "$DRY_RUN" != "true" ]]; then
+        if [[ ${#NEW_MANIFEST[@]} -gt 0 ]]; then
+            printf '%s\n' "${NEW_MANIFEST[@]}" > "$MANIFEST_FILE"
+        else
+            : > "$MANIFEST_FILE"
         fi
     fi
 
-    echo "$agent: $AGENT_MIRRORED files"
+    echo "$agent: $AGENT_MIRRORED files ($AGENT_SKIPPED unchanged)"
     TOTAL_MIRRORED=$((TOTAL_MIRRORED + AGENT_MIRRORED))
+    TOTAL_FETCHED=$((TOTAL_FETCHED + AGENT_FETCHED))
+    TOTAL_SKIPPED=$((TOTAL_SKIPPED + AGENT_SKIPPED))
+    TOTAL_SKIPPED_BYTES=$((TOTAL_SKIPPED_BYTES + AGENT_SKIPPED_BYTES))
 done
 
+SKIPPED_SUMMARY="$TOTAL_SKIPPED unchanged, $(human_bytes "$TOTAL_SKIPPED_BYTES") skipped"
+
 log ""
 log "=== Summary ==="
 if [[ "$DRY_RUN" == "true" ]]; then
-    log "Would mirror: $TOTAL_MIRRORED files"
+    log "Would mirror: $TOTAL_MIRRORED files ($SKIPPED_SUMMARY)"
 else
-    log "Mirrored: $TOTAL_MIRRORED files"
+    log "Mirrored: $TOTAL_MIRRORED files ($TOTAL_FETCHED fetched, $SKIPPED_SUMMARY)"
 fi
 
 # Always print summary
 echo ""
-echo "Mirror: $TOTAL_MIRRORED files"
+echo "Mirror: $TOTAL_MIRRORED files ($SKIPPED_SUMMARY)"
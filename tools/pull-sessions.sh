@@ -7,15 +7,25 @@
 #   ./tools/pull-sessions.sh --dry-run    # Show what would be pulled
 #   ./tools/pull-sessions.sh --force UUID # Force re-pull specific session
 #   ./tools/pull-sessions.sh --no-convert # Skip markdown conversion
+#   ./tools/pull-sessions.sh --include-active # Also follow the active session
+#   ./tools/pull-sessions.sh --jobs 1     # Pull one agent at a time
 #
 # Closed sessions are immutable - once pulled, they never need re-pulling.
-# Active session is skipped (still being written).
+# Active session is skipped (still being written) unless --include-active:
+# then it is copied on every run and converted incrementally, and it is
+# only recorded in .pulled once it has closed.
 #
-# Pipeline (per agent with content_pipeline: true):
-#   1. Pull JSONL to sessions/{agent}/
-#   2. Convert to delimited markdown in intake/{agent}/ (via distill CLI)
+# Conversion uses parse-jsonl --follow, which keeps a byte offset per output
+# (intake/{agent}/.{session}.md.follow.json) and only parses lines appended
+# since the last run. A followed session that closes is finished in O(new bytes).
+#
+# Pipeline (per agent with content_pipeline: true, agents run concurrently):
+#   1. Work out which sessions are new against .pulled, then fetch them all
+#      with one compressed rsync --files-from (per-file copy as a fallback)
+#   2. Convert to delimited markdown in intake/{agent}/ (one distill CLI call per agent)
 #
 # Output: sessions/{agent}/*.jsonl (raw JSONL), intake/{agent}/*.md (delimited markdown)
+# Search index: .distill-index.sqlite (updated after pulling; see distill search)
 # State: sessions/{agent}/.pulled (list of pulled session IDs per agent)
 # Logs: logs/pull.log
 
@@ -26,11 +36,13 @@ source "$(dirname "$0")/lib.sh"
 
 FORCE_SESSION=""
 NO_CONVERT=false
+INCLUDE_ACTIVE=false
+PULL_JOBS=0
 
 # Parse arguments (parse_common_args returns 1 for --help)
 if ! parse_common_args "$@"; then
     # Show help was requested
-    echo "Usage: $0 [--dry-run] [--verbose] [--force UUID] [--no-convert]"
+    echo "Usage: $0 [--dry-run] [--verbose] [--force UUID] [--no-convert] [--include-active] [--jobs N]"
     echo ""
     echo "Pull closed bot sessions locally and convert to delimited markdown."
     echo "Iterates over agents with content_pipeline: true in config.yaml."
@@ -41,6 +53,8 @@ if ! parse_common_args "$@"; then
     echo "  --quiet, -q       Summary output only (default)"
     echo "  --force, -f UUID  Force re-pull a specific session"
     echo "  --no-convert      Skip conversion to markdown (raw JSONL only)"
+    echo "  --include-active  Also copy and incrementally convert the active session"
+    echo "  --jobs, -j N      Agents to pull at once (default: 0 = all)"
     exit 0
 fi
 set -- "${REMAINING_ARGS[@]}"
@@ -55,6 +69,18 @@ while [[ $# -gt 0 ]]; do
             NO_CONVERT=true
             shift
             ;;
+        --include-active)
+            INCLUDE_ACTIVE=true
+            shift
+            ;;
+        --jobs|-j)
+            if [[ ! "$2" =~ ^[0-9]+$ ]]; then
+                echo "Invalid --jobs value: ${2:-<missing>} (expected a number, 0 = all)"
+                exit 1
+            fi
+            PULL_JOBS="$2"
+            shift 2
+            ;;
         *)
             echo "Unknown option: $1"
             exit 1
@@ -87,12 +113,11 @@ fi
 log "=== Pulling Bot Sessions ==="
 log "Content pipeline agents: ${CP_AGENTS[*]}"
 
-# Grand totals
-GRAND_PULLED=0
-GRAND_SKIPPED=0
-GRAND_CONVERTED=0
-
-for agent in "${CP_AGENTS[@]}"; do
+# Pull and convert one agent's sessions
+# Prints the agent's summary line and writes "PULLED SKIPPED CONVERTED"
+# to $WORK_DIR/<agent>.totals (missing if the agent was skipped)
+pull_agent() {
+    local agent="$1"
     load_agent_config "$agent"
 
     # Per-agent paths (from lib.sh load_agent_config)
@@ -109,7 +134,7 @@ for agent in "${CP_AGENTS[@]}"; do
     log "Checking active session..."
     SESSIONS_JSON=$(bot_cmd "cat $AGENT_REMOTE_SESSIONS/sessions.json" 2>/dev/null) || {
         log "WARNING: Could not read sessions.json for $agent, skipping"
-        continue
+        return 0
     }
 
     # Extract active session ID (Python handles the nested structure)
@@ -122,15 +147,19 @@ for key, val in data.items():
         break
 " 2>/dev/null) || {
         log "WARNING: Could not parse active session ID for $agent, skipping"
-        continue
+        return 0
     }
 
-    log "Active session (skipping): ${ACTIVE_ID:0:8}..."
+    if [[ "$INCLUDE_ACTIVE" == "true" ]]; then
+        log "Active session (following): ${ACTIVE_ID:0:8}..."
+    else
+        log "Active session (skipping): ${ACTIVE_ID:0:8}..."
+    fi
 
     # List all session files for this agent
     SESSION_FILES=$(bot_cmd "ls $AGENT_REMOTE_SESSIONS/*.jsonl 2>/dev/null" | sort) || {
         log "No session files found for $agent"
-        continue
+        return 0
     }
 
     # Track newly pulled sessions for conversion
@@ -142,26 +171,34 @@ for key, val in data.items():
     SKIPPED_PULLED=0
     PULLED=0
 
+    # Decide what to fetch up front: .pulled is read once, not per session
+    local pulled_ids=$'\n'"$(cat "$AGENT_STATE_FILE")"$'\n'
+    FETCH_IDS=()
+
     for session_file in $SESSION_FILES; do
         TOTAL=$((TOTAL + 1))
         session_id=$(basename "$session_file" .jsonl)
 
-        # Skip active session
+        # Skip active session (or re-copy it each run when following)
         if [[ "$session_id" == "$ACTIVE_ID" ]]; then
-            log "  Skip (active): ${session_id:0:8}..."
             SKIPPED_ACTIVE=$((SKIPPED_ACTIVE + 1))
+            if [[ "$INCLUDE_ACTIVE" != "true" ]]; then
+                log "  Skip (active): ${session_id:0:8}..."
+            elif [[ "$DRY_RUN" == "true" ]]; then
+                log "  Would follow (active): ${session_id:0:8}..."
+            else
+                FETCH_IDS+=("$session_id")
+            fi
             continue
         fi
 
         # Skip already pulled (unless forcing)
-        if [[ "$session_id" != "$FORCE_SESSION" ]] && grep -q "^$session_id$" "$AGENT_STATE_FILE" 2>/dev/null; then
+        if [[ "$session_id" != "$FORCE_SESSION" && "$pulled_ids" == *$'\n'"$session_id"$'\n'* ]]; then
             log "  Skip (pulled): ${session_id:0:8}..."
             SKIPPED_PULLED=$((SKIPPED_PULLED + 1))
             continue
         fi
 
-        output_file="$AGENT_SESSIONS_DIR/$session_id.jsonl"
-
         if [[ "$DRY_RUN" == "true" ]]; then
             log "  Would pull: ${session_id:0:8}..."
             PULLED=$((PULLED + 1))
@@ -169,26 +206,51 @@ for key, val in data.items():
         fi
 
         log "  Pulling: ${session_id:0:8}..."
+        FETCH_IDS+=("$session_id")
+    done
 
-        # Copy session file
-        if ! bot_scp "$session_file" "$output_file" 2>/dev/null; then
-            log "    ERROR: Failed to copy"
-            continue
+    # Fetch everything in one compressed rsync; if that fails, fall back
+    # to copying one session at a time so one bad file doesn't block the rest
+    FETCHED=()
+    if [[ ${#FETCH_IDS[@]} -gt 0 ]]; then
+        local list_file="$WORK_DIR/$agent.files"
+        printf '%s.jsonl\n' "${FETCH_IDS[@]}" > "$list_file"
+
+        if bot_fetch_files "$AGENT_REMOTE_SESSIONS" "$AGENT_SESSIONS_DIR" "$list_file" 2>/dev/null; then
+            FETCHED=("${FETCH_IDS[@]}")
+        else
+            log "  WARNING: Batched transfer failed, copying sessions one at a time"
+            for session_id in "${FETCH_IDS[@]}"; do
+                if bot_scp "$AGENT_REMOTE_SESSIONS/$session_id.jsonl" \
+                        "$AGENT_SESSIONS_DIR/$session_id.jsonl" 2>/dev/null; then
+                    FETCHED+=("$session_id")
+                elif [[ "$session_id" == "$ACTIVE_ID" ]]; then
+                    log "  ERROR: Failed to copy active session ${session_id:0:8}..."
+                else
+                    log "    ERROR: Failed to copy ${session_id:0:8}..."
+                fi
+            done
         fi
+    fi
 
-        # Record as pulled
+    # Record closed sessions as pulled only once they are on disk
+    NEW_IDS=()
+    for session_id in "${FETCHED[@]}"; do
+        NEWLY_PULLED+=("$AGENT_SESSIONS_DIR/$session_id.jsonl")
+        if [[ "$session_id" == "$ACTIVE_ID" ]]; then
+            log "  Following (active): ${session_id:0:8}..."
+            continue
+        fi
         if [[ "$session_id" == "$FORCE_SESSION" ]]; then
             grep -v "^$session_id$" "$AGENT_STATE_FILE" > "$AGENT_STATE_FILE.tmp" 2>/dev/null || true
             mv "$AGENT_STATE_FILE.tmp" "$AGENT_STATE_FILE"
         fi
-        echo "$session_id" >> "$AGENT_STATE_FILE"
-
-        # Track for conversion
-        NEWLY_PULLED+=("$output_file")
-
-        log "    OK"
+        NEW_IDS+=("$session_id")
         PULLED=$((PULLED + 1))
     done
+    if [[ ${#NEW_IDS[@]} -gt 0 ]]; then
+        printf '%s\n' "${NEW_IDS[@]}" >> "$AGENT_STATE_FILE"
+    fi
 
     log ""
     log "  $agent: Total: $TOTAL, Active: $SKIPPED_ACTIVE, Already pulled: $SKIPPED_PULLED"
@@ -204,28 +266,113 @@ for key, val in data.items():
         log ""
         log "  Converting to Markdown..."
 
+        # One interpreter per agent: parse-jsonl converts the batch with a
+        # worker pool (CONVERT_JOBS, this agent's share of the CPUs) and
+        # prints one "  -> path" line per converted session.
+        # A forced re-pull is converted from scratch; everything else resumes.
+        FOLLOW_FILES=()
+        FORCED_FILES=()
         for jsonl_file in "${NEWLY_PULLED[@]}"; do
-            session_id=$(basename "$jsonl_file" .jsonl)
-            log "    Converting: ${session_id:0:8}..."
-
-            if python3 -m components.distill.lib.cli parse-jsonl "$jsonl_file" -o "$AGENT_INTAKE_DIR" 2>/dev/null; then
-                log "      -> $AGENT_INTAKE_DIR/$session_id.md"
-                CONVERTED=$((CONVERTED + 1))
+            if [[ "$(basename "$jsonl_file" .jsonl)" == "$FORCE_SESSION" ]]; then
+                FORCED_FILES+=("$jsonl_file")
             else
-                log "      ERROR: Conversion failed"
+                FOLLOW_FILES+=("$jsonl_file")
             fi
         done
 
+        CONVERT_OUTPUT=""
+        if [[ ${#FOLLOW_FILES[@]} -gt 0 ]]; then
+            CONVERT_OUTPUT+=$(python3 -m components.distill.lib.cli parse-jsonl "${FOLLOW_FILES[@]}" \
+                -o "$AGENT_INTAKE_DIR" --follow --jobs "$CONVERT_JOBS" 2>/dev/null) || true
+            CONVERT_OUTPUT+=$'\n'
+        fi
+        if [[ ${#FORCED_FILES[@]} -gt 0 ]]; then
+            CONVERT_OUTPUT+=$(python3 -m components.distill.lib.cli parse-jsonl "${FORCED_FILES[@]}" \
+                -o "$AGENT_INTAKE_DIR" 2>/dev/null) || true
+        fi
+
+        while IFS= read -r line; do
+            [[ -z "$line" ]] && continue
+            log "    $line"
+            if [[ "$line" == "  -> "* ]]; then
+                CONVERTED=$((CONVERTED + 1))
+            fi
+        done <<< "$CONVERT_OUTPUT"
+        if [[ "$CONVERTED" -lt ${#NEWLY_PULLED[@]} ]]; then
+            log "    ERROR: $(( ${#NEWLY_PULLED[@]} - CONVERTED )) conversions failed"
+        fi
+
         log "  Converted: $CONVERTED sessions"
     fi
 
-    GRAND_PULLED=$((GRAND_PULLED + PULLED))
-    GRAND_SKIPPED=$((GRAND_SKIPPED + SKIPPED_PULLED))
-    GRAND_CONVERTED=$((GRAND_CONVERTED + CONVERTED))
-
+    echo "$PULLED $SKIPPED_PULLED $CONVERTED" > "$WORK_DIR/$agent.totals"
     echo "$agent: $PULLED new, $SKIPPED_PULLED skipped, $CONVERTED converted"
+}
+
+# Agents are pulled concurrently (up to PULL_JOBS at once). Each one logs
+# to its own buffer, replayed in agent order once all have finished; an
+# agent only touches its own sessions/, intake/ and .pulled.
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# Agents running at once split the CPUs between their converter pools
+ACTIVE_AGENTS=${#CP_AGENTS[@]}
+if [[ "$PULL_JOBS" -gt 0 && "$PULL_JOBS" -lt "$ACTIVE_AGENTS" ]]; then
+    ACTIVE_AGENTS=$PULL_JOBS
+fi
+CPU_COUNT=$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo 1)
+CONVERT_JOBS=$(( CPU_COUNT / (ACTIVE_AGENTS > 0 ? ACTIVE_AGENTS : 1) ))
+[[ "$CONVERT_JOBS" -ge 1 ]] || CONVERT_JOBS=1
+
+PIDS=()
+for agent in "${CP_AGENTS[@]}"; do
+    if [[ "$PULL_JOBS" -gt 0 && ${#PIDS[@]} -ge "$PULL_JOBS" ]]; then
+        wait "${PIDS[0]}" || true
+        PIDS=("${PIDS[@]:1}")
+    fi
+    (
+        LOG_FILE="$WORK_DIR/$agent.log"
+        pull_agent "$agent"
+    ) > "$WORK_DIR/$agent.out" 2>&1 &
+    PIDS+=($!)
+done
+for pid in "${PIDS[@]}"; do
+    wait "$pid" || true
 done
 
+# Grand totals
+GRAND_PULLED=0
+GRAND_SKIPPED=0
+GRAND_CONVERTED=0
+
+for agent in "${CP_AGENTS[@]}"; do
+    [[ -f "$WORK_DIR/$agent.log" ]] && cat "$WORK_DIR/$agent.log" >> "$LOG_FILE"
+    [[ -f "$WORK_DIR/$agent.out" ]] && cat "$WORK_DIR/$agent.out"
+
+    if [[ -f "$WORK_DIR/$agent.totals" ]]; then
+        read -r pulled skipped converted < "$WORK_DIR/$agent.totals"
+        GRAND_PULLED=$((GRAND_PULLED + pulled))
+        GRAND_SKIPPED=$((GRAND_SKIPPED + skipped))
+        GRAND_CONVERTED=$((GRAND_CONVERTED + converted))
+    fi
+done
+
+# Bring the search index (distill search) up to date; new and grown
+# sessions are indexed incrementally
+if [[ "$DRY_RUN" != "true" ]]; then
+    INDEX_ROOTS=("$AGENTS_DIR"/*/sessions "$AGENTS_DIR"/*/intake)
+    [[ -d "$ROOT_DIR/reference" ]] && INDEX_ROOTS+=("$ROOT_DIR/reference")
+    log ""
+    if INDEX_OUTPUT=$(python3 -m components.distill.lib.cli index "${INDEX_ROOTS[@]}" \
+            --db "$ROOT_DIR/.distill-index.sqlite" 2>/dev/null); then
+        while IFS= read -r line; do
+            log "$line"
+        done <<< "$INDEX_OUTPUT"
+    else
+        log "WARNING: Search index update failed"
+    fi
+fi
+
 log ""
 log "=== Summary ==="
 
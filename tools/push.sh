@@ -7,8 +7,16 @@
 #   ./tools/push.sh --dry-run           # Show what would be synced
 #   ./tools/push.sh --verbose           # Detailed output
 #   ./tools/push.sh --no-index          # Skip memory reindex
+#   ./tools/push.sh --full              # Ignore push manifests, send everything
+#   ./tools/push.sh --full-index        # Rebuild the memory index from scratch
 #
-# Reads config.yaml for filter configuration, syncs exports/bot/{agent}/ to bot workspaces
+# Reads config.yaml for filter configuration, syncs agents/{agent}/exports/ to bot workspaces
+#
+# Each agent keeps agents/{agent}/.push-manifest (hash + remote path of every
+# file last delivered). Only files whose hash changed are sent, in one rsync
+# for all agents. The added/changed memory files are appended to
+# agents/{agent}/.reindex-pending, and only agents with pending changes are
+# reindexed (incrementally; --full-index forces a full rebuild).
 #
 # IMPORTANT: This script ADDS files to bot memory. It does NOT delete existing files.
 # To sync with deletion, use rsync --delete manually with the full content set.
@@ -22,6 +30,8 @@ source "$(dirname "$0")/lib.sh"
 
 # Parse arguments
 NO_INDEX=false
+FULL=false
+FULL_INDEX=false
 TOOLS_ONLY=false
 UPDATE_ALLOWLIST=false
 SYNC_CONFIG=false
@@ -32,6 +42,14 @@ while [[ $# -gt 0 ]]; do
             NO_INDEX=true
             shift
             ;;
+        --full)
+            FULL=true
+            shift
+            ;;
+        --full-index)
+            FULL_INDEX=true
+            shift
+            ;;
         --tools-only)
             TOOLS_ONLY=true
             shift
@@ -60,7 +78,7 @@ while [[ $# -gt 0 ]]; do
 done
 
 if ! parse_common_args "$@"; then
-    echo "Usage: $0 [--dry-run] [--verbose] [--no-index] [--tools-only] [--update-allowlist] [--sync-config] [--agent=NAME]"
+    echo "Usage: $0 [--dry-run] [--verbose] [--no-index] [--full] [--full-index] [--tools-only] [--update-allowlist] [--sync-config] [--agent=NAME]"
     echo ""
     echo "Push content bundles to bot memory."
     echo ""
@@ -69,6 +87,8 @@ if ! parse_common_args "$@"; then
     echo "  --verbose, -v       Show detailed output"
     echo "  --quiet, -q         Summary output only (default)"
     echo "  --no-index          Skip memory reindex after sync"
+    echo "  --full              Ignore push manifests and send every file"
+    echo "  --full-index        Force a full memory reindex of every content agent"
     echo "  --tools-only        Sync only component tools (skip content)"
     echo "  --update-allowlist  Update exec-approvals with component tool entries"
     echo "  --sync-config       Sync openclaw.json settings from config.yaml"
@@ -102,20 +122,23 @@ sync_component_tools() {
 
     # Ensure shared tools directory exists
     if [[ "$DRY_RUN" != "true" ]]; then
-        ssh "$SSH_HOST" "mkdir -p $SHARED_TOOLS"
+        ssh $SSH_OPTS "$SSH_HOST" "mkdir -p $SHARED_TOOLS"
     fi
 
+    # Every component's tools/ merged into one rsync
+    local tool_dirs=()
     for component_dir in "$ROOT_DIR/components"/*/tools; do
         if [[ -d "$component_dir" ]]; then
-            local component
-            component=$(basename "$(dirname "$component_dir")")
-            log "  Syncing $component tools to $SHARED_TOOLS..."
-            rsync $tool_rsync_opts "$component_dir/" "$SSH_HOST:$SHARED_TOOLS/"
-            if [[ "$DRY_RUN" != "true" ]]; then
-                tools_synced=$((tools_synced + $(find "$component_dir" -type f | wc -l | tr -d ' ')))
-            fi
+            log "  Syncing $(basename "$(dirname "$component_dir")") tools to $SHARED_TOOLS..."
+            tool_dirs+=("$component_dir/")
         fi
     done
+    if [[ ${#tool_dirs[@]} -gt 0 ]]; then
+        rsync -e "ssh $SSH_OPTS" $tool_rsync_opts "${tool_dirs[@]}" "$SSH_HOST:$SHARED_TOOLS/"
+        if [[ "$DRY_RUN" != "true" ]]; then
+            tools_synced=$(find "${tool_dirs[@]}" -type f | wc -l | tr -d ' ')
+        fi
+    fi
     echo "$tools_synced"
 }
 
@@ -169,7 +192,19 @@ fi
 
 TOTAL_SYNCED=0
 
-# Process each agent
+# Staging for the push plan: changed files are symlinked here by remote path
+PUSH_DIR=$(mktemp -d)
+trap 'rm -rf "$PUSH_DIR"' EXIT
+MAPPINGS="$PUSH_DIR/mappings"
+: > "$MAPPINGS"
+
+# Record where a local dir goes on the bot (tab-separated, see push-plan.py)
+# Usage: add_mapping LABEL SOURCE DEST MODE
+add_mapping() {
+    printf '%s\t%s\t%s\t%s\t%s\n' "$agent" "$1" "$2" "$3" "$4" >> "$MAPPINGS"
+}
+
+# Work out what each agent delivers
 for agent in "${AGENTS[@]}"; do
     load_agent_config "$agent"
 
@@ -186,91 +221,97 @@ for agent in "${AGENTS[@]}"; do
     fi
 
     log ""
-    log "=== Syncing $agent ==="
-    echo "Agent: $agent"
+    log "=== Planning $agent ==="
 
-    # 1. Sync core-prompts to workspace root (AGENTS.md, TOOLS.md, HEARTBEAT.md)
+    # 1. core-prompts to workspace root (AGENTS.md, TOOLS.md, HEARTBEAT.md)
     if [[ -d "$AGENT_EXPORT_DIR/core-prompts" ]]; then
-        CORE_COUNT=$(find "$AGENT_EXPORT_DIR/core-prompts" -type f -name "*.md" 2>/dev/null | wc -l | tr -d ' ')
-        if [[ "$CORE_COUNT" -gt 0 ]]; then
-            log "Syncing core-prompts/ to $SSH_HOST:$AGENT_WORKSPACE/ ($CORE_COUNT files)"
-            if [[ "$DRY_RUN" == "true" ]]; then
-                log "[DRY RUN] Would sync $CORE_COUNT core prompt files"
-                rsync $RSYNC_OPTS "$AGENT_EXPORT_DIR/core-prompts/" "$SSH_HOST:$AGENT_WORKSPACE/"
-            else
-                rsync $RSYNC_OPTS "$AGENT_EXPORT_DIR/core-prompts/" "$SSH_HOST:$AGENT_WORKSPACE/"
-                log "  Synced $CORE_COUNT core prompt files"
-                echo "  core-prompts: $CORE_COUNT files"
-            fi
-            TOTAL_SYNCED=$((TOTAL_SYNCED + CORE_COUNT))
-        fi
+        log "core-prompts/ -> $SSH_HOST:$AGENT_WORKSPACE/"
+        add_mapping core-prompts "$AGENT_EXPORT_DIR/core-prompts" "$AGENT_WORKSPACE" tree
     fi
 
-    # 2. Sync content directories for agents with content_pipeline: true
+    # 2. Content directories for agents with content_pipeline: true
     if [[ "$AGENT_CONTENT_PIPELINE" == "true" ]]; then
         # Generate inventory files
         if [[ -f "$ROOT_DIR/tools/generate-inventory.sh" ]]; then
             log "Generating inventories..."
-            "$ROOT_DIR/tools/generate-inventory.sh" | while read -r line; do log "$line"; done
+            "$ROOT_DIR/tools/generate-inventory.sh" "$agent" | while read -r line; do log "$line"; done
         fi
 
         # Use agent's remote_path (defaults to 'memory')
         remote_path="${AGENT_REMOTE_PATH:-memory}"
 
-        # Sync content subdirectories to memory/ preserving structure
+        # Content subdirectories go to memory/ preserving structure
         # transcripts → memory/transcripts/, docs/cc_logs/summaries → memory/docs/
         for subdir in prompts transcripts refdocs docs artifacts cc_logs summaries; do
             if [[ -d "$AGENT_EXPORT_DIR/$subdir" ]]; then
-                SUBDIR_COUNT=$(find "$AGENT_EXPORT_DIR/$subdir" -type f -name "*.md" 2>/dev/null | wc -l | tr -d ' ')
-                if [[ "$SUBDIR_COUNT" -gt 0 ]]; then
-                    # Determine target directory based on content type
-                    case "$subdir" in
-                        transcripts)
-                            TARGET_DIR="$remote_path/transcripts"
-                            ;;
-                        docs|cc_logs|summaries|refdocs|artifacts)
-                            TARGET_DIR="$remote_path/docs"
-                            ;;
-                        prompts)
-                            TARGET_DIR="$remote_path/docs"
-                            ;;
-                        *)
-                            TARGET_DIR="$remote_path/docs"
-                            ;;
-                    esac
-
-                    log "Syncing $subdir/ to $SSH_HOST:$AGENT_WORKSPACE/$TARGET_DIR/ ($SUBDIR_COUNT files)"
-                    if [[ "$DRY_RUN" == "true" ]]; then
-                        log "[DRY RUN] Would sync $SUBDIR_COUNT $subdir files"
-                        rsync $RSYNC_OPTS "$AGENT_EXPORT_DIR/$subdir/" "$SSH_HOST:$AGENT_WORKSPACE/$TARGET_DIR/"
-                    else
-                        # Ensure target directory exists
-                        ssh "$SSH_HOST" "mkdir -p $AGENT_WORKSPACE/$TARGET_DIR"
-                        rsync $RSYNC_OPTS "$AGENT_EXPORT_DIR/$subdir/" "$SSH_HOST:$AGENT_WORKSPACE/$TARGET_DIR/"
-                        log "  Synced $SUBDIR_COUNT $subdir files"
-                        echo "  $subdir: $SUBDIR_COUNT files"
-                    fi
-                    TOTAL_SYNCED=$((TOTAL_SYNCED + SUBDIR_COUNT))
-                fi
+                # Determine target directory based on content type
+                case "$subdir" in
+                    transcripts)
+                        TARGET_DIR="$remote_path/transcripts"
+                        ;;
+                    docs|cc_logs|summaries|refdocs|artifacts)
+                        TARGET_DIR="$remote_path/docs"
+                        ;;
+                    prompts)
+                        TARGET_DIR="$remote_path/docs"
+                        ;;
+                    *)
+                        TARGET_DIR="$remote_path/docs"
+                        ;;
+                esac
+
+                log "$subdir/ -> $SSH_HOST:$AGENT_WORKSPACE/$TARGET_DIR/"
+                add_mapping "$subdir" "$AGENT_EXPORT_DIR/$subdir" "$AGENT_WORKSPACE/$TARGET_DIR" tree
             fi
         done
 
-        # Sync root-level inventory files
-        ROOT_FILES=$(find "$AGENT_EXPORT_DIR" -maxdepth 1 -type f -name "*.md" 2>/dev/null | wc -l | tr -d ' ')
-        if [[ "$ROOT_FILES" -gt 0 ]]; then
-            log "Syncing root-level files to $SSH_HOST:$AGENT_WORKSPACE/$remote_path/ ($ROOT_FILES files)"
-            if [[ "$DRY_RUN" == "true" ]]; then
-                log "[DRY RUN] Would sync $ROOT_FILES root files"
-                rsync $RSYNC_OPTS --include='*.md' --exclude='*/' "$AGENT_EXPORT_DIR/" "$SSH_HOST:$AGENT_WORKSPACE/$remote_path/"
-            else
-                rsync $RSYNC_OPTS --include='*.md' --exclude='*/' "$AGENT_EXPORT_DIR/" "$SSH_HOST:$AGENT_WORKSPACE/$remote_path/"
-                log "  Synced $ROOT_FILES root files"
-            fi
-            TOTAL_SYNCED=$((TOTAL_SYNCED + ROOT_FILES))
-        fi
+        # Root-level inventory files
+        log "root *.md -> $SSH_HOST:$AGENT_WORKSPACE/$remote_path/"
+        add_mapping root "$AGENT_EXPORT_DIR" "$AGENT_WORKSPACE/$remote_path" top
     fi
 done
 
+# Compare against each agent's push manifest and stage what changed
+PLAN_ARGS=(--staging "$PUSH_DIR/stage" --agents-dir "$AGENTS_DIR" --changes-dir "$PUSH_DIR/changes")
+[[ "$FULL" == "true" ]] && PLAN_ARGS+=(--full)
+[[ "$DRY_RUN" == "true" ]] && PLAN_ARGS+=(--dry-run)
+[[ "$VERBOSE" == "true" ]] && PLAN_ARGS+=(--verbose)
+
+PLAN_OUTPUT=$(python3 "$ROOT_DIR/tools/helpers/push-plan.py" "${PLAN_ARGS[@]}" < "$MAPPINGS")
+echo "$PLAN_OUTPUT"
+while IFS= read -r line; do
+    echo "[$(date '+%Y-%m-%d %H:%M:%S')] $line" >> "$LOG_FILE"
+done <<< "$PLAN_OUTPUT"
+
+TOTAL_SYNCED=$(wc -l < "$PUSH_DIR/stage.files" | tr -d ' ')
+
+# Send every agent's changes in one rsync to the host. --files-from
+# creates missing remote dirs (--no-implied-dirs leaves existing ones'
+# attributes alone), --copy-links sends the staged files' content
+if [[ "$TOTAL_SYNCED" -gt 0 ]]; then
+    log "Sending $TOTAL_SYNCED changed files to $SSH_HOST"
+    if ! rsync -e "ssh $SSH_OPTS" $RSYNC_OPTS --copy-links --no-implied-dirs --files-from="$PUSH_DIR/stage.files" \
+            "$PUSH_DIR/stage/" "$SSH_HOST:/"; then
+        log "ERROR: Transfer to $SSH_HOST failed (push manifests unchanged)"
+        while IFS= read -r manifest; do
+            rm -f "$manifest.new"
+        done < "$PUSH_DIR/stage.manifests"
+        exit 1
+    fi
+else
+    log "No changed files to send"
+fi
+
+# Record what was delivered, and queue each agent's memory changes for reindex
+if [[ "$DRY_RUN" != "true" ]]; then
+    while IFS= read -r manifest; do
+        mv "$manifest.new" "$manifest"
+    done < "$PUSH_DIR/stage.manifests"
+    for changes in "$PUSH_DIR/changes"/*; do
+        [[ -f "$changes" ]] && cat "$changes" >> "$AGENTS_DIR/$(basename "$changes")/.reindex-pending"
+    done
+fi
+
 # 3. Sync repo code if enabled (to main agent only)
 if [[ "$CLONE_REPO_CODE" == "true" ]]; then
     log "Syncing repo code to $SSH_HOST:$REMOTE_WORKSPACE/workspace/repo/"
@@ -342,38 +383,26 @@ if [[ "$UPDATE_ALLOWLIST" == "true" ]]; then
 fi
 
 # Trigger reindex for content_pipeline agents if not dry run
-# Use conditional reindex to skip if no content changed
+# Only agents with queued changes in .reindex-pending (kept until a reindex
+# succeeds, so --no-index or a failure is caught up later), or every agent
+# with --full-index
 if [[ "$DRY_RUN" != "true" && "$NO_INDEX" != "true" ]]; then
-    HASH_FILE="$ROOT_DIR/.last-sync-hash"
-    CURRENT_HASH=""
-
-    # Compute hash of exported content (across all agent export dirs)
-    if [[ -d "$AGENTS_DIR" ]]; then
-        CURRENT_HASH=$(find "$AGENTS_DIR" -path "*/exports/*" -type f -exec md5 -q {} \; 2>/dev/null | sort | md5 -q 2>/dev/null || echo "")
-    fi
-
-    PREV_HASH=""
-    if [[ -f "$HASH_FILE" ]]; then
-        PREV_HASH=$(cat "$HASH_FILE" 2>/dev/null)
-    fi
-
-    if [[ -n "$CURRENT_HASH" && "$CURRENT_HASH" != "$PREV_HASH" ]]; then
-        log "Triggering memory reindex (content changed)..."
-        # Reindex all content_pipeline agents
-        CP_AGENTS=()
-        while IFS= read -r cp_agent; do
-            [[ -n "$cp_agent" ]] && CP_AGENTS+=("$cp_agent")
-        done < <(get_content_pipeline_agents)
-
-        for cp_agent in "${CP_AGENTS[@]}"; do
-            if bot_cmd "openclaw memory index --agent $cp_agent" 2>/dev/null; then
-                log "  $cp_agent: memory indexed"
-            else
-                log "  $cp_agent: Warning: Memory index failed (may need manual reindex)"
-            fi
-        done
-        echo "$CURRENT_HASH" > "$HASH_FILE"
-    else
+    CP_AGENTS=()
+    while IFS= read -r cp_agent; do
+        [[ -n "$cp_agent" ]] && CP_AGENTS+=("$cp_agent")
+    done < <(get_content_pipeline_agents)
+
+    REINDEXED=0
+    for cp_agent in "${CP_AGENTS[@]}"; do
+        index_result=$(reindex_memory "$cp_agent" "$FULL_INDEX") || true
+        [[ -n "$index_result" ]] || continue
+        if [[ $REINDEXED -eq 0 ]]; then
+            log "Triggering memory reindex (content changed)..."
+        fi
+        REINDEXED=$((REINDEXED + 1))
+        log "$index_result"
+    done
+    if [[ $REINDEXED -eq 0 ]]; then
         log "Skipping reindex (no content changes)"
     fi
 fi
@@ -4,7 +4,14 @@
 # This script:
 # 1. Snapshots each agent's workspace/ into memory/workspace-snapshot/ (so working files become searchable)
 # 2. Syncs bruba-godo repo to all agents' memory/repos/
-# 3. Reindexes memory for all agents
+# 3. Reindexes memory for agents whose memory changed
+#
+# Both syncs itemize their changes (rsync -i); added/changed/deleted files
+# are appended to agents/{agent}/.reindex-pending, the same queue push.sh
+# uses, and an agent is only reindexed if something is queued.
+#
+# Usage: ./tools/sync-memory.sh [--full-index]
+#   --full-index   Force a full reindex of every agent (rebuilds all files)
 #
 # Run this as part of the push workflow or standalone.
 
@@ -17,6 +24,11 @@ source "$SCRIPT_DIR/lib.sh"
 # Load config for SSH settings
 load_config 2>/dev/null || true
 
+FULL_INDEX=false
+if [[ "$1" == "--full-index" ]]; then
+  FULL_INDEX=true
+fi
+
 AGENTS="bruba-main bruba-guru bruba-manager"
 BOT_BASE="/Users/bruba/agents"
 SSH_HOST="${SSH_HOST:-bruba}"
@@ -26,6 +38,20 @@ echo "=== Sync Memory ==="
 echo "Agents: $AGENTS"
 echo ""
 
+# Memory changes per agent, queued for Phase 3
+pending_file() {
+  echo "${AGENTS_DIR:-$SCRIPT_DIR/../agents}/$1/.reindex-pending"
+}
+
+# Usage: ... | queue_changes "agent" "/remote/dest/"
+queue_changes() {
+  local changes
+  changes=$(itemized_changes "$2")
+  [[ -n "$changes" ]] || return 0
+  mkdir -p "$(dirname "$(pending_file "$1")")"
+  echo "$changes" >> "$(pending_file "$1")"
+}
+
 # Phase 1: Snapshot workspace into memory/workspace-snapshot for each agent
 for agent in $AGENTS; do
   AGENT_DIR="$BOT_BASE/$agent"
@@ -33,11 +59,13 @@ for agent in $AGENTS; do
   # Check if this agent has a workspace-snapshot directory
   if ssh $SSH_OPTS "$SSH_HOST" "test -d $AGENT_DIR/memory/workspace-snapshot"; then
     echo "[$agent] Snapshotting workspace..."
-    ssh $SSH_OPTS "$SSH_HOST" "rsync -av --delete \
+    SNAPSHOT_OUTPUT=$(ssh $SSH_OPTS "$SSH_HOST" "rsync -av --delete -i \
       --exclude='.DS_Store' \
       --exclude='*.tmp' \
       $AGENT_DIR/workspace/ \
-      $AGENT_DIR/memory/workspace-snapshot/" | sed 's/^/  /'
+      $AGENT_DIR/memory/workspace-snapshot/") || echo "  Warning: Snapshot failed"
+    echo "$SNAPSHOT_OUTPUT" | sed 's/^/  /'
+    echo "$SNAPSHOT_OUTPUT" | queue_changes "$agent" "$AGENT_DIR/memory/workspace-snapshot/"
   else
     echo "[$agent] No workspace-snapshot directory, skipping"
   fi
@@ -49,13 +77,15 @@ echo ""
 echo "=== Syncing bruba-godo repo (parallel) ==="
 REPO_DIR="$(cd "$SCRIPT_DIR/.." && pwd)"
 
-# Launch rsync jobs in parallel
+# Launch rsync jobs in parallel (each itemizes into its own file)
+REPO_CHANGES="$(mktemp -d)"
+trap 'rm -rf "$REPO_CHANGES"' EXIT
 pids=()
 for agent in $AGENTS; do
   AGENT_DIR="$BOT_BASE/$agent"
   echo "[$agent] Starting repo sync..."
   (
-    rsync -av --delete \
+    rsync -av --delete -i \
       --exclude='.git' \
       --exclude='node_modules' \
       --exclude='sessions/' \
@@ -66,7 +96,7 @@ for agent in $AGENTS; do
       --exclude='reference/' \
       --exclude='.claude/' \
       "$REPO_DIR/" \
-      "$SSH_HOST:$AGENT_DIR/memory/repos/bruba-godo/" >/dev/null 2>&1
+      "$SSH_HOST:$AGENT_DIR/memory/repos/bruba-godo/" > "$REPO_CHANGES/$agent" 2>/dev/null
     echo "[$agent] Repo sync complete"
   ) &
   pids+=($!)
@@ -78,11 +108,22 @@ for pid in "${pids[@]}"; do
 done
 echo "All repo syncs complete"
 
+for agent in $AGENTS; do
+  [[ -f "$REPO_CHANGES/$agent" ]] || continue
+  queue_changes "$agent" "$BOT_BASE/$agent/memory/repos/bruba-godo/" < "$REPO_CHANGES/$agent"
+done
+
 echo ""
 
-# Phase 3: Reindex memory
+# Phase 3: Reindex memory ('openclaw memory index --agent NAME', per agent)
 echo "=== Reindexing memory ==="
-ssh $SSH_OPTS "$SSH_HOST" 'openclaw memory index --verbose' | sed 's/^/  /'
+for agent in $AGENTS; do
+  if [[ "$FULL_INDEX" != "true" && ! -s "$(pending_file "$agent")" ]]; then
+    echo "  $agent: no memory changes, skipping"
+    continue
+  fi
+  reindex_memory "$agent" "$FULL_INDEX" || true
+done
 
 echo ""
 echo "=== Done ==="
@@ -173,8 +173,17 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "defaults" ]]; then
     log "Checking global defaults..."
     echo "Checking global defaults..."
 
+    # All global settings from one config read
+    DESIRED_MODEL="" DESIRED_COMPACTION="" DESIRED_CTX="" DESIRED_MEM="" DESIRED_SANDBOX="" DESIRED_MC=""
+    eval "$(get_config_values \
+        DESIRED_MODEL=json:openclaw.model \
+        DESIRED_COMPACTION=json:openclaw.compaction \
+        DESIRED_CTX=json:openclaw.context_pruning \
+        DESIRED_MEM=json:openclaw.memory_search \
+        DESIRED_SANDBOX=json:openclaw.sandbox \
+        DESIRED_MC=openclaw.max_concurrent)"
+
     # Model defaults
-    DESIRED_MODEL=$(get_openclaw_config model)
     if [[ -n "$DESIRED_MODEL" && "$DESIRED_MODEL" != "null" ]]; then
         CURRENT_MODEL=$(echo "$CURRENT_CONFIG" | jq -c '.agents.defaults.model // null')
         if ! json_equal "$CURRENT_MODEL" "$DESIRED_MODEL"; then
@@ -188,7 +197,6 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "defaults" ]]; then
     fi
 
     # Compaction
-    DESIRED_COMPACTION=$(get_openclaw_config compaction)
     if [[ -n "$DESIRED_COMPACTION" && "$DESIRED_COMPACTION" != "null" ]]; then
         CURRENT_COMPACTION=$(echo "$CURRENT_CONFIG" | jq -c '.agents.defaults.compaction // null')
         if ! json_equal "$CURRENT_COMPACTION" "$DESIRED_COMPACTION"; then
@@ -202,7 +210,6 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "defaults" ]]; then
     fi
 
     # Context pruning
-    DESIRED_CTX=$(get_openclaw_config context_pruning)
     if [[ -n "$DESIRED_CTX" && "$DESIRED_CTX" != "null" ]]; then
         CURRENT_CTX=$(echo "$CURRENT_CONFIG" | jq -c '.agents.defaults.contextPruning // null')
         if ! json_equal "$CURRENT_CTX" "$DESIRED_CTX"; then
@@ -216,7 +223,6 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "defaults" ]]; then
     fi
 
     # Memory search
-    DESIRED_MEM=$(get_openclaw_config memory_search)
     if [[ -n "$DESIRED_MEM" && "$DESIRED_MEM" != "null" ]]; then
         CURRENT_MEM=$(echo "$CURRENT_CONFIG" | jq -c '.agents.defaults.memorySearch // null')
         if ! json_equal "$CURRENT_MEM" "$DESIRED_MEM"; then
@@ -230,7 +236,6 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "defaults" ]]; then
     fi
 
     # Sandbox
-    DESIRED_SANDBOX=$(get_openclaw_config sandbox)
     if [[ -n "$DESIRED_SANDBOX" && "$DESIRED_SANDBOX" != "null" ]]; then
         CURRENT_SANDBOX=$(echo "$CURRENT_CONFIG" | jq -c '.agents.defaults.sandbox // null')
         if ! json_equal "$CURRENT_SANDBOX" "$DESIRED_SANDBOX"; then
@@ -244,7 +249,6 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "defaults" ]]; then
     fi
 
     # Max concurrent
-    DESIRED_MC=$("$ROOT_DIR/tools/helpers/parse-yaml.py" "$ROOT_DIR/config.yaml" "openclaw.max_concurrent" 2>/dev/null || echo "")
     if [[ -n "$DESIRED_MC" && "$DESIRED_MC" != "null" ]]; then
         CURRENT_MC=$(echo "$CURRENT_CONFIG" | jq -r '.agents.defaults.maxConcurrent // null')
         if [[ "$CURRENT_MC" != "$DESIRED_MC" ]]; then
@@ -334,8 +338,16 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "agents" ]]; then
             continue
         fi
 
+        # All of this agent's settings from one config read
+        DESIRED_MODEL="" DESIRED_HB_RAW="" DESIRED_HB="" DESIRED_ALLOW="" DESIRED_DENY=""
+        eval "$(get_config_values \
+            DESIRED_MODEL="agents.$agent.model" \
+            DESIRED_HB_RAW="agents.$agent.heartbeat" \
+            DESIRED_HB="json:agents.$agent.heartbeat" \
+            DESIRED_ALLOW="agents.$agent.tools_allow" \
+            DESIRED_DENY="agents.$agent.tools_deny")"
+
         # Model
-        DESIRED_MODEL=$(get_agent_model "$agent")
         if [[ -n "$DESIRED_MODEL" && "$DESIRED_MODEL" != "null" ]]; then
             CURRENT_MODEL=$(echo "$CURRENT_CONFIG" | jq -r ".agents.list[$AGENT_INDEX].model // null")
             # For string models, compare directly; for objects, use json_equal
@@ -369,8 +381,7 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "agents" ]]; then
         fi
 
         # Heartbeat
-        # Get raw heartbeat value (might be false, object, or missing)
-        DESIRED_HB_RAW=$("$ROOT_DIR/tools/helpers/parse-yaml.py" "$ROOT_DIR/config.yaml" "agents.$agent.heartbeat" 2>/dev/null || echo "")
+        # Raw heartbeat value (might be false, object, or missing)
         if [[ -n "$DESIRED_HB_RAW" ]]; then
             CURRENT_HB=$(echo "$CURRENT_CONFIG" | jq -c ".agents.list[$AGENT_INDEX].heartbeat // null")
             # Python yaml returns "False" for false
@@ -388,7 +399,6 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "agents" ]]; then
                 fi
             else
                 # It's an object - use full comparison
-                DESIRED_HB=$(get_agent_heartbeat "$agent")
                 if [[ -n "$DESIRED_HB" && "$DESIRED_HB" != "null" ]]; then
                     if ! json_equal "$CURRENT_HB" "$DESIRED_HB"; then
                         show_diff "agents.$agent.heartbeat" "$CURRENT_HB" "$DESIRED_HB"
@@ -403,7 +413,6 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "agents" ]]; then
         fi
 
         # Tools allow
-        DESIRED_ALLOW=$(get_agent_tools_allow "$agent")
         if [[ -n "$DESIRED_ALLOW" && "$DESIRED_ALLOW" != "null" && "$DESIRED_ALLOW" != "[]" ]]; then
             CURRENT_ALLOW=$(echo "$CURRENT_CONFIG" | jq -c ".agents.list[$AGENT_INDEX].tools.allow // []")
             if ! json_equal "$CURRENT_ALLOW" "$DESIRED_ALLOW"; then
@@ -417,7 +426,6 @@ if [[ -z "$SECTION_FILTER" || "$SECTION_FILTER" == "agents" ]]; then
         fi
 
         # Tools deny
-        DESIRED_DENY=$(get_agent_tools_deny "$agent")
         if [[ -n "$DESIRED_DENY" && "$DESIRED_DENY" != "null" && "$DESIRED_DENY" != "[]" ]]; then
             CURRENT_DENY=$(echo "$CURRENT_CONFIG" | jq -c ".agents.list[$AGENT_INDEX].tools.deny // []")
             if ! json_equal "$CURRENT_DENY" "$DESIRED_DENY"; then